@@ -2,7 +2,9 @@ from rest_framework import serializers
 from django.contrib.auth.models import User
 from rest_framework.authtoken.models import Token
 
-class RegistrationSerializer(serializers.ModelSerializer):
+from kanban_app.metrics import TimedSerializerMixin
+
+class RegistrationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     fullname = serializers.CharField(write_only=True)
     password = serializers.CharField(write_only=True)
     repeated_password = serializers.CharField(write_only=True)
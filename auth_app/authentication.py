@@ -0,0 +1,161 @@
+import copy
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+
+from kanban_app.cache import CacheStats
+
+
+class TokenCache:
+    """
+    Bounded in-process LRU of token key -> (user, token) with a TTL.
+
+    Entries are dropped when their token is deleted or their user changes
+    (see auth_app.signals). Those signals only reach the current process,
+    so AUTH_TOKEN_CACHE_TTL bounds how long another process may still
+    accept a deleted token.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_user = defaultdict(set)
+        self._generation = 0
+        self.stats = CacheStats()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, user, token = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return user, token
+
+    def set(self, key, user, token, generation):
+        ttl = getattr(settings, "AUTH_TOKEN_CACHE_TTL", 60)
+        max_size = getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 10000)
+        if ttl <= 0 or max_size <= 0:
+            return
+        with self._lock:
+            # Skip results loaded before an invalidation that ran meanwhile.
+            if generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, user, token)
+            self._keys_by_user[user.pk].add(key)
+            while len(self._entries) > max_size:
+                self._remove(next(iter(self._entries)))
+
+    def evict_key(self, key):
+        with self._lock:
+            self._generation += 1
+            self._remove(key)
+
+    def evict_user(self, user_id):
+        with self._lock:
+            self._generation += 1
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[1].pk
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that remembers resolved tokens in token_cache, so
+    repeated requests with the same token skip the token/user join.
+    Failures are never cached and raise exactly what the stock class
+    raises. Each request gets its own copies of the cached user and token.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        generation = token_cache.generation
+        user, token = super().authenticate_credentials(key)
+        self._remember(key, user, token, generation)
+        return (user, token)
+
+    async def aauthenticate(self, request):
+        """
+        authenticate() for async views outside DRF: same header format,
+        cache and errors, with the token loaded through the async ORM.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) == 1:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. No credentials provided.'))
+        elif len(auth) > 2:
+            raise exceptions.AuthenticationFailed(_('Invalid token header. Token string should not contain spaces.'))
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(
+                _('Invalid token header. Token string should not contain invalid characters.')
+            )
+
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        generation = token_cache.generation
+        try:
+            token = await self.get_model().objects.select_related('user').aget(key=key)
+        except self.get_model().DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        self._remember(key, token.user, token, generation)
+        return (token.user, token)
+
+    def _cached(self, key):
+        cached = token_cache.get(key)
+        if cached is None or not cached[0].is_active:
+            token_cache.stats.record(hit=False)
+            return None
+        token_cache.stats.record(hit=True)
+        user, token = copy.copy(cached[0]), copy.copy(cached[1])
+        token.user = user
+        return (user, token)
+
+    def _remember(self, key, user, token, generation):
+        cached_user, cached_token = copy.copy(user), copy.copy(token)
+        cached_token.user = cached_user
+        token_cache.set(key, cached_user, cached_token, generation)
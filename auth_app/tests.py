@@ -1,3 +1,100 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, override_settings
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+
+from auth_app.authentication import CachedTokenAuthentication, token_cache
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    url = "/api/email-check/?email=nobody@example.com"
+
+    def setUp(self):
+        token_cache.clear()
+        token_cache.stats.reset()
+        self.user = User.objects.create_user(username="user", email="user@example.com", password="pass1234")
+        self.token = Token.objects.create(user=self.user)
+
+    def _get(self, key=None):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {key or self.token.key}")
+        return self.client.get(self.url)
+
+    def test_second_request_skips_the_token_lookup(self):
+        # The view itself runs one query (the email lookup).
+        with self.assertNumQueries(2):
+            self.assertEqual(self._get().status_code, 200)
+        with self.assertNumQueries(1):
+            response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(token_cache.stats.snapshot(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_invalid_tokens_fail_like_the_stock_class_and_are_not_cached(self):
+        for _ in range(2):
+            response = self._get("0" * 40)
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(str(response.data["detail"]), "Invalid token.")
+        self.assertEqual(len(token_cache), 0)
+
+    def test_async_header_errors_match_the_stock_class(self):
+        for header in ("Token", f"Token {self.token.key} extra"):
+            request = RequestFactory().get(self.url, HTTP_AUTHORIZATION=header)
+            with self.assertRaises(AuthenticationFailed) as stock:
+                TokenAuthentication().authenticate(request)
+            with self.subTest(header=header), self.assertRaises(AuthenticationFailed) as cached:
+                async_to_sync(CachedTokenAuthentication().aauthenticate)(request)
+            self.assertEqual(str(cached.exception.detail), str(stock.exception.detail))
+
+    def test_deleted_token_is_rejected(self):
+        self._get()
+        key = self.token.key
+
+        self.token.delete()
+
+        self.assertEqual(self._get(key).status_code, 401)
+
+    def test_deactivated_user_is_rejected(self):
+        self._get()
+
+        self.user.is_active = False
+        self.user.save()
+
+        response = self._get()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(str(response.data["detail"]), "User inactive or deleted.")
+
+    def test_requests_get_their_own_user_copy(self):
+        authentication = CachedTokenAuthentication()
+        first, _ = authentication.authenticate_credentials(self.token.key)
+        second, token = authentication.authenticate_credentials(self.token.key)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(second, token_cache.get(self.token.key)[0])
+        self.assertIs(token.user, second)
+        self.assertEqual(second.pk, self.user.pk)
+
+    @override_settings(AUTH_TOKEN_CACHE_SIZE=2)
+    def test_cache_is_bounded(self):
+        for i in range(3):
+            user = User.objects.create_user(username=f"user{i}", password="pass1234")
+            self._get(Token.objects.create(user=user).key)
+
+        self.assertEqual(len(token_cache), 2)
+
+    @override_settings(AUTH_TOKEN_CACHE_TTL=30)
+    def test_entries_expire(self):
+        with mock.patch("auth_app.authentication.time.monotonic", return_value=1000.0):
+            self._get()
+        with mock.patch("auth_app.authentication.time.monotonic", return_value=1031.0):
+            with self.assertNumQueries(2):
+                self._get()
+
+    @override_settings(AUTH_TOKEN_CACHE_TTL=0)
+    def test_ttl_zero_disables_the_cache(self):
+        self._get()
+        self.assertEqual(len(token_cache), 0)
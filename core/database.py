@@ -0,0 +1,96 @@
+"""
+Database settings read from the environment.
+
+DB_ENGINE selects "sqlite" (default) or "postgresql". PostgreSQL keeps
+connections open for DB_CONN_MAX_AGE seconds, or, with DB_POOL_MAX_SIZE
+set, uses Django's psycopg connection pool instead (the two exclude each
+other). SQLite connections run the PRAGMAs from sqlite_pragmas() as
+their init_command.
+"""
+import re
+
+from django.core.exceptions import ImproperlyConfigured
+
+_PRAGMA_TOKEN = re.compile(r"^\w+$")
+
+
+def _int(environ, name, default):
+    value = environ.get(name, "")
+    if value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ImproperlyConfigured(f"{name} must be an integer, got {value!r}.")
+
+
+def database_config(environ, base_dir):
+    engine = environ.get("DB_ENGINE", "sqlite").lower()
+    if engine in ("postgres", "postgresql"):
+        return _postgresql_config(environ)
+    if engine in ("sqlite", "sqlite3"):
+        return _sqlite_config(environ, base_dir)
+    raise ImproperlyConfigured(f"Unsupported DB_ENGINE {engine!r}; use sqlite or postgresql.")
+
+
+def _postgresql_config(environ):
+    config = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": environ.get("DB_NAME", "kanban"),
+        "USER": environ.get("DB_USER", ""),
+        "PASSWORD": environ.get("DB_PASSWORD", ""),
+        "HOST": environ.get("DB_HOST", "localhost"),
+        "PORT": environ.get("DB_PORT", "5432"),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
+    }
+    pool_size = _int(environ, "DB_POOL_MAX_SIZE", 0)
+    if pool_size:
+        # The pool hands connections back after each request, which Django
+        # only allows with CONN_MAX_AGE = 0.
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": min(_int(environ, "DB_POOL_MIN_SIZE", 2), pool_size),
+            "max_size": pool_size,
+            "timeout": _int(environ, "DB_POOL_TIMEOUT", 10),
+        }
+    else:
+        config["CONN_MAX_AGE"] = _int(environ, "DB_CONN_MAX_AGE", 60)
+    return config
+
+
+def _sqlite_config(environ, base_dir):
+    config = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": environ.get("DB_NAME") or base_dir / "db.sqlite3",
+        "CONN_MAX_AGE": _int(environ, "DB_CONN_MAX_AGE", 60),
+        # Write transactions take the lock when they start, so two of them
+        # can no longer deadlock upgrading from a read lock; the busy
+        # timeout then makes the second one wait instead of failing.
+        "OPTIONS": {
+            "transaction_mode": "IMMEDIATE",
+            "init_command": sqlite_init_command(sqlite_pragmas(environ)),
+        },
+        # A file, not the default in-memory database, so tests see the same
+        # locking (and WAL) behaviour as a deployment.
+        "TEST": {"NAME": environ.get("DB_TEST_NAME") or base_dir / "test_db.sqlite3"},
+    }
+    return config
+
+
+def sqlite_pragmas(environ):
+    return {
+        "journal_mode": environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": _int(environ, "SQLITE_BUSY_TIMEOUT", 5000),
+    }
+
+
+def sqlite_init_command(pragmas):
+    """The PRAGMA statements run on every new SQLite connection."""
+    statements = []
+    for name, value in pragmas.items():
+        if not (_PRAGMA_TOKEN.match(name) and _PRAGMA_TOKEN.match(str(value))):
+            raise ImproperlyConfigured(f"Invalid SQLite pragma {name}={value!r}.")
+        statements.append(f"PRAGMA {name} = {value}")
+    return "; ".join(statements)
@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from core.database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -46,14 +49,28 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'kanban_app.api.pagination.OptInCursorPagination',
+    # orjson when installed (falls back to the stdlib); the browsable API
+    # only while DEBUG is on.
+    'DEFAULT_RENDERER_CLASSES': [
+        'kanban_app.api.renderers.FastJSONRenderer',
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'kanban_app.api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 MIDDLEWARE = [
+    'kanban_app.middleware.RequestMetricsMiddleware',
+    'kanban_app.middleware.NPlusOneMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -86,14 +103,64 @@ WSGI_APPLICATION = 'core.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# Configured through DB_* environment variables, see core/database.py.
 
 DATABASES = {
+    'default': database_config(os.environ, BASE_DIR),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'kanban',
     }
 }
 
+# Board responses are cached under per-board version counters that are
+# bumped on every write. A timeout of 0 disables the response cache.
+KANBAN_CACHE_ALIAS = 'default'
+KANBAN_RESPONSE_CACHE_TIMEOUT = 300
+# Seconds board membership answers are shared across requests. Keep at 0
+# unless the cache backend is shared by all processes.
+KANBAN_ACCESS_CACHE_TIMEOUT = 0
+# Seconds a user's /api/dashboard/ data is reused; 0 computes it every time.
+KANBAN_DASHBOARD_CACHE_TIMEOUT = 0
+# Newest matching tasks and comments /api/search/ ranks per query.
+KANBAN_SEARCH_CANDIDATES = 1000
+
+
+# Resolved API tokens are kept in an in-process LRU. Deleting a token or
+# saving its user evicts it in this process; other processes notice within
+# the TTL (seconds). A TTL or size of 0 turns the cache off.
+AUTH_TOKEN_CACHE_TTL = 60
+AUTH_TOKEN_CACHE_SIZE = 10000
+
+
+# Per-request timings go into in-process histograms served at /api/_metrics/
+# and into a Server-Timing header. The metrics endpoint is for staff users
+# only; with KANBAN_METRICS_TOKEN set it needs `Authorization: Bearer <token>`.
+KANBAN_METRICS_ENABLED = True
+KANBAN_SERVER_TIMING = True
+KANBAN_METRICS_TOKEN = ''
+
+# Requests that repeat one SQL statement more than THRESHOLD times are
+# reported as N+1 queries. Mode is 'off', 'log' or 'raise'; None logs
+# while DEBUG is on and costs nothing otherwise.
+KANBAN_NPLUSONE_MODE = None
+KANBAN_NPLUSONE_THRESHOLD = 5
+
+# Board change events for /api/boards/<id>/events/. The in-memory backend
+# only reaches clients of the same process; with several workers use
+# 'kanban_app.events.CacheEventBackend' with a shared cache. BUFFER_SIZE
+# events per board are kept for Last-Event-ID resumes.
+KANBAN_EVENTS_BACKEND = 'kanban_app.events.InMemoryEventBackend'
+KANBAN_EVENTS_BUFFER_SIZE = 500
+KANBAN_EVENTS_KEEPALIVE = 15
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import Board, Column, Task
+from .models import ArchivedTask, Board, Column, Task
 
 admin.site.register(Board)
 admin.site.register(Column)
-admin.site.register(Task)
\ No newline at end of file
+admin.site.register(Task)
+admin.site.register(ArchivedTask)
@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from rest_framework.exceptions import PermissionDenied
+
+from kanban_app.cache import board_version, get_cache
+from kanban_app.models import Board
+
+ACCESS_KEY = "kanban:access:{}:{}:{}"
+
+
+def visible_boards(user):
+    """
+    Boards owned by the user or shared with them. Membership is matched
+    through a subquery instead of a join, so no DISTINCT is needed and
+    annotations on the result are not multiplied by member rows.
+    """
+    member_boards = Board.members.through.objects.filter(user=user).values("board_id")
+    return Board.objects.filter(Q(owner=user) | Q(pk__in=member_boards))
+
+
+def with_access(queryset, user, board="board"):
+    """
+    Annotates the rows of `queryset` (boards, or objects with a `board`
+    relation at the given path) with `user_is_member`: whether the user
+    owns the board or is one of its members. Lets a lookup and its access
+    check run as one query; hand the answer to BoardAccess.remember().
+    """
+    board_id, owner = ("pk", "owner") if board is None else (f"{board}_id", f"{board}__owner")
+    members = Board.members.through.objects.filter(board_id=OuterRef(board_id), user_id=user.pk)
+    return queryset.annotate(user_is_member=Q(**{owner: user.pk}) | Exists(members))
+
+
+class BoardAccess:
+    """
+    Answers "may user U work on board B" (owner or member) for one request.
+
+    Answers are memoised per request. Boards with prefetched members are
+    answered from a set of their ids; otherwise one EXISTS query on the
+    (board, user) unique index is made, so the cost does not depend on the
+    number of members. With KANBAN_ACCESS_CACHE_TIMEOUT set, answers are
+    also shared across requests under the board's cache version, which
+    every membership change bumps. Only enable that with a cache backend
+    shared by all processes.
+    """
+
+    def __init__(self):
+        self._answers = {}
+        self._member_ids = {}
+
+    def is_owner(self, board, user):
+        return board.owner_id == user.pk
+
+    def is_member(self, board, user):
+        if user is None or user.pk is None:
+            return False
+        if self.is_owner(board, user):
+            return True
+        key = (board.pk, user.pk)
+        if key not in self._answers:
+            self._answers[key] = self._lookup(board, user)
+        return self._answers[key]
+
+    def remember(self, board, user, answer):
+        """Records an answer found by the caller, e.g. through with_access()."""
+        if user is not None and user.pk is not None:
+            self._answers[(board.pk, user.pk)] = answer
+
+    def check(self, board, user, message="Du musst Mitglied dieses Boards sein."):
+        if not self.is_member(board, user):
+            raise PermissionDenied(message)
+
+    def _lookup(self, board, user):
+        prefetched = getattr(board, "_prefetched_objects_cache", {}).get("members")
+        if prefetched is not None:
+            if board.pk not in self._member_ids:
+                self._member_ids[board.pk] = {member.pk for member in prefetched}
+            return user.pk in self._member_ids[board.pk]
+
+        timeout = getattr(settings, "KANBAN_ACCESS_CACHE_TIMEOUT", 0)
+        if not timeout:
+            return self._exists(board, user)
+        cache = get_cache()
+        key = ACCESS_KEY.format(board.pk, board_version(board.pk), user.pk)
+        answer = cache.get(key)
+        if answer is None:
+            answer = self._exists(board, user)
+            cache.set(key, answer, timeout)
+        return answer
+
+    def _exists(self, board, user):
+        return Board.members.through.objects.filter(board_id=board.pk, user_id=user.pk).exists()
+
+
+def board_access(request):
+    """Returns the BoardAccess resolver shared by everything in a request."""
+    if request is None:
+        return BoardAccess()
+    access = getattr(request, "_board_access", None)
+    if access is None:
+        access = request._board_access = BoardAccess()
+    return access
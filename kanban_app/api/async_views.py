@@ -0,0 +1,267 @@
+"""
+Async versions of the hot read endpoints, served under /api/async/.
+
+They answer with the same JSON as their DRF counterparts (no pagination)
+but are plain Django async views, so under an ASGI server a slow client
+does not hold a worker thread. Independent queries are awaited together
+with asyncio.gather; Django's async ORM still runs them on the request's
+database thread, but the event loop serves other requests meanwhile.
+Under WSGI the views keep working, Django runs each in its own loop.
+"""
+import asyncio
+import functools
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.db.models import Count, Max
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from rest_framework import exceptions
+from rest_framework.fields import DateTimeField
+from rest_framework.utils.encoders import JSONEncoder
+
+from auth_app.authentication import CachedTokenAuthentication
+from kanban_app import events
+from kanban_app.models import Comment, Task
+from .access import board_access, visible_boards, with_access
+from .conditional import aconditional_response
+from .renderers import dumps
+from .serializers import task_row_to_dict, task_rows, wants_field
+from .views import with_summary_counts
+
+BOARD_SUMMARY_FIELDS = [
+    "id", "title", "owner_id",
+    "member_count", "ticket_count", "tasks_to_do_count", "tasks_high_prio_count",
+]
+
+_authentication = CachedTokenAuthentication()
+_datetime = DateTimeField()
+
+
+def _json(data, status=200):
+    return HttpResponse(dumps(data), status=status, content_type="application/json")
+
+
+def async_api_view(view):
+    """
+    Token-authenticates GET requests like the DRF views do and turns DRF
+    exceptions and Http404 into the same JSON error responses.
+    """
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != "GET":
+            response = _json({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+            response["Allow"] = "GET"
+            return response
+        try:
+            result = await _authentication.aauthenticate(request)
+            if result is None:
+                raise exceptions.NotAuthenticated()
+            request.user, request.auth = result
+            return await view(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            response = _json({"detail": exc.detail}, status=exc.status_code)
+            if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                response["WWW-Authenticate"] = _authentication.authenticate_header(request)
+            return response
+        except Http404:
+            return _json({"detail": "Not found."}, status=404)
+
+    return wrapper
+
+
+async def _rows(queryset):
+    return [row async for row in queryset.aiterator()]
+
+
+async def _boards_validator(boards):
+    # ETag only, like views.boards_validator().
+    stats = await boards.aaggregate(count=Count("pk"), last_modified=Max("updated_at"))
+    return (stats["count"], stats["last_modified"]), None
+
+
+def _fullname(first_name, last_name):
+    return f"{first_name} {last_name}".strip()
+
+
+@async_api_view
+async def board_list(request):
+    boards = visible_boards(request.user)
+    validator, last_modified = await _boards_validator(boards)
+
+    async def build():
+        fields = [name for name in BOARD_SUMMARY_FIELDS if wants_field(request, name)]
+        return _json(await _rows(with_summary_counts(boards, request).values(*fields)))
+
+    return await aconditional_response(request, validator, last_modified, build)
+
+
+@async_api_view
+async def board_detail(request, pk):
+    board = await (
+        visible_boards(request.user).filter(pk=pk)
+        .values("id", "title", "owner_id", "updated_at").afirst()
+    )
+    if board is None:
+        raise Http404
+
+    async def build():
+        members, tasks = await asyncio.gather(
+            _rows(User.objects.filter(shared_boards=pk).values("id", "email", "first_name", "last_name")),
+            _rows(task_rows(Task.objects.filter(board_id=pk))),
+        )
+        return _json({
+            "id": board["id"],
+            "title": board["title"],
+            "owner_id": board["owner_id"],
+            "members": [
+                {"id": row["id"], "email": row["email"], "fullname": _fullname(row["first_name"], row["last_name"])}
+                for row in members
+            ],
+            "tasks": [task_row_to_dict(row) for row in tasks],
+        })
+
+    return await aconditional_response(
+        request, (board["id"], board["updated_at"]), board["updated_at"], build,
+    )
+
+
+async def _task_list(request, tasks):
+    validator, last_modified = await _boards_validator(visible_boards(request.user))
+
+    async def build():
+        return _json([task_row_to_dict(row) for row in await _rows(task_rows(tasks))])
+
+    return await aconditional_response(request, validator, last_modified, build)
+
+
+def _visible_tasks(user):
+    return Task.objects.filter(board__in=visible_boards(user))
+
+
+@async_api_view
+async def task_list(request):
+    return await _task_list(request, _visible_tasks(request.user))
+
+
+@async_api_view
+async def tasks_assigned_to_me(request):
+    return await _task_list(request, _visible_tasks(request.user).filter(assignee=request.user))
+
+
+@async_api_view
+async def tasks_reviewing(request):
+    return await _task_list(request, _visible_tasks(request.user).filter(reviewer=request.user))
+
+
+@async_api_view
+async def task_comments(request, task_id):
+    task = await with_access(Task.objects.select_related("board").filter(pk=task_id), request.user).afirst()
+    if task is None:
+        raise Http404
+    access = board_access(request)
+    access.remember(task.board, request.user, task.user_is_member)
+    access.check(task.board, request.user, "Zugriff verweigert.")
+
+    async def build():
+        comments = await _rows(
+            Comment.objects.filter(task_id=task.pk).order_by("created_at")
+            .values("id", "created_at", "content", "user__first_name", "user__last_name")
+        )
+        return _json([
+            {
+                "id": row["id"],
+                "created_at": _datetime.to_representation(row["created_at"]),
+                "author": _fullname(row["user__first_name"], row["user__last_name"]),
+                "content": row["content"],
+            }
+            for row in comments
+        ])
+
+    return await aconditional_response(
+        request, (task.pk, task.board.updated_at), task.board.updated_at, build,
+    )
+
+
+def _sse(event_id, type, data):
+    return f"id: {event_id}\nevent: {type}\ndata: {json.dumps(data, cls=JSONEncoder)}\n\n"
+
+
+def _last_event_id(request):
+    value = request.headers.get("Last-Event-ID", "")
+    return int(value) if value.isdigit() else None
+
+
+def _ends_stream(event, user):
+    if event.type == "board.deleted":
+        return True
+    return event.type == "member.removed" and user.pk in event.data["ids"]
+
+
+class NotServedOverAsgi(exceptions.APIException):
+    status_code = 501
+    default_detail = "Der Event-Stream ist nur über ASGI (core.asgi:application) verfügbar."
+    default_code = "asgi_required"
+
+
+@async_api_view
+async def board_events(request, pk):
+    """
+    Server-Sent Events stream of a board's changes. A client that
+    reconnects with Last-Event-ID first gets the events it missed; if they
+    are no longer buffered it gets a "reset" event and should reload the
+    board. The stream ends when the board is deleted or the user loses
+    access to it.
+    """
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI Django reads an async stream to the end before sending
+        # anything, which for this one means never.
+        raise NotServedOverAsgi()
+    if not await visible_boards(request.user).filter(pk=pk).aexists():
+        raise Http404
+    backend = events.get_backend()
+    keepalive = getattr(settings, "KANBAN_EVENTS_KEEPALIVE", 15)
+    last_event_id = _last_event_id(request)
+
+    async def stream():
+        # Subscribe before replaying so nothing published in between is lost.
+        subscription = backend.subscribe(pk)
+        try:
+            yield "retry: 3000\n\n"
+            sent = 0
+            if last_event_id is not None:
+                missed = await sync_to_async(backend.replay)(pk, last_event_id)
+                if missed is None:
+                    sent = await sync_to_async(backend.last_id)(pk)
+                    yield _sse(sent, "reset", {"board": pk})
+                    missed = []
+                else:
+                    sent = last_event_id
+                for event in missed:
+                    sent = event.id
+                    yield _sse(event.id, event.type, event.data)
+                    if _ends_stream(event, request.user):
+                        return
+            while not subscription.overflowed:
+                event = await subscription.next(keepalive)
+                if event is None:
+                    if not subscription.overflowed:
+                        yield ": keepalive\n\n"
+                    continue
+                if event.id <= sent:
+                    continue
+                sent = event.id
+                yield _sse(event.id, event.type, event.data)
+                if _ends_stream(event, request.user):
+                    return
+            # A client this far behind reconnects and resumes from the buffer.
+        finally:
+            subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,202 @@
+"""
+Query parameters of the task lists: filters, ordering and facet counts.
+
+TaskQuery validates the parameters once per request and turns them into
+ORM filters, so the database does the narrowing (the (board, status),
+(board, priority) and (board, due_date) indexes cover the common cases).
+Facets are counted in a single UNION ALL query over the filtered tasks.
+The filters apply to AnyTask querysets (?include_archived=) unchanged.
+"""
+from datetime import date
+
+from django.db.models import Case, CharField, Count, F, IntegerField, Value, When
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+from rest_framework import serializers
+
+from kanban_app.models import PRIORITY_CHOICES as MODEL_PRIORITY_CHOICES, STATUS_CHOICES as MODEL_STATUS_CHOICES
+
+from .serializers import STATUS_CHOICES
+
+# Tasks carry both spellings of the first two states, depending on which
+# endpoint wrote them; filters accept either.
+STATUS_RANKS = {
+    "to-do": 0, "todo": 0,
+    "in-progress": 1, "in_progress": 1,
+    "review": 2,
+    "done": 3,
+}
+PRIORITY_RANKS = {"low": 0, "medium": 1, "high": 2}
+STATUSES = sorted({value for value, _ in MODEL_STATUS_CHOICES + STATUS_CHOICES})
+PRIORITIES = [value for value, _ in MODEL_PRIORITY_CHOICES]
+
+
+def _rank(field, ranks):
+    return Case(*(When(**{field: value}, then=Value(rank)) for value, rank in ranks.items()),
+                default=Value(len(ranks)), output_field=IntegerField())
+
+
+# ?ordering= names and the expressions they sort by. Tasks without a due
+# date come last in either direction.
+ORDERINGS = {
+    "id": lambda descending: F("pk"),
+    "title": lambda descending: F("title"),
+    "status": lambda descending: _rank("status", STATUS_RANKS),
+    "priority": lambda descending: _rank("priority", PRIORITY_RANKS),
+    "due_date": lambda descending: Coalesce("due_date", Value(date.min if descending else date.max)),
+}
+
+FACETS = {"status": "status", "priority": "priority", "assignee": "assignee_id"}
+
+
+def include_archived(request):
+    """
+    Whether ?include_archived= asks for archived tasks as well. Raises
+    ValidationError for values that are not booleans.
+    """
+    if request is None:
+        return False
+    # Plain Django requests (the async views) have no query_params.
+    params = request.query_params if hasattr(request, "query_params") else request.GET
+    value = params.get("include_archived")
+    if value is None:
+        return False
+    try:
+        return serializers.BooleanField().to_internal_value(value)
+    except serializers.ValidationError as exc:
+        raise serializers.ValidationError({"include_archived": exc.detail})
+
+
+class CommaSeparatedField(serializers.CharField):
+    """A comma-separated list of values, each one of `choices`."""
+
+    def __init__(self, choices, **kwargs):
+        self.choices = choices
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        values = [value.strip() for value in super().to_internal_value(data).split(",") if value.strip()]
+        invalid = [value for value in values if value not in self.choices]
+        if invalid:
+            raise serializers.ValidationError(
+                f"Ungültige Werte: {', '.join(invalid)}. Erlaubt sind: {', '.join(self.choices)}."
+            )
+        return list(dict.fromkeys(values))
+
+
+class TaskQuerySerializer(serializers.Serializer):
+    board = serializers.IntegerField(required=False, min_value=1)
+    status = CommaSeparatedField(STATUSES, required=False)
+    priority = CommaSeparatedField(PRIORITIES, required=False)
+    assignee = serializers.CharField(required=False)
+    due_before = serializers.DateField(required=False)
+    due_after = serializers.DateField(required=False)
+    overdue = serializers.BooleanField(required=False)
+    ordering = CommaSeparatedField([f"{sign}{name}" for name in ORDERINGS for sign in ("", "-")], required=False)
+    facets = CommaSeparatedField(list(FACETS), required=False)
+
+    def validate_assignee(self, value):
+        if value in ("me", "none"):
+            return value
+        if value.isdigit():
+            return int(value)
+        raise serializers.ValidationError("Erwartet eine Benutzer-ID, 'me' oder 'none'.")
+
+    def validate(self, data):
+        if "due_before" in data and "due_after" in data and data["due_after"] >= data["due_before"]:
+            raise serializers.ValidationError({"due_after": ["Muss vor due_before liegen."]})
+        return data
+
+
+class TaskQuery:
+    """
+    The validated filter, ordering and facet parameters of a task list
+    request. Raises ValidationError for invalid ones.
+    """
+
+    def __init__(self, request):
+        serializer = TaskQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        self.params = serializer.validated_data
+        self.user = request.user
+
+    @property
+    def facets(self):
+        return self.params.get("facets", [])
+
+    def filter(self, queryset):
+        params = self.params
+        if "board" in params:
+            queryset = queryset.filter(board_id=params["board"])
+        if params.get("status"):
+            queryset = queryset.filter(status__in=params["status"])
+        if params.get("priority"):
+            queryset = queryset.filter(priority__in=params["priority"])
+        assignee = params.get("assignee")
+        if assignee == "me":
+            queryset = queryset.filter(assignee=self.user)
+        elif assignee == "none":
+            queryset = queryset.filter(assignee__isnull=True)
+        elif assignee is not None:
+            queryset = queryset.filter(assignee_id=assignee)
+        if "due_before" in params:
+            queryset = queryset.filter(due_date__lt=params["due_before"])
+        if "due_after" in params:
+            queryset = queryset.filter(due_date__gt=params["due_after"])
+        if params.get("overdue"):
+            queryset = queryset.filter(due_date__lt=timezone.localdate()).exclude(status="done")
+        return queryset
+
+    def ordering(self):
+        """
+        Returns the (annotations, order_by) for ?ordering=, or None when it
+        was not given. The primary key breaks ties, so the order is stable.
+        """
+        names = self.params.get("ordering")
+        if not names:
+            return None
+        annotations, order_by = {}, []
+        for name in names:
+            descending = name.startswith("-")
+            field = name.lstrip("-")
+            alias = f"order_{field}"
+            if field == "id":
+                alias = "pk"
+            elif alias not in annotations:
+                annotations[alias] = ORDERINGS[field](descending)
+            order_by.append(f"-{alias}" if descending else alias)
+        if "pk" not in order_by and "-pk" not in order_by:
+            order_by.append("pk")
+        return annotations, order_by
+
+    def order(self, queryset):
+        ordering = self.ordering()
+        if ordering is None:
+            return queryset
+        annotations, order_by = ordering
+        return queryset.annotate(**annotations).order_by(*order_by)
+
+    def facet_counts(self, queryset):
+        """
+        Counts the filtered tasks per value of each requested facet, in
+        one query: {"status": [{"value": "done", "count": 3}, ...], ...}.
+        """
+        if not self.facets:
+            return {}
+        parts = [
+            queryset.order_by()
+            .annotate(facet=Value(name, output_field=CharField()), value=Cast(FACETS[name], CharField()))
+            .values("facet", "value")
+            .annotate(count=Count("pk"))
+            for name in self.facets
+        ]
+        query = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+        counts = {name: [] for name in self.facets}
+        for row in query:
+            value = row["value"]
+            if row["facet"] == "assignee" and value is not None:
+                value = int(value)
+            counts[row["facet"]].append({"value": value, "count": row["count"]})
+        for values in counts.values():
+            values.sort(key=lambda item: (-item["count"], str(item["value"])))
+        return counts
@@ -0,0 +1,28 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """
+    Keyset pagination that only kicks in when the client sends `cursor` or
+    `page_size`. Without either parameter the response stays the plain
+    unpaginated list.
+
+    Views choose the sort key through `cursor_ordering`; its last field
+    should be unique so the order is stable.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    ordering = ("pk",)
+
+    def get_page_size(self, request):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().get_page_size(request)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", self.ordering)
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
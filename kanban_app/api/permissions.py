@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from .access import board_access
+
 class IsOwnerOrReadOnly(BasePermission):
     """
     Nur der Besitzer eines Objekts darf es bearbeiten.
@@ -10,4 +12,4 @@ class IsOwnerOrReadOnly(BasePermission):
 
         if request.method in SAFE_METHODS:
             return True
-        return obj.owner == request.user
+        return board_access(request).is_owner(obj, request.user)
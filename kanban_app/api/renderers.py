@@ -0,0 +1,49 @@
+"""
+JSON rendering through orjson, with the stdlib as the fallback.
+
+FastJSONRenderer produces the same bytes as DRF's JSONRenderer (compact,
+UTF-8, \\u2028/\\u2029 escaped, datetimes in ISO 8601 with `Z` for UTC),
+but encodes with orjson when it is installed. Types orjson does not know
+(Decimal, lazy translation strings, timedelta, querysets, ...) go through
+DRF's JSONEncoder.default, so they come out as they would from DRF.
+Without orjson, and for indented output (`Accept: application/json;
+indent=4`, the browsable API), it is DRF's renderer.
+
+One difference: DRF refuses NaN and ±Infinity (ValueError), orjson writes
+them as null. Checking every float first would cost most of the speed-up,
+and no model has a float field; code that computes floats has to keep
+them finite.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson is not None else 0
+
+_encoder = JSONEncoder()
+_stdlib = JSONRenderer()
+
+
+def dumps(data):
+    """Encodes `data` like FastJSONRenderer, as bytes."""
+    if orjson is None:
+        return _stdlib.render(data)
+    return _escape_separators(orjson.dumps(data, default=_encoder.default, option=OPTIONS))
+
+
+def _escape_separators(content):
+    # Like DRF, keep the output a strict JavaScript subset.
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
@@ -1,10 +1,15 @@
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 from django.db import models
-from kanban_app.models import Board, Column, Task, Comment
+from django.db.models.functions import Coalesce
+from kanban_app.metrics import TimedSerializerMixin
+from kanban_app.models import AnyTask, ArchivedComment, Board, Column, Task, Comment
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from rest_framework.authtoken.models import Token
 
+from .access import board_access
+
 STATUS_CHOICES = [
     ("to-do", "To Do"),
     ("in-progress", "In Progress"),
@@ -18,6 +23,119 @@ PRIORITY_CHOICES = [
     ("high", "High"),
 ]
 
+def annotated_count(obj, name, fallback):
+    """
+    Returns the count annotated by the view's queryset, or runs the
+    per-object query when the instance was loaded without annotations.
+    """
+    value = getattr(obj, name, None)
+    if value is None:
+        return fallback()
+    return value
+
+TASK_ROW_FIELDS = [
+    'id', 'board_id', 'title', 'description', 'status', 'priority',
+    'assignee__id', 'assignee__email', 'assignee__first_name', 'assignee__last_name',
+    'reviewer__id', 'reviewer__email', 'reviewer__first_name', 'reviewer__last_name',
+    'due_date', 'comments_count',
+]
+
+def requested_fields(request):
+    """
+    Returns the field names selected with `?fields=` on a read request, or
+    None when the full representation is wanted.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    # Plain Django requests (the async views) have no query_params.
+    params = request.query_params if hasattr(request, 'query_params') else request.GET
+    raw = params.get('fields')
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(',') if name.strip()}
+
+def wants_field(request, name):
+    fields = requested_fields(request)
+    return fields is None or name in fields
+
+class SparseFieldsMixin:
+    """
+    Drops every field not listed in `?fields=`. Method fields that are
+    dropped are never called, so the queries behind them are skipped too.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = requested_fields(self.context.get('request'))
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
+def comments_count_subquery(model=Task):
+    """
+    Counts the comments of Task rows, or of AnyTask rows, whose archived
+    half keeps its comments in ArchivedComment.
+    """
+    if model is AnyTask:
+        return models.Case(
+            models.When(archived=True, then=_comments_count(ArchivedComment)),
+            default=_comments_count(Comment),
+        )
+    return _comments_count(Comment)
+
+def _comments_count(comment_model):
+    comments_count = (
+        comment_model.objects
+        .filter(task=models.OuterRef('pk'))
+        .order_by()
+        .values('task')
+        .annotate(count=models.Count('pk'))
+        .values('count')
+    )
+    return Coalesce(models.Subquery(comments_count), 0)
+
+def task_rows(queryset):
+    """
+    Loads tasks (or AnyTask rows) as plain value rows with their users and
+    comment counts joined in, ready for task_row_to_dict.
+    """
+    fields = TASK_ROW_FIELDS + ['archived'] if queryset.model is AnyTask else TASK_ROW_FIELDS
+    return queryset.annotate(
+        comments_count=comments_count_subquery(queryset.model)
+    ).values(*fields)
+
+def user_row_to_dict(row, prefix):
+    if row[prefix + '__id'] is None:
+        return None
+    fullname = '%s %s' % (row[prefix + '__first_name'], row[prefix + '__last_name'])
+    return {
+        'id': row[prefix + '__id'],
+        'email': row[prefix + '__email'],
+        'fullname': fullname.strip(),
+    }
+
+def task_row_to_dict(row):
+    """
+    Builds the same representation as TaskSerializer from a task_rows row
+    without instantiating models or serializer fields.
+    """
+    due_date = row['due_date']
+    data = {
+        'id': row['id'],
+        'board': row['board_id'],
+        'title': row['title'],
+        'description': row['description'],
+        'status': row['status'],
+        'priority': row['priority'],
+        'assignee': user_row_to_dict(row, 'assignee'),
+        'reviewer': user_row_to_dict(row, 'reviewer'),
+        'due_date': due_date.isoformat() if due_date is not None else None,
+        'comments_count': row['comments_count'],
+    }
+    if 'archived' in row:
+        data['archived'] = row['archived']
+    return data
+
 class SimpleUserSerializer(serializers.ModelSerializer):
     fullname = serializers.SerializerMethodField()
 
@@ -28,8 +146,8 @@ class SimpleUserSerializer(serializers.ModelSerializer):
     def get_fullname(self, obj):
         return obj.get_full_name()
 
-class BoardSerializer(serializers.ModelSerializer):
-    owner_id = serializers.ReadOnlyField(source='owner.id')
+class BoardSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    owner_id = serializers.ReadOnlyField()
     members = SimpleUserSerializer(many=True, read_only=True)
     member_count = serializers.SerializerMethodField()
     ticket_count = serializers.SerializerMethodField()
@@ -46,19 +164,19 @@ class BoardSerializer(serializers.ModelSerializer):
         ]
 
     def get_member_count(self, obj):
-        return obj.members.count()
+        return annotated_count(obj, 'member_count', lambda: obj.members.count())
 
     def get_ticket_count(self, obj):
-        return obj.tasks.count()
+        return annotated_count(obj, 'ticket_count', lambda: obj.tasks.count())
 
     def get_tasks_to_do_count(self, obj):
-        return obj.tasks.filter(status='to-do').count()
+        return annotated_count(obj, 'tasks_to_do_count', lambda: obj.tasks.filter(status='to-do').count())
 
     def get_tasks_high_prio_count(self, obj):
-        return obj.tasks.filter(priority='high').count()
+        return annotated_count(obj, 'tasks_high_prio_count', lambda: obj.tasks.filter(priority='high').count())
     
-class BoardDetailSerializer(serializers.ModelSerializer):
-    owner_id = serializers.ReadOnlyField(source='owner.id')
+class BoardDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    owner_id = serializers.ReadOnlyField()
     members = SimpleUserSerializer(many=True, read_only=True)
     tasks = serializers.SerializerMethodField()
 
@@ -73,10 +191,13 @@ class BoardDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_tasks(self, obj):
-        return TaskSerializer(obj.tasks.all(), many=True).data
+        rows = getattr(obj, 'task_rows', None)
+        if rows is None:
+            return TaskSerializer(obj.tasks.all(), many=True).data
+        return [task_row_to_dict(row) for row in rows]
 
-class BoardSummarySerializer(serializers.ModelSerializer):
-        owner_id = serializers.ReadOnlyField(source='owner.id')
+class BoardSummarySerializer(TimedSerializerMixin, SparseFieldsMixin, serializers.ModelSerializer):
+        owner_id = serializers.ReadOnlyField()
         member_count = serializers.SerializerMethodField()
         ticket_count = serializers.SerializerMethodField()
         tasks_to_do_count = serializers.SerializerMethodField()
@@ -95,18 +216,18 @@ class BoardSummarySerializer(serializers.ModelSerializer):
             ]
 
         def get_member_count(self, obj):
-            return obj.members.count()
+            return annotated_count(obj, 'member_count', lambda: obj.members.count())
 
         def get_ticket_count(self, obj):
-            return obj.tasks.count()
+            return annotated_count(obj, 'ticket_count', lambda: obj.tasks.count())
 
         def get_tasks_to_do_count(self, obj):
-            return obj.tasks.filter(status='to-do').count()
+            return annotated_count(obj, 'tasks_to_do_count', lambda: obj.tasks.filter(status='to-do').count())
 
         def get_tasks_high_prio_count(self, obj):
-            return obj.tasks.filter(priority='high').count()
+            return annotated_count(obj, 'tasks_high_prio_count', lambda: obj.tasks.filter(priority='high').count())
 
-class ColumnSerializer(serializers.ModelSerializer):
+class ColumnSerializer(TimedSerializerMixin, SparseFieldsMixin, serializers.ModelSerializer):
     position = serializers.IntegerField(source="order")
     board    = serializers.PrimaryKeyRelatedField(queryset=Board.objects.all())
     
@@ -119,7 +240,7 @@ class ColumnSerializer(serializers.ModelSerializer):
             "board",
         ]
         
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TimedSerializerMixin, SparseFieldsMixin, serializers.ModelSerializer):
     author = serializers.SerializerMethodField()
 
     class Meta:
@@ -140,7 +261,7 @@ class SimpleUserSerializer(serializers.ModelSerializer):
     def get_fullname(self, obj):
         return obj.get_full_name()
     
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(TimedSerializerMixin, SparseFieldsMixin, serializers.ModelSerializer):
     assignee = serializers.SerializerMethodField()
     reviewer = serializers.SerializerMethodField()
 
@@ -173,7 +294,7 @@ class TaskSerializer(serializers.ModelSerializer):
         return SimpleUserSerializer(obj.reviewer).data if obj.reviewer else None
 
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        return annotated_count(obj, 'comments_count', lambda: obj.comments.count())
 
     def validate(self, data):
         board = data.get("board") or getattr(self.instance, "board", None)
@@ -183,10 +304,56 @@ class TaskSerializer(serializers.ModelSerializer):
         if not board:
             raise serializers.ValidationError({"board": "Board is required for validation."})
 
-        if assignee and assignee not in board.members.all() and assignee != board.owner:
+        access = board_access(self.context.get("request"))
+
+        if assignee and not access.is_member(board, assignee):
             raise serializers.ValidationError({"assignee": "Assignee must be a board member or the owner."})
 
-        if reviewer and reviewer not in board.members.all() and reviewer != board.owner:
+        if reviewer and not access.is_member(board, reviewer):
             raise serializers.ValidationError({"reviewer": "Reviewer must be a board member or the owner."})
 
         return data
+
+class AnyTaskSerializer(TaskSerializer):
+    """Reads live and archived tasks (AnyTask) for ?include_archived= lists."""
+    archived = serializers.BooleanField(read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = TaskSerializer.Meta.fields + ['archived']
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves primary keys against objects the view loaded up front
+    (context['preloaded'][name]) instead of running one query per value.
+    Objects the view did not load, e.g. boards the user cannot access,
+    are reported as not existing.
+    """
+
+    def __init__(self, preloaded, **kwargs):
+        self.preloaded = preloaded
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        return None
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        instance = self.context['preloaded'][self.preloaded].get(pk)
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+        return instance
+
+class TaskBulkSerializer(TaskSerializer):
+    """
+    TaskSerializer for batch writes: relations come from the preloaded
+    boards (with owner and members) and users, so validating an item
+    does not touch the database.
+    """
+    board = PreloadedPrimaryKeyRelatedField('boards')
+    assignee_id = PreloadedPrimaryKeyRelatedField('users', source='assignee', write_only=True)
+    reviewer_id = PreloadedPrimaryKeyRelatedField('users', source='reviewer', write_only=True)
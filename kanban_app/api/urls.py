@@ -1,6 +1,7 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import TaskCommentListCreateView, TaskCommentDeleteView, EmailCheckView, BoardViewSet, ColumnViewSet, TaskViewSet
+from . import async_views
+from .views import TaskCommentListCreateView, TaskCommentDeleteView, EmailCheckView, DashboardView, SearchView, MetricsView, BoardViewSet, ColumnViewSet, TaskViewSet
 
 router = DefaultRouter()
 router.register(r'boards', BoardViewSet, basename='board')
@@ -11,4 +12,14 @@ urlpatterns = [
     path("tasks/<int:task_id>/comments/", TaskCommentListCreateView.as_view(), name="task-comments"),
     path("tasks/<int:task_id>/comments/<int:comment_id>/", TaskCommentDeleteView.as_view(), name="task-comment-delete"),
     path("email-check/", EmailCheckView.as_view(), name="email-check"),
+    path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("search/", SearchView.as_view(), name="search"),
+    path("_metrics/", MetricsView.as_view(), name="metrics"),
+    path("boards/<int:pk>/events/", async_views.board_events, name="board-events"),
+    path("async/boards/", async_views.board_list, name="async-board-list"),
+    path("async/boards/<int:pk>/", async_views.board_detail, name="async-board-detail"),
+    path("async/tasks/", async_views.task_list, name="async-task-list"),
+    path("async/tasks/assigned-to-me/", async_views.tasks_assigned_to_me, name="async-tasks-assigned-to-me"),
+    path("async/tasks/reviewing/", async_views.tasks_reviewing, name="async-tasks-reviewing"),
+    path("async/tasks/<int:task_id>/comments/", async_views.task_comments, name="async-task-comments"),
 ] + router.urls
\ No newline at end of file
@@ -1,6 +1,15 @@
+import json
+from datetime import timedelta
+
 from django.shortcuts import get_object_or_404
-from django.http import Http404
-from django.db.models import Q
+from django.conf import settings
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Q, Subquery, prefetch_related_objects
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce
 from django.contrib.auth.models import User
 
 from rest_framework import generics, permissions, status
@@ -8,34 +17,211 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.generics import DestroyAPIView
+from rest_framework.serializers import as_serializer_error
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from .serializers import (
-    BoardSummarySerializer, BoardDetailSerializer, CommentSerializer,
-    ColumnSerializer, TaskSerializer
+    AnyTaskSerializer, BoardSummarySerializer, BoardDetailSerializer, CommentSerializer,
+    ColumnSerializer, TaskBulkSerializer, TaskSerializer, comments_count_subquery,
+    task_row_to_dict, task_rows, wants_field
 )
-from kanban_app.models import Comment, Board, Column, Task
+from kanban_app.cache import board_version, board_versions, cached_data, get_cache, response_cache_key
+from kanban_app.export import export_board
+from kanban_app.importer import BoardImporter, json_document_records, ndjson_records
+from kanban_app.metrics import registry
+from kanban_app.models import AnyTask, ArchivedTask, Comment, Board, Column, Task
+from kanban_app import changelog, events, search, stats
+from kanban_app.signals import boards_changed
+from .access import board_access, visible_boards, with_access
+from .conditional import ConditionalGetMixin
+from .filters import TaskQuery, include_archived
 from .permissions import IsOwnerOrReadOnly
 
-class BoardViewSet(ModelViewSet):
+def boards_validator(boards):
+    """
+    Count and newest updated_at of a board queryset. Every write to a board's
+    content moves its updated_at, so this changes whenever any response
+    built from these boards would. Returns no Last-Modified: a board that
+    leaves the set (deleted, or the user removed) moves no remaining
+    timestamp, so If-Modified-Since alone would keep answering 304.
+    """
+    stats = boards.aggregate(count=Count("pk"), last_modified=Max("updated_at"))
+    return (stats["count"], stats["last_modified"]), None
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+}
+
+BULK_MAX_ITEMS = 5000
+BULK_BATCH_SIZE = 500
+BULK_UPDATE_FIELDS = {
+    "title", "description", "status", "priority", "assignee_id", "reviewer_id", "due_date",
+}
+
+def _stats_count(path, key=None):
+    value = F(f"stats__{path}") if key is None else Cast(KeyTextTransform(key, f"stats__{path}"), IntegerField())
+    return Coalesce(value, 0)
+
+def _archived_count(**filters):
+    count = (
+        ArchivedTask.objects
+        .filter(board_id=OuterRef("pk"), **filters)
+        .order_by()
+        .values("board_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(count), 0)
+
+def with_summary_counts(queryset, request):
+    """
+    Adds the requested board summary counts as annotations, so a board list
+    is served by a single query regardless of board count. Task counts come
+    from the materialised BoardStats row (see kanban_app.stats), which only
+    counts live tasks; ?include_archived=true adds the archived ones.
+    """
+    member_count = (
+        Board.members.through.objects
+        .filter(board_id=OuterRef("pk"))
+        .order_by()
+        .values("board_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    counts = {
+        "member_count": Coalesce(Subquery(member_count), 0),
+        "ticket_count": _stats_count("task_count"),
+        "tasks_to_do_count": _stats_count("status_counts", "to-do"),
+        "tasks_high_prio_count": _stats_count("priority_counts", "high"),
+    }
+    if include_archived(request):
+        # Archived tasks are all done, so the to-do count stays.
+        counts["ticket_count"] += _archived_count()
+        counts["tasks_high_prio_count"] += _archived_count(priority="high")
+    return queryset.annotate(**{
+        name: expression for name, expression in counts.items()
+        if wants_field(request, name)
+    })
+
+class BoardViewSet(ConditionalGetMixin, ModelViewSet):
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     queryset = Board.objects.all()
+    cursor_ordering = ("-created_at", "-pk")
 
     def get_queryset(self):
         user = self.request.user
-        return Board.objects.filter(
-            Q(owner=user) | Q(members=user)
-        ).distinct()
+        queryset = visible_boards(user)
+        if self.action == "list":
+            return with_summary_counts(queryset, self.request)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        include_archived(request)
+        boards = list(visible_boards(request.user).values_list("pk", "updated_at"))
+        last_modified = max((updated_at for _, updated_at in boards), default=None)
+        # ETag only, see boards_validator().
+        return self.conditional_response(
+            request, (len(boards), last_modified), None,
+            lambda: self._cached_list([pk for pk, _ in boards], request, *args, **kwargs),
+        )
+
+    def _cached_list(self, board_ids, request, *args, **kwargs):
+        key = response_cache_key("boards", board_versions(board_ids), request)
+        data, hit = cached_data(key, lambda: super(BoardViewSet, self).list(request, *args, **kwargs).data)
+        return self._cached_response(data, hit)
+
+    def retrieve(self, request, *args, **kwargs):
+        include_archived(request)
+        board = self.get_object()
+        return self.conditional_response(
+            request, (board.pk, board.updated_at), board.updated_at,
+            lambda: self._cached_detail(board, request),
+        )
+
+    def _cached_detail(self, board, request):
+        key = response_cache_key("board", {board.pk: board_version(board.pk)}, request)
+        data, hit = cached_data(key, lambda: self._detail_data(board))
+        return self._cached_response(data, hit)
+
+    def _detail_data(self, board):
+        prefetch_related_objects([board], "members")
+        tasks = AnyTask.objects.filter(board=board) if include_archived(self.request) else board.tasks.all()
+        board.task_rows = task_rows(tasks)
+        return self.get_serializer(board).data
+
+    def _cached_response(self, data, hit):
+        response = Response(data)
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
     
+    @action(detail=True, methods=["get"], url_path="export")
+    def export(self, request, pk=None):
+        board = self.get_object()
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_CONTENT_TYPES:
+            return Response(
+                {"output": [f"Choose one of: {', '.join(EXPORT_CONTENT_TYPES)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        response = StreamingHttpResponse(
+            export_board(board, output), content_type=EXPORT_CONTENT_TYPES[output]
+        )
+        response["Content-Disposition"] = f'attachment; filename="board-{board.pk}.{output}"'
+        return response
+
+    @action(detail=True, methods=["get"], url_path="changes")
+    def changes(self, request, pk=None):
+        """
+        Everything that changed on the board after version `since`: changed
+        records in the export format and the ids of deleted ones. since=0
+        (or no since) returns the whole board.
+        """
+        board = self.get_object()
+        since = request.query_params.get("since", "0")
+        if not since.isdigit():
+            return Response(
+                {"since": ["Must be a version number returned by an earlier call."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            return Response(changelog.changes_since(board, int(since)))
+        except changelog.ChangesCompacted as exc:
+            return Response(
+                {"detail": "Diese Version ist nicht mehr verfügbar; mit since=0 neu synchronisieren.",
+                 "version": exc.version},
+                status=status.HTTP_410_GONE,
+            )
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_board(self, request):
+        """
+        Imports a board in the export format. The body is read as a stream
+        (NDJSON line by line), so it never goes through request.data.
+        """
+        stream = request.stream
+        if stream is None:
+            return Response({"detail": "Der Request-Body ist leer."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            if "ndjson" in request.content_type:
+                records = ndjson_records(stream)
+            else:
+                records = json_document_records(json.load(stream))
+            report = BoardImporter(request.user).run(records)
+        except ValueError as exc:  # BoardImportError and malformed JSON alike
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
     def perform_update(self, serializer):
-        board = self.get_object()
+        board = serializer.instance
 
-        if self.request.user != board.owner:
+        if not board_access(self.request).is_owner(board, self.request.user):
             raise PermissionDenied("Nur der Eigentümer darf Mitglieder aktualisieren.")
 
         members = self.request.data.get("members", None)
@@ -48,7 +234,7 @@ class BoardViewSet(ModelViewSet):
         instance.save()
         
     def perform_destroy(self, instance):
-        if self.request.user != instance.owner:
+        if not board_access(self.request).is_owner(instance, self.request.user):
             raise PermissionDenied("Nur der Eigentümer darf dieses Board löschen.")
         instance.delete()
 
@@ -61,6 +247,7 @@ class BoardViewSet(ModelViewSet):
 class ColumnViewSet(ModelViewSet):
     serializer_class    = ColumnSerializer
     permission_classes  = [IsAuthenticated]
+    cursor_ordering     = ("order", "pk")
 
     def get_queryset(self):
         user     = self.request.user
@@ -68,12 +255,10 @@ class ColumnViewSet(ModelViewSet):
         board_id = self.request.query_params.get("board")
         if board_id:
             qs = qs.filter(board_id=board_id)
-        return qs.filter(Q(board__owner=user) | Q(board__members=user))
+        return qs.filter(board__in=visible_boards(user))
 
     def _check_board_access(self, board):
-        user = self.request.user
-        if not (board.owner == user or user in board.members.all()):
-            raise PermissionDenied("Du musst Mitglied dieses Boards sein.")
+        board_access(self.request).check(board, self.request.user)
 
     def perform_create(self, serializer):
         board = serializer.validated_data["board"]
@@ -90,40 +275,104 @@ class ColumnViewSet(ModelViewSet):
         self._check_board_access(board)
         instance.delete()
 
-class TaskViewSet(ModelViewSet):
+class TaskViewSet(ConditionalGetMixin, ModelViewSet):
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(
-            Q(board__owner=user) | Q(board__members=user)
-        ).distinct()
+        model = AnyTask if self._include_archived() else Task
+        queryset = model.objects.filter(board__in=visible_boards(user))
+        return self._with_requested_relations(queryset)
+
+    def get_serializer_class(self):
+        return AnyTaskSerializer if self._include_archived() else TaskSerializer
+
+    def _include_archived(self):
+        # Archived tasks can be read, not written.
+        return self.request.method in permissions.SAFE_METHODS and include_archived(self.request)
+
+    def _with_requested_relations(self, queryset):
+        """
+        Joins the users and annotates the comment count up front for the
+        fields the response will contain, instead of querying per task.
+        """
+        related = [name for name in ("assignee", "reviewer") if wants_field(self.request, name)]
+        if related:
+            queryset = queryset.select_related(*related)
+        if wants_field(self.request, "comments_count"):
+            queryset = queryset.annotate(comments_count=comments_count_subquery(queryset.model))
+        return queryset
+
+    def _list_response(self, queryset):
+        """
+        Applies the ?board=, ?status=, ... filters and ?ordering= (see
+        kanban_app.api.filters) and answers with the list, plus the
+        ?facets= counts of the filtered tasks when asked for.
+        """
+        query = TaskQuery(self.request)
+        queryset = query.order(query.filter(queryset))
+        ordering = query.ordering()
+        if ordering is not None:
+            self.cursor_ordering = ordering[1]
+        validator, last_modified = boards_validator(visible_boards(self.request.user))
+        return self.conditional_response(
+            self.request, validator, last_modified,
+            lambda: self._build_list_response(queryset, query),
+        )
+
+    def _build_list_response(self, queryset, query=None):
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            serializer = self.get_serializer(queryset, many=True)
+            response = Response(serializer.data)
+        if query is not None and query.facets:
+            if page is None:
+                response.data = {"results": response.data}
+            response.data["facets"] = query.facet_counts(queryset)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._list_response(self.filter_queryset(self.get_queryset()))
 
     def _check_board_access(self, board):
-        user = self.request.user
-        if not (board.owner == user or user in board.members.all()):
-            raise PermissionDenied("Du musst Mitglied dieses Boards sein.")
+        board_access(self.request).check(board, self.request.user)
 
+    # Writes run in a transaction so the board's counters (kanban_app.stats),
+    # updated by the task signals, commit or roll back with the task.
     def perform_create(self, serializer):
         board = serializer.validated_data['board']
         self._check_board_access(board)
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
 
     def perform_update(self, serializer):
         board = serializer.validated_data.get("board") or serializer.instance.board
         self._check_board_access(board)
-        serializer.save()
-
+        with transaction.atomic():
+            serializer.save()
 
     def perform_destroy(self, instance):
         board = instance.board
         self._check_board_access(board)
-        instance.delete()
+        with transaction.atomic():
+            instance.delete()
 
     def retrieve(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        instance = queryset.filter(pk=kwargs["pk"]).first()
+        queryset = self.get_queryset().filter(pk=kwargs["pk"])
+        board_updated_at = queryset.values_list("board__updated_at", flat=True).first()
+        if board_updated_at is None:
+            raise Http404("Task not found.")
+        return self.conditional_response(
+            request, (kwargs["pk"], board_updated_at), board_updated_at,
+            lambda: self._build_detail_response(queryset),
+        )
+
+    def _build_detail_response(self, queryset):
+        instance = queryset.first()
         if not instance:
             raise Http404("Task not found.")
         serializer = self.get_serializer(instance)
@@ -131,24 +380,304 @@ class TaskViewSet(ModelViewSet):
 
     @action(detail=False, methods=['get'], url_path='assigned-to-me')
     def assigned_to_me(self, request):
-        tasks = self.get_queryset().filter(assignee=request.user).distinct()
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        tasks = self.get_queryset().filter(assignee=request.user)
+        return self._list_response(tasks)
 
     @action(detail=False, methods=['get'], url_path='reviewing')
     def reviewing(self, request):
-        tasks = self.get_queryset().filter(reviewer=request.user).distinct()
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        tasks = self.get_queryset().filter(reviewer=request.user)
+        return self._list_response(tasks)
     
     @action(detail=False, methods=['get'], url_path='assigned-or-reviewing')
     def assigned_or_reviewing(self, request):
         tasks = self.get_queryset().filter(
             Q(assignee=request.user) | Q(reviewer=request.user)
-        ).distinct()
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
-   
+        )
+        return self._list_response(tasks)
+
+    @action(detail=False, methods=['post', 'patch'], url_path='bulk')
+    def bulk(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Expected a non-empty list of tasks."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > BULK_MAX_ITEMS:
+            return Response(
+                {"error": f"At most {BULK_MAX_ITEMS} tasks per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if request.method == "POST":
+            return self._bulk_create(items)
+        return self._bulk_update(items)
+
+    def _bulk_context(self, board_ids, user_ids):
+        """
+        Loads every board (with owner and members) and user a batch refers
+        to in three queries. Boards the user cannot access are left out, so
+        items pointing at them fail validation.
+        """
+        boards = (
+            visible_boards(self.request.user)
+            .filter(pk__in=board_ids)
+            .select_related("owner")
+            .prefetch_related("members")
+        )
+        return {
+            "request": self.request,
+            "preloaded": {
+                "boards": {board.pk: board for board in boards},
+                "users": User.objects.in_bulk(user_ids),
+            },
+        }
+
+    def _bulk_create(self, items):
+        context = self._bulk_context(
+            _pk_values(items, "board"), _pk_values(items, "assignee_id", "reviewer_id")
+        )
+        # One serializer validates every item, so its fields are built once.
+        serializer = TaskBulkSerializer(context=context)
+        results, tasks = [], []
+        for index, item in enumerate(items):
+            try:
+                task = Task(**serializer.run_validation(item))
+                task.track_done()
+                tasks.append(task)
+                results.append({"index": index})
+            except ValidationError as exc:
+                results.append({"index": index, "errors": as_serializer_error(exc)})
+
+        if any("errors" in result for result in results):
+            return Response({"results": results}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=BULK_BATCH_SIZE)
+            boards_changed(*{task.board_id for task in tasks})
+            stats.apply(added=[stats.task_row(task) for task in tasks])
+            changelog.record_objects("task", tasks)
+            events.publish_tasks("task.created", tasks)
+        for result, task in zip(results, tasks):
+            result["id"] = task.pk
+        return Response({"results": results}, status=status.HTTP_201_CREATED)
+
+    def _bulk_update(self, items):
+        tasks = (
+            Task.objects
+            .filter(pk__in=_pk_values(items, "id"), board__in=visible_boards(self.request.user))
+            .select_related("assignee", "reviewer")
+            .in_bulk()
+        )
+        context = self._bulk_context(
+            {task.board_id for task in tasks.values()}, _pk_values(items, "assignee_id", "reviewer_id")
+        )
+        boards = context["preloaded"]["boards"]
+        previous_rows = {pk: stats.task_row(task) for pk, task in tasks.items()}
+        serializer = TaskBulkSerializer(partial=True, context=context)
+        results, changed, fields = [], {}, set()
+        for index, item in enumerate(items):
+            task = tasks.get(_as_pk(item.get("id"))) if isinstance(item, dict) else None
+            if task is None:
+                results.append({"index": index, "errors": {"id": ["Task not found."]}})
+                continue
+            payload = {key: value for key, value in item.items() if key != "id"}
+            unknown = set(payload) - BULK_UPDATE_FIELDS
+            if unknown:
+                results.append({"index": index, "errors": {
+                    key: ["This field cannot be changed in bulk."] for key in sorted(unknown)
+                }})
+                continue
+            task.board = boards[task.board_id]
+            serializer.instance = task
+            try:
+                validated_data = serializer.run_validation(payload)
+            except ValidationError as exc:
+                results.append({"index": index, "errors": as_serializer_error(exc)})
+                continue
+            for attr, value in validated_data.items():
+                setattr(task, attr, value)
+                fields.add(attr)
+            if "status" in validated_data:
+                task.track_done(previous_rows[task.pk][1])
+                fields.add("done_at")
+            changed[task.pk] = task
+            results.append({"index": index, "id": task.pk})
+
+        if any("errors" in result for result in results):
+            for result in results:
+                result.pop("id", None)
+            return Response({"results": results}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            if fields:
+                Task.objects.bulk_update(changed.values(), sorted(fields), batch_size=BULK_BATCH_SIZE)
+            boards_changed(*{task.board_id for task in changed.values()})
+            stats.apply(
+                removed=[previous_rows[pk] for pk in changed],
+                added=[stats.task_row(task) for task in changed.values()],
+            )
+            changelog.record_objects("task", changed.values())
+            events.publish_tasks("task.updated", changed.values())
+        return Response({"results": results})
+
+
+def _as_pk(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _pk_values(items, *keys):
+    """Collects the ids found under the given keys of a batch."""
+    values = set()
+    for item in items:
+        if isinstance(item, dict):
+            values.update(_as_pk(item.get(key)) for key in keys)
+    values.discard(None)
+    return values
+
+DASHBOARD_BOARD_FIELDS = [
+    "id", "title", "owner_id",
+    "member_count", "ticket_count", "tasks_to_do_count", "tasks_high_prio_count",
+]
+
+class DashboardView(ConditionalGetMixin, APIView):
+    """
+    Everything the dashboard shows in two queries: the user's boards with
+    their counters, then the tasks assigned to or reviewed by the user on
+    those boards. Overdue, due-this-week and urgent tasks are picked from
+    the second result. With KANBAN_DASHBOARD_CACHE_TIMEOUT set, the data
+    is kept per user for that many seconds.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        today = timezone.localdate()
+        timeout = getattr(settings, "KANBAN_DASHBOARD_CACHE_TIMEOUT", 0)
+        key = f"kanban:dashboard:{request.user.pk}:{today.isoformat()}"
+        if timeout:
+            data = get_cache().get(key)
+            if data is not None:
+                return self._cached_response(data, True)
+
+        boards = list(
+            with_summary_counts(visible_boards(request.user), None)
+            .values(*DASHBOARD_BOARD_FIELDS, "updated_at")
+        )
+        last_modified = max((board.pop("updated_at") for board in boards), default=None)
+
+        def build():
+            data = self._data(request.user, boards, today)
+            if timeout:
+                get_cache().set(key, data, timeout)
+            return self._cached_response(data, False)
+
+        # ETag only, see boards_validator().
+        return self.conditional_response(request, (len(boards), last_modified, today), None, build)
+
+    def _data(self, user, boards, today):
+        week_end = today + timedelta(days=6 - today.weekday())
+        rows = task_rows(
+            Task.objects
+            .filter(board_id__in=[board["id"] for board in boards])
+            .filter(Q(assignee=user) | Q(reviewer=user))
+        )
+        assigned, reviewing, urgent = [], [], []
+        overdue = due_this_week = 0
+        for row in rows:
+            task = task_row_to_dict(row)
+            if row["assignee__id"] == user.pk:
+                assigned.append(task)
+            if row["reviewer__id"] == user.pk:
+                reviewing.append(task)
+            if row["status"] == "done":
+                continue
+            if row["priority"] == "high":
+                urgent.append(task)
+            due_date = row["due_date"]
+            if due_date is not None and due_date < today:
+                overdue += 1
+            elif due_date is not None and due_date <= week_end:
+                due_this_week += 1
+        return {
+            "boards": boards,
+            "assigned_to_me": assigned,
+            "reviewing": reviewing,
+            "urgent": urgent,
+            "counts": {
+                "boards": len(boards),
+                "assigned_to_me": len(assigned),
+                "reviewing": len(reviewing),
+                "urgent": len(urgent),
+                "overdue": overdue,
+                "due_this_week": due_this_week,
+            },
+        }
+
+    def _cached_response(self, data, hit):
+        response = Response(data)
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
+
+class SearchView(APIView):
+    """
+    Full-text search over task titles, descriptions and comments on the
+    user's boards, best matches first (see kanban_app.search). Paginated
+    with `page` and `page_size`; `truncated` says that only the newest
+    matches were ranked.
+    """
+    permission_classes = [IsAuthenticated]
+    page_size = 20
+    max_page_size = 100
+
+    def get(self, request):
+        terms = search.parse_terms(request.query_params.get("q", ""))
+        if not terms:
+            raise ValidationError({"q": ["Bitte einen Suchbegriff angeben."]})
+        page = self._positive_int(request, "page", 1)
+        page_size = min(self._positive_int(request, "page_size", self.page_size), self.max_page_size)
+
+        # One extra hit tells whether there is a next page.
+        hits, truncated = search.search(request.user, terms, page_size + 1, (page - 1) * page_size)
+        url = request.build_absolute_uri()
+        previous = None
+        if page > 1:
+            previous = replace_query_param(url, "page", page - 1) if page > 2 else remove_query_param(url, "page")
+        return Response({
+            "next": replace_query_param(url, "page", page + 1) if len(hits) > page_size else None,
+            "previous": previous,
+            "truncated": truncated,
+            "results": hits[:page_size],
+        })
+
+    def _positive_int(self, request, name, default):
+        value = request.query_params.get(name)
+        if value is None:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number < 1:
+            raise ValidationError({name: ["Muss eine positive ganze Zahl sein."]})
+        return number
+
+class MetricsView(APIView):
+    """
+    Prometheus text export of kanban_app.metrics. With KANBAN_METRICS_TOKEN
+    set it needs `Authorization: Bearer <token>`; without, a staff user.
+    """
+    permission_classes = [AllowAny]
+    metrics_exempt = True
+
+    def get(self, request):
+        token = getattr(settings, "KANBAN_METRICS_TOKEN", "")
+        if token:
+            if not constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+                raise PermissionDenied("Ungültiges Metrics-Token.")
+        elif not request.user.is_staff:
+            raise PermissionDenied("Metriken sind nur für Staff-Benutzer oder mit Metrics-Token abrufbar.")
+        return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 class EmailCheckView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -167,32 +696,69 @@ class EmailCheckView(APIView):
         except User.DoesNotExist:
             return Response({}, status=200)
 
-class TaskCommentListCreateView(generics.ListCreateAPIView):
+class TaskCommentListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
+    """
+    A task's comments, oldest first or with `?order=newest` newest first.
+    `?after=<id>` lists only the comments added after that one, for
+    clients that poll. Cursor pages (`?page_size=`) follow the order.
+    """
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated]
-
-    def get_queryset(self):
-        task_id = self.kwargs["task_id"]
-        task = Task.objects.filter(pk=task_id).first()
+    orderings = {"oldest": ("created_at", "pk"), "newest": ("-created_at", "-pk")}
+
+    @property
+    def cursor_ordering(self):
+        return self.orderings[self._list_params()["order"]]
+
+    def _list_params(self):
+        if not hasattr(self, "_params"):
+            params = self.request.query_params
+            order = params.get("order", "oldest")
+            if order not in self.orderings:
+                raise ValidationError({"order": [f"Erlaubt sind: {', '.join(self.orderings)}."]})
+            after = params.get("after")
+            if after is not None and not after.isdigit():
+                raise ValidationError({"after": ["Muss eine Kommentar-ID sein."]})
+            self._params = {"order": order, "after": int(after) if after is not None else None}
+        return self._params
+
+    def _get_task(self):
+        if hasattr(self, "_task"):
+            return self._task
+
+        # The task, its board and the user's access in one query.
+        user = self.request.user
+        task = with_access(Task.objects.select_related("board").filter(pk=self.kwargs["task_id"]), user).first()
         if not task:
             raise Http404("Task not found.")
 
-        user = self.request.user
-
-        if not (user == task.board.owner or user in task.board.members.all()):
-            raise PermissionDenied("Zugriff verweigert.")
+        access = board_access(self.request)
+        access.remember(task.board, user, task.user_is_member)
+        access.check(task.board, user, "Zugriff verweigert.")
 
-        return task.comments.order_by("created_at")
+        self._task = task
+        return task
 
-    def perform_create(self, serializer):
-        task_id = self.kwargs["task_id"]
-        task = get_object_or_404(Task, pk=task_id)
-        user = self.request.user
+    def list(self, request, *args, **kwargs):
+        self._list_params()
+        task = self._get_task()
+        return self.conditional_response(
+            request, (task.pk, task.board.updated_at), task.board.updated_at,
+            lambda: super(TaskCommentListCreateView, self).list(request, *args, **kwargs),
+        )
 
-        if not (user == task.board.owner or user in task.board.members.all()):
-            raise PermissionDenied("Zugriff verweigert.")
+    def get_queryset(self):
+        task = self._get_task()
+        params = self._list_params()
+        comments = Comment.objects.filter(task_id=task.pk).order_by(*self.orderings[params["order"]])
+        if params["after"] is not None:
+            comments = comments.filter(pk__gt=params["after"])
+        if wants_field(self.request, "author"):
+            comments = comments.select_related("user")
+        return comments
 
-        serializer.save(task=task, user=user)
+    def perform_create(self, serializer):
+        serializer.save(task=self._get_task(), user=self.request.user)
         
 class TaskCommentDeleteView(DestroyAPIView):
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,87 @@
+"""
+Cold storage for finished tasks.
+
+archive_done_tasks() moves tasks that have been `done` since before a
+cutoff, with their comments, out of the live tables into ArchivedTask and
+ArchivedComment, one chunk per transaction. Board lists and details, task
+lists and search then only read live rows; ?include_archived= reads both
+through the AnyTask view.
+
+A chunk is bookkept like a bulk delete: the board counters
+(kanban_app.stats) drop the tasks, the change log records them as deleted,
+SSE subscribers get "task.archived" and the boards' cache versions move.
+"""
+from django.db import connection, transaction
+from django.utils import timezone
+
+from kanban_app import changelog, events, stats
+from kanban_app.models import ArchivedComment, ArchivedTask, Comment, Task
+from kanban_app.signals import boards_changed
+
+CHUNK_SIZE = 500
+
+
+def archivable(before):
+    """Live tasks done since before `before`."""
+    return Task.objects.filter(status="done", done_at__lt=before)
+
+
+def archive_done_tasks(before, chunk_size=CHUNK_SIZE):
+    """
+    Archives every task done before `before`, longest done first. Returns
+    the numbers of tasks and comments moved.
+    """
+    tasks = comments = 0
+    while True:
+        moved = _archive_chunk(before, chunk_size)
+        if moved is None:
+            return tasks, comments
+        tasks += moved[0]
+        comments += moved[1]
+
+
+def _archive_chunk(before, chunk_size):
+    with transaction.atomic():
+        tasks = list(archivable(before).select_for_update().order_by("done_at", "pk")[:chunk_size])
+        if not tasks:
+            return None
+        task_ids = [task.pk for task in tasks]
+        comments = list(Comment.objects.filter(task_id__in=task_ids))
+        now = timezone.now()
+
+        ArchivedTask.objects.bulk_create([
+            ArchivedTask(
+                id=task.pk, board_id=task.board_id, title=task.title, description=task.description,
+                status=task.status, priority=task.priority, assignee_id=task.assignee_id,
+                reviewer_id=task.reviewer_id, due_date=task.due_date, done_at=task.done_at, archived_at=now,
+            )
+            for task in tasks
+        ])
+        ArchivedComment.objects.bulk_create(
+            [
+                ArchivedComment(
+                    id=comment.pk, task_id=comment.task_id, user_id=comment.user_id,
+                    content=comment.content, created_at=comment.created_at,
+                )
+                for comment in comments
+            ],
+            batch_size=chunk_size,
+        )
+
+        # Plain DELETEs skip the per-row signals, the bookkeeping below covers
+        # the whole chunk; the search index triggers still fire. Comments go
+        # first: the SQLite search triggers look up their board through the
+        # task.
+        placeholders = ", ".join(["%s"] * len(task_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {Comment._meta.db_table} WHERE task_id IN ({placeholders})", task_ids,
+            )
+            cursor.execute(f"DELETE FROM {Task._meta.db_table} WHERE id IN ({placeholders})", task_ids)
+
+        stats.apply(removed=[stats.task_row(task) for task in tasks])
+        changelog.record_objects("task", tasks, deleted=True)
+        for task in tasks:
+            events.publish(task.board_id, "task.archived", {"id": task.pk})
+        boards_changed(*{task.board_id for task in tasks})
+    return len(tasks), len(comments)
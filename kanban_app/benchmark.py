@@ -0,0 +1,645 @@
+"""
+Synthetic data and a repeatable benchmark of the API.
+
+seed() fills the database with generated users (all on the BENCH_DOMAIN
+email domain), boards, columns, tasks and comments, drawn from a fixed
+random seed so two runs produce the same data. BenchmarkRun calls every
+endpoint through the test client and records latency percentiles, query
+count and peak memory per endpoint. Everything a run writes is rolled
+back, so runs on the same data stay comparable across commits.
+ThroughputRun compares the sync and async read endpoints under many
+concurrent clients. seed_search_comments() and SearchRun measure the
+search endpoint over a large body of generated comment text. RendererRun
+compares DRF's JSON renderer and parser with the orjson-based ones on a
+generated task list; it needs no database.
+"""
+import asyncio
+import io
+import math
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import accumulate
+
+import django
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, connections, transaction
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from kanban_app import stats
+from kanban_app.api.parsers import FastJSONParser
+from kanban_app.api.renderers import FastJSONRenderer, orjson
+from kanban_app.api.serializers import task_row_to_dict
+from kanban_app.export import export_board
+from kanban_app.models import Board, Column, Comment, Task
+from kanban_app.signals import boards_changed
+
+BENCH_DOMAIN = "benchmark.local"
+BENCH_PASSWORD = "benchmark"
+BATCH_SIZE = 1000
+
+STATUSES = ["to-do", "in_progress", "review", "done"]
+PRIORITIES = ["low", "medium", "high"]
+# Due dates are spread around a fixed day so the data does not depend on
+# when it was generated.
+BASE_DATE = date(2025, 1, 1)
+
+
+def benchmark_users():
+    return User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+
+
+def clear():
+    """Deletes all generated users; their boards and content cascade."""
+    benchmark_users().delete()
+
+
+def seed(users=50, boards=20, members_per_board=5, columns_per_board=4,
+         tasks_per_board=100, comments_per_task=2, random_seed=0, batch_size=BATCH_SIZE):
+    """Generates the benchmark data set and returns the row counts."""
+    rng = random.Random(random_seed)
+    password = make_password(BENCH_PASSWORD)
+    counts = {"users": 0, "boards": 0, "memberships": 0, "columns": 0, "tasks": 0, "comments": 0}
+
+    with transaction.atomic():
+        people = User.objects.bulk_create([
+            User(
+                username=f"user{i}@{BENCH_DOMAIN}", email=f"user{i}@{BENCH_DOMAIN}",
+                first_name="Bench", last_name=f"User {i}", password=password,
+            )
+            for i in range(users)
+        ], batch_size=batch_size)
+        user_ids = [user.pk for user in people]
+        counts["users"] = len(user_ids)
+        if not user_ids:
+            return counts
+
+        board_objs = Board.objects.bulk_create([
+            Board(title=f"Board {i}", description=f"Benchmark board {i}", owner_id=rng.choice(user_ids))
+            for i in range(boards)
+        ], batch_size=batch_size)
+        counts["boards"] = len(board_objs)
+
+        people_by_board = {}
+        memberships = []
+        for board in board_objs:
+            others = [user_id for user_id in user_ids if user_id != board.owner_id]
+            members = rng.sample(others, min(members_per_board, len(others)))
+            people_by_board[board.pk] = [board.owner_id, *members]
+            memberships.extend(Board.members.through(board_id=board.pk, user_id=user_id) for user_id in members)
+        Board.members.through.objects.bulk_create(memberships, batch_size=batch_size)
+        counts["memberships"] = len(memberships)
+
+        columns = Column.objects.bulk_create([
+            Column(board=board, title=f"Column {position}", order=position)
+            for board in board_objs for position in range(1, columns_per_board + 1)
+        ], batch_size=batch_size)
+        counts["columns"] = len(columns)
+
+        def flush(tasks):
+            Task.objects.bulk_create(tasks, batch_size=batch_size)
+            comments = [
+                Comment(task=task, user_id=rng.choice(people_by_board[task.board_id]), content=f"Comment {n} on {task.title}")
+                for task in tasks for n in range(comments_per_task)
+            ]
+            Comment.objects.bulk_create(comments, batch_size=batch_size)
+            counts["tasks"] += len(tasks)
+            counts["comments"] += len(comments)
+
+        pending = []
+        for board in board_objs:
+            people_here = people_by_board[board.pk]
+            for n in range(tasks_per_board):
+                task = Task(
+                    board=board,
+                    title=f"Task {n}",
+                    description=f"Generated task {n} of board {board.title}",
+                    status=rng.choice(STATUSES),
+                    priority=rng.choice(PRIORITIES),
+                    assignee_id=rng.choice([None, *people_here]),
+                    reviewer_id=rng.choice([None, *people_here]),
+                    due_date=BASE_DATE + timedelta(days=rng.randint(-30, 90)),
+                )
+                task.track_done()
+                pending.append(task)
+                if len(pending) >= batch_size:
+                    flush(pending)
+                    pending = []
+        if pending:
+            flush(pending)
+
+        stats.rebuild([board.pk for board in board_objs])
+        boards_changed(*[board.pk for board in board_objs])
+    return counts
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def git_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+# Read endpoints with a sync (DRF) and an async variant: (sync, async).
+THROUGHPUT_ENDPOINTS = {
+    "board-list": ("/api/boards/", "/api/async/boards/"),
+    "board-detail": ("/api/boards/{board}/", "/api/async/boards/{board}/"),
+    "task-list": ("/api/tasks/", "/api/async/tasks/"),
+    "tasks-assigned-to-me": ("/api/tasks/assigned-to-me/", "/api/async/tasks/assigned-to-me/"),
+    "tasks-reviewing": ("/api/tasks/reviewing/", "/api/async/tasks/reviewing/"),
+    "comment-list": ("/api/tasks/{task}/comments/", "/api/async/tasks/{task}/comments/"),
+}
+
+
+class Endpoint:
+    """
+    One benchmarked call. `prepare(i)` runs outside the measurement and
+    returns the path plus keyword arguments for the client method, so
+    writes such as deletes can get a fresh object per iteration.
+    """
+
+    def __init__(self, name, method, prepare, authenticated=True):
+        self.name = name
+        self.method = method
+        self.prepare = prepare
+        self.authenticated = authenticated
+
+
+class BenchmarkRun:
+    def __init__(self, user, iterations=30, warmup=3, response_cache=False):
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+        self.response_cache = response_cache
+
+    def run(self):
+        overrides = {"DEBUG": False, "ALLOWED_HOSTS": [*settings.ALLOWED_HOSTS, "testserver"]}
+        # Without the response cache repeated reads measure the real work.
+        if not self.response_cache:
+            overrides["KANBAN_RESPONSE_CACHE_TIMEOUT"] = 0
+        with override_settings(**overrides), transaction.atomic():
+            self._setup()
+            results = {endpoint.name: self._measure(endpoint) for endpoint in self.endpoints()}
+            transaction.set_rollback(True)
+        return {"meta": self._meta(), "endpoints": results}
+
+    def _setup(self):
+        self.board = Board.objects.filter(owner=self.user).order_by("pk").first()
+        if self.board is None:
+            raise ValueError(f"{self.user.username} owns no board; seed the benchmark data first.")
+        self.task = self.board.tasks.order_by("pk").first() or Task.objects.create(board=self.board, title="Benchmark")
+        self.column = self.board.columns.order_by("pk").first() or Column.objects.create(board=self.board, title="Benchmark", order=1)
+        self.member_id = self.board.members.values_list("pk", flat=True).order_by("pk").first() or self.user.pk
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.anonymous = APIClient()
+        self.import_body = "".join(export_board(self.board, "ndjson")).encode()
+
+    def _task_data(self, i):
+        return {
+            "board": self.board.pk, "title": f"Benchmark {i}", "description": "", "status": "review",
+            "priority": "high", "assignee_id": self.member_id, "reviewer_id": self.user.pk,
+            "due_date": "2025-02-01",
+        }
+
+    def _new_board(self, i):
+        return Board.objects.create(title=f"Benchmark {i}", owner=self.user).pk
+
+    def _new_task(self, i):
+        return Task.objects.create(board=self.board, title=f"Benchmark {i}").pk
+
+    def _new_column(self, i):
+        return Column.objects.create(board=self.board, title=f"Benchmark {i}", order=i + 100).pk
+
+    def _new_comment(self, i):
+        return Comment.objects.create(task=self.task, user=self.user, content=f"Benchmark {i}").pk
+
+    def endpoints(self):
+        board, task, column = self.board.pk, self.task.pk, self.column.pk
+
+        def get(path):
+            return lambda i: (path, {})
+
+        def send(path, data):
+            return lambda i: (path, {"data": data(i), "format": "json"})
+
+        bulk_ids = list(self.board.tasks.order_by("pk").values_list("pk", flat=True)[:50])
+        return [
+            Endpoint("registration", "POST", send("/api/registration/", lambda i: {
+                "fullname": "Bench New", "email": f"new{i}@{BENCH_DOMAIN}",
+                "password": BENCH_PASSWORD, "repeated_password": BENCH_PASSWORD,
+            }), authenticated=False),
+            Endpoint("login", "POST", send("/api/login/", lambda i: {
+                "email": self.user.email, "password": BENCH_PASSWORD,
+            }), authenticated=False),
+            Endpoint("email-check", "GET", get(f"/api/email-check/?email={self.user.email}")),
+            Endpoint("board-list", "GET", get("/api/boards/")),
+            Endpoint("board-create", "POST", send("/api/boards/", lambda i: {"title": f"Benchmark {i}"})),
+            Endpoint("board-detail", "GET", get(f"/api/boards/{board}/")),
+            Endpoint("board-update", "PATCH", send(f"/api/boards/{board}/", lambda i: {"title": f"Board {i}"})),
+            Endpoint("board-delete", "DELETE", lambda i: (f"/api/boards/{self._new_board(i)}/", {})),
+            Endpoint("board-export", "GET", get(f"/api/boards/{board}/export/")),
+            Endpoint("board-import", "POST", lambda i: (
+                "/api/boards/import/", {"data": self.import_body, "content_type": "application/x-ndjson"},
+            )),
+            Endpoint("column-list", "GET", get(f"/api/columns/?board={board}")),
+            Endpoint("column-create", "POST", send("/api/columns/", lambda i: {
+                "title": f"Benchmark {i}", "position": i + 100, "board": board,
+            })),
+            Endpoint("column-detail", "GET", get(f"/api/columns/{column}/")),
+            Endpoint("column-update", "PATCH", send(f"/api/columns/{column}/", lambda i: {"title": f"Column {i}"})),
+            Endpoint("column-delete", "DELETE", lambda i: (f"/api/columns/{self._new_column(i)}/", {})),
+            Endpoint("task-list", "GET", get("/api/tasks/")),
+            Endpoint("task-create", "POST", send("/api/tasks/", self._task_data)),
+            Endpoint("task-detail", "GET", get(f"/api/tasks/{task}/")),
+            Endpoint("task-update", "PATCH", send(f"/api/tasks/{task}/", lambda i: {"title": f"Task {i}"})),
+            Endpoint("task-delete", "DELETE", lambda i: (f"/api/tasks/{self._new_task(i)}/", {})),
+            Endpoint("tasks-assigned-to-me", "GET", get("/api/tasks/assigned-to-me/")),
+            Endpoint("tasks-reviewing", "GET", get("/api/tasks/reviewing/")),
+            Endpoint("tasks-assigned-or-reviewing", "GET", get("/api/tasks/assigned-or-reviewing/")),
+            Endpoint("tasks-bulk-create", "POST", send("/api/tasks/bulk/", lambda i: [
+                self._task_data(f"{i}.{n}") for n in range(50)
+            ])),
+            Endpoint("tasks-bulk-update", "PATCH", send("/api/tasks/bulk/", lambda i: [
+                {"id": pk, "priority": PRIORITIES[(i + n) % len(PRIORITIES)]} for n, pk in enumerate(bulk_ids)
+            ])),
+            Endpoint("comment-list", "GET", get(f"/api/tasks/{task}/comments/")),
+            Endpoint("comment-create", "POST", send(f"/api/tasks/{task}/comments/", lambda i: {"content": f"Benchmark {i}"})),
+            Endpoint("comment-delete", "DELETE", lambda i: (f"/api/tasks/{task}/comments/{self._new_comment(i)}/", {})),
+            Endpoint("search", "GET", get("/api/search/?q=generated task*")),
+        ] + [
+            Endpoint(f"async-{name}", "GET", get(async_path.format(board=board, task=task)))
+            for name, (_, async_path) in THROUGHPUT_ENDPOINTS.items()
+        ]
+
+    def _send(self, endpoint, path, kwargs):
+        client = self.client if endpoint.authenticated else self.anonymous
+        response = getattr(client, endpoint.method.lower())(path, **kwargs)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return response
+
+    def _measure(self, endpoint):
+        for i in range(self.warmup):
+            self._send(endpoint, *endpoint.prepare(i))
+
+        timings, errors, status = [], 0, None
+        for i in range(self.warmup, self.warmup + self.iterations):
+            path, kwargs = endpoint.prepare(i)
+            started = time.perf_counter()
+            response = self._send(endpoint, path, kwargs)
+            timings.append((time.perf_counter() - started) * 1000)
+            status = response.status_code
+            errors += status >= 400
+
+        # Query capture and tracemalloc slow the call down, so they get a
+        # separate pass that is not part of the timings.
+        path, kwargs = endpoint.prepare(self.warmup + self.iterations)
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as ctx:
+                self._send(endpoint, path, kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "method": endpoint.method,
+            "path": path,
+            "status": status,
+            "errors": errors,
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "mean_ms": round(sum(timings) / len(timings), 3),
+            "max_ms": round(max(timings), 3),
+            "queries": len(ctx.captured_queries),
+            "peak_memory_kb": round(peak / 1024, 1),
+        }
+
+    def _meta(self):
+        return {
+            "created_at": timezone.now().isoformat(),
+            "commit": git_commit(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "iterations": self.iterations,
+            "warmup": self.warmup,
+            "response_cache": self.response_cache,
+            "user": self.user.username,
+            "dataset": {
+                "users": User.objects.count(),
+                "boards": Board.objects.count(),
+                "columns": Column.objects.count(),
+                "tasks": Task.objects.count(),
+                "comments": Comment.objects.count(),
+            },
+        }
+
+
+class ThroughputRun:
+    """
+    Compares concurrent-client throughput of the sync and async variants of
+    the read endpoints. Sync views are driven by `clients` threads through
+    the WSGI test client, async views by `clients` coroutines through the
+    ASGI test client, each sending `requests` requests. Both run in this
+    process, so the numbers compare the two code paths, not servers.
+    """
+
+    def __init__(self, user, clients=16, requests=25, endpoints=None):
+        self.user = user
+        self.clients = clients
+        self.requests = requests
+        self.endpoints = endpoints or list(THROUGHPUT_ENDPOINTS)
+
+    def run(self):
+        board = Board.objects.filter(owner=self.user).order_by("pk").first()
+        if board is None:
+            raise ValueError(f"{self.user.username} owns no board; seed the benchmark data first.")
+        task = board.tasks.order_by("pk").first()
+        if task is None:
+            raise ValueError(f"Board {board.pk} has no tasks; seed the benchmark data first.")
+        token, _ = Token.objects.get_or_create(user=self.user)
+        self.authorization = f"Token {token.key}"
+
+        results = {}
+        with override_settings(
+            DEBUG=False, KANBAN_RESPONSE_CACHE_TIMEOUT=0,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+        ):
+            for name in self.endpoints:
+                sync_path, async_path = (
+                    path.format(board=board.pk, task=task.pk) for path in THROUGHPUT_ENDPOINTS[name]
+                )
+                results[name] = {
+                    "sync": self._sync(sync_path),
+                    "async": async_to_sync(self._async)(async_path),
+                }
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "commit": git_commit(),
+                "database": connection.vendor,
+                "clients": self.clients,
+                "requests_per_client": self.requests,
+            },
+            "endpoints": results,
+        }
+
+    def _summary(self, statuses, seconds):
+        total = len(statuses)
+        return {
+            "requests": total,
+            "errors": sum(status >= 400 for status in statuses),
+            "seconds": round(seconds, 3),
+            "requests_per_second": round(total / seconds, 1) if seconds else None,
+        }
+
+    def _sync(self, path):
+        def client_loop():
+            client = Client(HTTP_AUTHORIZATION=self.authorization)
+            try:
+                return [client.get(path).status_code for _ in range(self.requests)]
+            finally:
+                connections.close_all()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(self.clients) as pool:
+            statuses = [status for result in pool.map(lambda _: client_loop(), range(self.clients)) for status in result]
+        return self._summary(statuses, time.perf_counter() - started)
+
+    async def _async(self, path):
+        async def client_loop():
+            client = AsyncClient()
+            headers = {"Authorization": self.authorization}
+            return [(await client.get(path, headers=headers)).status_code for _ in range(self.requests)]
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(client_loop() for _ in range(self.clients)))
+        return self._summary([status for result in results for status in result], time.perf_counter() - started)
+
+
+SYLLABLES = ["ka", "ban", "to", "ri", "mel", "sen", "dor", "fa", "lu", "pen", "gri", "sto", "wal", "ze", "mon", "tir"]
+VOCABULARY_SIZE = 5000
+
+
+def search_vocabulary(random_seed=0):
+    """Generated words, most frequent first."""
+    rng = random.Random(random_seed)
+    words = []
+    seen = set()
+    while len(words) < VOCABULARY_SIZE:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def seed_search_comments(count, random_seed=0, batch_size=BATCH_SIZE):
+    """
+    Adds `count` comments of 8 to 20 generated words to the benchmark
+    tasks. Word frequencies follow Zipf's law like natural text, so there
+    are words in nearly every comment and words in a handful. Returns the
+    number of comments created.
+    """
+    rng = random.Random(random_seed)
+    words = search_vocabulary(random_seed)
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    tasks = list(
+        Task.objects.filter(board__owner__email__endswith=f"@{BENCH_DOMAIN}")
+        .order_by("pk").values_list("pk", "board__owner_id")
+    )
+    if not tasks:
+        raise ValueError("There are no generated tasks; seed the benchmark data first.")
+
+    created = 0
+    with transaction.atomic():
+        while created < count:
+            size = min(batch_size, count - created)
+            comments = []
+            for _ in range(size):
+                task_id, owner_id = rng.choice(tasks)
+                text = " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(8, 20)))
+                comments.append(Comment(task_id=task_id, user_id=owner_id, content=text))
+            Comment.objects.bulk_create(comments, batch_size=batch_size)
+            created += size
+    return created
+
+
+def search_queries(random_seed=0):
+    """Queries from very common to rare words, plus a prefix and a two-word query."""
+    words = search_vocabulary(random_seed)
+    return {
+        "common": words[0],
+        "frequent": words[20],
+        "medium": words[300],
+        "rare": words[4000],
+        "prefix": f"{words[300][:4]}*",
+        "two-words": f"{words[20]} {words[300]}",
+    }
+
+
+class SearchRun:
+    """
+    Times /api/search/ for the search_queries() as `user` and reports
+    latency percentiles and hit counts per query.
+    """
+
+    def __init__(self, user, iterations=20, warmup=2, random_seed=0):
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+        self.queries = search_queries(random_seed)
+
+    def run(self):
+        token, _ = Token.objects.get_or_create(user=self.user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        results = {}
+        with override_settings(DEBUG=False, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, query in self.queries.items():
+                timings, status, hits = [], None, 0
+                for i in range(self.warmup + self.iterations):
+                    started = time.perf_counter()
+                    response = client.get("/api/search/", {"q": query})
+                    if i >= self.warmup:
+                        timings.append((time.perf_counter() - started) * 1000)
+                    status = response.status_code
+                    hits = len(response.data.get("results", [])) if status == 200 else 0
+                results[name] = {
+                    "query": query,
+                    "status": status,
+                    "hits_on_first_page": hits,
+                    "p50_ms": round(percentile(timings, 50), 3),
+                    "p95_ms": round(percentile(timings, 95), 3),
+                }
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "commit": git_commit(),
+                "database": connection.vendor,
+                "iterations": self.iterations,
+                "user": self.user.username,
+                "dataset": {"tasks": Task.objects.count(), "comments": Comment.objects.count()},
+            },
+            "queries": results,
+        }
+
+
+def task_payload(tasks=10000, random_seed=0):
+    """
+    A task list as /api/tasks/ returns it, for `tasks` generated tasks
+    with assignees, reviewers and due dates; built without the database.
+    """
+    rng = random.Random(random_seed)
+    users = [
+        {"id": i, "email": f"user{i}@{BENCH_DOMAIN}", "first_name": f"Jürgen{i}", "last_name": f"Müller{i}"}
+        for i in range(1, 51)
+    ]
+    rows = []
+    for i in range(1, tasks + 1):
+        row = {
+            "id": i, "board_id": rng.randint(1, 20), "title": f"Task {i}",
+            "description": " ".join(rng.choice(SYLLABLES) for _ in range(rng.randint(5, 40))),
+            "status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES),
+            "due_date": BASE_DATE + timedelta(days=rng.randint(0, 365)) if rng.random() < 0.7 else None,
+            "comments_count": rng.randint(0, 10),
+        }
+        for prefix in ("assignee", "reviewer"):
+            user = rng.choice(users) if rng.random() < 0.8 else dict.fromkeys(users[0])
+            for field, value in user.items():
+                row[f"{prefix}__{field}"] = value
+        rows.append(task_row_to_dict(row))
+    return rows
+
+
+class RendererRun:
+    """
+    Times rendering and parsing a task_payload() with DRF's JSONRenderer
+    and JSONParser and with FastJSONRenderer and FastJSONParser, and checks
+    that both render the same bytes.
+    """
+
+    def __init__(self, tasks=10000, iterations=20, warmup=2, random_seed=0):
+        self.tasks = tasks
+        self.iterations = iterations
+        self.warmup = warmup
+        self.random_seed = random_seed
+
+    def run(self):
+        data = task_payload(self.tasks, self.random_seed)
+        stacks = {"drf": (JSONRenderer(), JSONParser()), "fast": (FastJSONRenderer(), FastJSONParser())}
+        results, rendered = {}, {}
+        for name, (renderer, parser) in stacks.items():
+            content = rendered[name] = renderer.render(data, "application/json")
+            render = self._time(lambda: renderer.render(data, "application/json"))
+            parse = self._time(lambda: parser.parse(io.BytesIO(content), "application/json", {"encoding": "utf-8"}))
+            results[name] = {
+                "bytes": len(content),
+                "render_p50_ms": round(percentile(render, 50), 3),
+                "render_p95_ms": round(percentile(render, 95), 3),
+                "parse_p50_ms": round(percentile(parse, 50), 3),
+                "parse_p95_ms": round(percentile(parse, 95), 3),
+            }
+        drf, fast = results["drf"], results["fast"]
+        return {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "orjson": orjson.__version__ if orjson is not None else None,
+                "iterations": self.iterations,
+                "tasks": self.tasks,
+            },
+            "renderers": results,
+            "identical": rendered["drf"] == rendered["fast"],
+            "speedup": {
+                "render": round(drf["render_p50_ms"] / max(fast["render_p50_ms"], 0.001), 2),
+                "parse": round(drf["parse_p50_ms"] / max(fast["parse_p50_ms"], 0.001), 2),
+            },
+        }
+
+    def _time(self, call):
+        timings = []
+        for i in range(self.warmup + self.iterations):
+            started = time.perf_counter()
+            call()
+            if i >= self.warmup:
+                timings.append((time.perf_counter() - started) * 1000)
+        return timings
+
+
+def compare(baseline, report):
+    """Yields (endpoint, metric, before, after) for metrics present in both reports."""
+    for name, result in report["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if before is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "queries", "peak_memory_kb"):
+            if metric in before:
+                yield name, metric, before[metric], result[metric]
@@ -0,0 +1,123 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+VERSION_KEY = "kanban:board-version:{}"
+
+
+def get_cache():
+    return caches[getattr(settings, "KANBAN_CACHE_ALIAS", "default")]
+
+
+def _initial_version():
+    # A missing counter (first use or eviction) restarts from the clock, so it
+    # never falls back to a version an older cached response was stored under.
+    return time.time_ns()
+
+
+def board_versions(board_ids):
+    """
+    Returns {board_id: version} for the given boards, initialising counters
+    that are not in the cache yet.
+    """
+    cache = get_cache()
+    keys = {VERSION_KEY.format(board_id): board_id for board_id in board_ids}
+    found = cache.get_many(keys)
+    versions = {keys[key]: version for key, version in found.items()}
+    for key, board_id in keys.items():
+        if key not in found:
+            cache.add(key, _initial_version(), None)
+            versions[board_id] = cache.get(key)
+    return versions
+
+
+def board_version(board_id):
+    return board_versions([board_id])[board_id]
+
+
+def _bump(board_ids):
+    cache = get_cache()
+    for board_id in board_ids:
+        key = VERSION_KEY.format(board_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), None)
+
+
+def bump_board_versions(*board_ids):
+    """
+    Invalidates everything cached for the given boards. The bump runs right
+    away and again on commit, so a response built from uncommitted-but-old
+    data by a concurrent reader never outlives the transaction.
+    """
+    board_ids = {board_id for board_id in board_ids if board_id is not None}
+    if not board_ids:
+        return
+    _bump(board_ids)
+    transaction.on_commit(lambda: _bump(board_ids))
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def snapshot(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+response_cache_stats = CacheStats()
+
+
+def response_cache_key(prefix, versions, request):
+    """
+    Builds a key from the (board, version) pairs a response depends on and
+    the query string, so any write or visibility change yields a new key.
+    """
+    digest = hashlib.sha1()
+    for board_id, version in sorted(versions.items()):
+        digest.update(f"{board_id}:{version};".encode())
+    digest.update(request.META.get("QUERY_STRING", "").encode())
+    return f"kanban:response:{prefix}:{digest.hexdigest()}"
+
+
+def cached_data(key, build):
+    """
+    Returns (data, hit). On a miss the data is built and stored, unless the
+    response cache is disabled with KANBAN_RESPONSE_CACHE_TIMEOUT = 0.
+    """
+    timeout = getattr(settings, "KANBAN_RESPONSE_CACHE_TIMEOUT", 300)
+    if not timeout:
+        return build(), False
+    cache = get_cache()
+    data = cache.get(key)
+    hit = data is not None
+    response_cache_stats.record(hit)
+    if not hit:
+        data = build()
+        cache.set(key, data, timeout)
+    return data, hit
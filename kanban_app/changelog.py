@@ -0,0 +1,158 @@
+"""
+Per-board change log for delta sync (/api/boards/<id>/changes/?since=N).
+
+Every write to a board's content records (kind, object id) under the next
+value of the board's version counter. The log keeps one row per object,
+so an object that changed ten times since a client's version is sent once,
+and the payload grows with what changed, not with the board. Deleted
+objects stay as tombstones until compact() prunes rows older than a
+cutoff; a client whose version predates the pruned range starts over with
+a full snapshot (since=0).
+
+Versions are taken from BoardSyncState under its row lock, so they become
+visible in commit order and "everything after N" never skips a change.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from kanban_app.export import SECTIONS, board_record
+from kanban_app.models import Board, BoardChange, BoardSyncState
+
+# Changed ids are loaded in chunks so a big delta stays under the database's
+# limit on query parameters.
+ID_CHUNK_SIZE = 500
+
+
+class ChangesCompacted(Exception):
+    """The requested version is older than the oldest change still logged."""
+
+    def __init__(self, version):
+        super().__init__(version)
+        self.version = version
+
+
+def _reserve(board_id, count):
+    states = BoardSyncState.objects.filter(board_id=board_id)
+    if not states.update(version=F("version") + count):
+        if not Board.objects.filter(pk=board_id).exists():
+            return None
+        BoardSyncState.objects.get_or_create(board_id=board_id)
+        states.update(version=F("version") + count)
+    return states.values_list("version", flat=True).get()
+
+
+def record_changes(board_id, kind, object_ids, deleted=False):
+    """Logs the objects as changed (or deleted) on the board."""
+    object_ids = sorted(set(object_ids))
+    if board_id is None or not object_ids:
+        return
+    with transaction.atomic(savepoint=False):
+        last = _reserve(board_id, len(object_ids))
+        if last is None:
+            return
+        first = last - len(object_ids) + 1
+        now = timezone.now()
+        BoardChange.objects.bulk_create(
+            [
+                BoardChange(
+                    board_id=board_id, version=first + offset, kind=kind,
+                    object_id=object_id, deleted=deleted, changed_at=now,
+                )
+                for offset, object_id in enumerate(object_ids)
+            ],
+            batch_size=ID_CHUNK_SIZE,
+            update_conflicts=True,
+            unique_fields=["board", "kind", "object_id"],
+            update_fields=["version", "deleted", "changed_at"],
+        )
+
+
+def forget_board(board_id):
+    """
+    Drops a deleted board's log. Rows written while the delete cascaded
+    (its tasks and comments go first) were not collected for deletion, and
+    foreign keys are only checked at commit, so they can still be removed.
+    """
+    BoardChange.objects.filter(board_id=board_id).delete()
+    BoardSyncState.objects.filter(board_id=board_id).delete()
+
+
+def record_objects(kind, objects, deleted=False):
+    """Logs model instances with a board_id, grouped by board."""
+    by_board = defaultdict(set)
+    for obj in objects:
+        by_board[obj.board_id].add(obj.pk)
+    for board_id, object_ids in by_board.items():
+        record_changes(board_id, kind, object_ids, deleted)
+
+
+def _records(board, records, ids):
+    found = []
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        found.extend(records(board, ids[start:start + ID_CHUNK_SIZE]))
+    return found
+
+
+def changes_since(board, since):
+    """
+    Returns the board's changes after version `since` as upserted records
+    (in the export format) plus the ids of deleted objects. since=0 returns
+    a full snapshot. Raises ChangesCompacted when `since` is too old.
+    """
+    version, compacted = (
+        BoardSyncState.objects.filter(board_id=board.pk)
+        .values_list("version", "compacted_version").first()
+    ) or (0, 0)
+    data = {"version": version, "full": since == 0}
+    if since == 0:
+        data["board"] = board_record(board)
+        for _, section, records in SECTIONS:
+            data[section] = list(records(board))
+        data["deleted"] = {section: [] for _, section, _ in SECTIONS}
+        return data
+    if since < compacted or since > version:
+        raise ChangesCompacted(version)
+
+    upserted, deleted = defaultdict(list), defaultdict(list)
+    changes = (
+        BoardChange.objects.filter(board_id=board.pk, version__gt=since)
+        .order_by("version")
+        .values_list("kind", "object_id", "deleted")
+    )
+    for kind, object_id, is_deleted in changes:
+        (deleted if is_deleted else upserted)[kind].append(object_id)
+
+    if upserted.pop("board", None):
+        data["board"] = board_record(board)
+    for kind, section, records in SECTIONS:
+        ids = upserted.get(kind, [])
+        data[section] = _records(board, records, ids) if ids else []
+        # Rows that are gone by now (a task's comments after the task was
+        # deleted, a task moved to another board) count as deleted.
+        missing = set(ids) - {record["id"] for record in data[section]}
+        data.setdefault("deleted", {})[section] = sorted(set(deleted[kind]) | missing)
+    return data
+
+
+def compact(before):
+    """
+    Prunes log rows last written before `before`. Returns the number of
+    rows removed.
+    """
+    horizons = (
+        BoardChange.objects.filter(changed_at__lt=before)
+        .values("board_id")
+        .annotate(horizon=Max("version"))
+        .values_list("board_id", "horizon")
+    )
+    removed = 0
+    for board_id, horizon in horizons:
+        with transaction.atomic():
+            BoardSyncState.objects.filter(
+                board_id=board_id, compacted_version__lt=horizon,
+            ).update(compacted_version=horizon)
+            removed += BoardChange.objects.filter(board_id=board_id, version__lte=horizon).delete()[0]
+    return removed
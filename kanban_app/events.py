@@ -0,0 +1,242 @@
+"""
+Board change events for the Server-Sent Events feed at
+/api/boards/<id>/events/.
+
+Write paths publish small deltas ("task.updated", "comment.added", ...)
+with publish(), which hands them to the configured backend once the
+transaction commits. Event ids count up from 1 per board, and the backend
+keeps the last KANBAN_EVENTS_BUFFER_SIZE events of every board so a client
+reconnecting with Last-Event-ID gets exactly what it missed.
+
+InMemoryEventBackend only reaches subscribers in the publishing process.
+With several workers set KANBAN_EVENTS_BACKEND to CacheEventBackend, which
+keeps the events in the shared cache and lets subscribers poll it.
+"""
+import asyncio
+import threading
+from collections import deque
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from kanban_app.cache import get_cache
+
+
+class Event:
+    __slots__ = ("id", "board_id", "type", "data")
+
+    def __init__(self, id, board_id, type, data):
+        self.id = id
+        self.board_id = board_id
+        self.type = type
+        self.data = data
+
+    def __repr__(self):
+        return f"<Event {self.board_id}#{self.id} {self.type}>"
+
+
+class _QueueSubscription:
+    """Receives a board's events on the event loop it was created in."""
+
+    def __init__(self, backend, board_id, maxsize):
+        self._backend = backend
+        self._board_id = board_id
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, event):
+        # Called from whichever thread published the event.
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            self.close()
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def next(self, timeout):
+        """Returns the next event, or None when none arrived within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self._backend._unsubscribe(self._board_id, self)
+
+
+class InMemoryEventBackend:
+    def __init__(self, buffer_size=500):
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._last_ids = {}
+        self._buffers = {}
+        self._subscribers = {}
+
+    def publish(self, board_id, type, data):
+        with self._lock:
+            event = Event(self._last_ids.get(board_id, 0) + 1, board_id, type, data)
+            self._last_ids[board_id] = event.id
+            buffer = self._buffers.get(board_id)
+            if buffer is None:
+                buffer = self._buffers[board_id] = deque(maxlen=self.buffer_size)
+            buffer.append(event)
+            subscribers = list(self._subscribers.get(board_id, ()))
+            if type == "board.deleted":
+                # Open streams still get the event; nobody can replay it.
+                del self._buffers[board_id], self._last_ids[board_id]
+        for subscription in subscribers:
+            subscription.deliver(event)
+        return event
+
+    def last_id(self, board_id):
+        with self._lock:
+            return self._last_ids.get(board_id, 0)
+
+    def replay(self, board_id, after):
+        """
+        Returns the events after id `after`, or None when some of them are
+        no longer buffered (or `after` is not an id this backend issued).
+        """
+        with self._lock:
+            last_id = self._last_ids.get(board_id, 0)
+            buffer = list(self._buffers.get(board_id, ()))
+        if after > last_id:
+            return None
+        if after == last_id:
+            return []
+        if buffer[0].id > after + 1:
+            return None
+        return [event for event in buffer if event.id > after]
+
+    def subscribe(self, board_id):
+        """Must be called from the event loop that will consume the events."""
+        subscription = _QueueSubscription(self, board_id, self.buffer_size)
+        with self._lock:
+            self._subscribers.setdefault(board_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, board_id, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(board_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[board_id]
+
+
+class _PollingSubscription:
+    def __init__(self, backend, board_id):
+        self._backend = backend
+        self._board_id = board_id
+        self._seen = backend.last_id(board_id)
+        self._pending = deque()
+        self.overflowed = False
+
+    async def next(self, timeout):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not self._pending:
+            events = await sync_to_async(self._backend.replay, thread_sensitive=False)(self._board_id, self._seen)
+            if events is None:
+                self.overflowed = True
+                return None
+            if events:
+                self._pending.extend(events)
+                self._seen = events[-1].id
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(self._backend.poll_interval, remaining))
+        return self._pending.popleft()
+
+    def close(self):
+        pass
+
+
+class CacheEventBackend:
+    """
+    Keeps the event buffers in the KANBAN_CACHE_ALIAS cache, so every
+    process sees every event. The cache has to be shared (Redis, Memcached,
+    database); subscribers poll it every `poll_interval` seconds.
+    """
+
+    LAST_ID_KEY = "kanban:events:{}:last"
+    EVENT_KEY = "kanban:events:{}:{}"
+
+    def __init__(self, buffer_size=500, poll_interval=1.0, timeout=86400):
+        self.buffer_size = buffer_size
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def publish(self, board_id, type, data):
+        cache = get_cache()
+        key = self.LAST_ID_KEY.format(board_id)
+        cache.add(key, 0, None)
+        event = Event(cache.incr(key), board_id, type, data)
+        cache.set(self.EVENT_KEY.format(board_id, event.id), (type, data), self.timeout)
+        return event
+
+    def last_id(self, board_id):
+        return get_cache().get(self.LAST_ID_KEY.format(board_id), 0)
+
+    def replay(self, board_id, after):
+        last_id = self.last_id(board_id)
+        if after > last_id or last_id - after > self.buffer_size:
+            return None
+        keys = {self.EVENT_KEY.format(board_id, event_id): event_id for event_id in range(after + 1, last_id + 1)}
+        found = get_cache().get_many(keys)
+        if len(found) != len(keys):
+            return None
+        return [Event(event_id, board_id, *found[key]) for key, event_id in keys.items()]
+
+    def subscribe(self, board_id):
+        return _PollingSubscription(self, board_id)
+
+
+@lru_cache(maxsize=None)
+def get_backend():
+    backend = import_string(getattr(settings, "KANBAN_EVENTS_BACKEND", "kanban_app.events.InMemoryEventBackend"))
+    return backend(buffer_size=getattr(settings, "KANBAN_EVENTS_BUFFER_SIZE", 500))
+
+
+@receiver(setting_changed)
+def _reset_backend(setting, **kwargs):
+    if setting in ("KANBAN_EVENTS_BACKEND", "KANBAN_EVENTS_BUFFER_SIZE"):
+        get_backend.cache_clear()
+
+
+def publish(board_id, type, data):
+    """Publishes an event for the board once the current transaction commits."""
+    if board_id is None:
+        return
+    transaction.on_commit(lambda: get_backend().publish(board_id, type, data), robust=True)
+
+
+def task_data(task):
+    return {
+        "id": task.pk,
+        "board": task.board_id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "priority": task.priority,
+        "assignee_id": task.assignee_id,
+        "reviewer_id": task.reviewer_id,
+        "due_date": task.due_date,
+    }
+
+
+def publish_tasks(type, tasks):
+    for task in tasks:
+        publish(task.board_id, type, task_data(task))
@@ -0,0 +1,149 @@
+"""
+Streaming export of a whole board.
+
+NDJSON output has one record per line, each shaped {"type": ..., "data": ...}:
+the board first, then its members, columns, tasks and comments. The JSON
+output is one document with the same records grouped into lists. Rows are
+read with .iterator(), so memory stays flat no matter how big the board is.
+The record builders take optional ids, which the change log uses to load
+only the changed rows.
+"""
+from rest_framework.utils.encoders import JSONEncoder
+
+from kanban_app.models import Board, Column, Comment, Task
+
+CHUNK_SIZE = 2000
+# Lines are joined into write buffers of roughly this many characters.
+BUFFER_SIZE = 64 * 1024
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _fullname(first_name, last_name):
+    return f"{first_name} {last_name}".strip()
+
+
+def board_record(board):
+    return {
+        "id": board.pk,
+        "title": board.title,
+        "description": board.description,
+        "owner_id": board.owner_id,
+        "owner_email": board.owner.email,
+        "created_at": board.created_at,
+        "updated_at": board.updated_at,
+    }
+
+
+def _only(queryset, ids, field="pk"):
+    return queryset if ids is None else queryset.filter(**{f"{field}__in": ids})
+
+
+def member_records(board, ids=None):
+    users = (
+        _only(Board.members.through.objects.filter(board_id=board.pk), ids, "user_id")
+        .order_by("user_id")
+        .values_list("user_id", "user__email", "user__first_name", "user__last_name")
+    )
+    for user_id, email, first_name, last_name in users.iterator(chunk_size=CHUNK_SIZE):
+        yield {"id": user_id, "email": email, "fullname": _fullname(first_name, last_name)}
+
+
+def column_records(board, ids=None):
+    columns = _only(Column.objects.filter(board_id=board.pk), ids).values_list("id", "title", "order")
+    for column_id, title, order in columns.iterator(chunk_size=CHUNK_SIZE):
+        yield {"id": column_id, "title": title, "position": order, "board": board.pk}
+
+
+def task_records(board, ids=None):
+    tasks = (
+        _only(Task.objects.filter(board_id=board.pk), ids)
+        .order_by("pk")
+        .values_list(
+            "id", "title", "description", "status", "priority",
+            "assignee_id", "assignee__email", "reviewer_id", "reviewer__email", "due_date",
+        )
+    )
+    for row in tasks.iterator(chunk_size=CHUNK_SIZE):
+        (task_id, title, description, status, priority,
+         assignee_id, assignee_email, reviewer_id, reviewer_email, due_date) = row
+        yield {
+            "id": task_id,
+            "board": board.pk,
+            "title": title,
+            "description": description,
+            "status": status,
+            "priority": priority,
+            "assignee_id": assignee_id,
+            "assignee_email": assignee_email,
+            "reviewer_id": reviewer_id,
+            "reviewer_email": reviewer_email,
+            "due_date": due_date,
+        }
+
+
+def comment_records(board, ids=None):
+    comments = (
+        _only(Comment.objects.filter(task__board_id=board.pk), ids)
+        .order_by("task_id", "pk")
+        .values_list(
+            "id", "task_id", "user_id", "user__email", "user__first_name", "user__last_name",
+            "content", "created_at",
+        )
+    )
+    for row in comments.iterator(chunk_size=CHUNK_SIZE):
+        comment_id, task_id, user_id, email, first_name, last_name, content, created_at = row
+        yield {
+            "id": comment_id,
+            "task": task_id,
+            "author_id": user_id,
+            "author_email": email,
+            "author": _fullname(first_name, last_name),
+            "content": content,
+            "created_at": created_at,
+        }
+
+
+SECTIONS = [
+    ("member", "members", member_records),
+    ("column", "columns", column_records),
+    ("task", "tasks", task_records),
+    ("comment", "comments", comment_records),
+]
+
+
+def _buffered(parts):
+    buffer, size = [], 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _ndjson_parts(board):
+    yield _encoder.encode({"type": "board", "data": board_record(board)}) + "\n"
+    for record_type, _, records in SECTIONS:
+        for record in records(board):
+            yield _encoder.encode({"type": record_type, "data": record}) + "\n"
+
+
+def _json_parts(board):
+    yield '{"board":' + _encoder.encode(board_record(board))
+    for _, section, records in SECTIONS:
+        yield f',"{section}":['
+        separator = ""
+        for record in records(board):
+            yield separator + _encoder.encode(record)
+            separator = ","
+        yield "]"
+    yield "}\n"
+
+
+def export_board(board, output="ndjson"):
+    """Yields the export of `board` as text chunks in the given format."""
+    parts = _json_parts(board) if output == "json" else _ndjson_parts(board)
+    return _buffered(parts)
@@ -0,0 +1,256 @@
+"""
+Batched import of boards in the export format (see kanban_app.export).
+
+Records are consumed as a stream and written with bulk_create in batches of
+`batch_size`, so only one batch per record type is held in memory. Users
+are matched by email; every batch resolves the emails it has not seen yet
+in a single query. Exported ids are only used to link records together,
+new rows get new ids. Comment timestamps are set at import time.
+"""
+import json
+import time
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from kanban_app import stats
+from kanban_app.api.serializers import PRIORITY_CHOICES, STATUS_CHOICES
+from kanban_app.models import Board, Column, Comment, Task
+from kanban_app.signals import boards_changed
+
+BATCH_SIZE = 1000
+STATUSES = {value for value, _ in STATUS_CHOICES}
+PRIORITIES = {value for value, _ in PRIORITY_CHOICES}
+
+
+class BoardImportError(ValueError):
+    pass
+
+
+def ndjson_records(lines):
+    """Parses NDJSON lines (str or bytes) into {"type", "data"} records."""
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise BoardImportError(f"Line {number}: invalid JSON ({exc}).")
+        if not isinstance(record, dict) or not isinstance(record.get("data"), dict):
+            raise BoardImportError(f'Line {number}: expected {{"type": ..., "data": {{...}}}}.')
+        yield record
+
+
+def json_document_records(document):
+    """Turns a single-document export into the same record stream."""
+    if not isinstance(document, dict) or not isinstance(document.get("board"), dict):
+        raise BoardImportError('Expected a document with a "board" object.')
+    yield {"type": "board", "data": document["board"]}
+    for record_type, section in [("member", "members"), ("column", "columns"),
+                                 ("task", "tasks"), ("comment", "comments")]:
+        for data in document.get(section) or []:
+            if not isinstance(data, dict):
+                raise BoardImportError(f'Entries of "{section}" must be objects.')
+            yield {"type": record_type, "data": data}
+
+
+def _is_id(value):
+    """Exported ids only link records; they have to be numbers or strings."""
+    return value is None or isinstance(value, (int, str)) and not isinstance(value, bool)
+
+
+def _text(value):
+    return value if isinstance(value, str) else str(value) if value else ""
+
+
+class BoardImporter:
+    def __init__(self, owner, batch_size=BATCH_SIZE):
+        self.owner = owner
+        self.batch_size = batch_size
+        self.board = None
+        self.rows = 0
+        self.skipped = {}
+        self._user_ids = {}
+        self._member_ids = {owner.pk}
+        self._task_ids = {}
+        self._pending = {"member": [], "column": [], "task": [], "comment": []}
+
+    def run(self, records):
+        """Imports the records into a new board owned by `owner`; returns a report."""
+        started = time.perf_counter()
+        with transaction.atomic():
+            for record in records:
+                self._add(record)
+            if self.board is None:
+                raise BoardImportError("The import contains no board record.")
+            for record_type in self._pending:
+                self._flush(record_type)
+            stats.rebuild([self.board.pk])
+            boards_changed(self.board.pk)
+        seconds = time.perf_counter() - started
+        return {
+            "board": self.board.pk,
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(self.rows / seconds) if seconds else self.rows,
+        }
+
+    def _add(self, record):
+        record_type, data = record.get("type"), record["data"]
+        if record_type == "board":
+            if self.board is not None:
+                raise BoardImportError("Only one board can be imported at a time.")
+            self.board = Board.objects.create(
+                title=str(data.get("title") or "Import")[:50],
+                description=_text(data.get("description"))[:255],
+                owner=self.owner,
+            )
+            self.rows += 1
+            return
+        if record_type not in self._pending:
+            raise BoardImportError(f"Unknown record type {record_type!r}.")
+        if self.board is None:
+            raise BoardImportError("The board record must come first.")
+        # Later sections depend on earlier ones (task assignees on members,
+        # comments on the new task ids), so those are written first.
+        for earlier in self._pending:
+            if earlier == record_type:
+                break
+            self._flush(earlier)
+        pending = self._pending[record_type]
+        pending.append(data)
+        if len(pending) >= self.batch_size:
+            self._flush(record_type)
+
+    def _skip(self, reason):
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def _resolve_emails(self, emails):
+        emails = {email.lower() for email in emails if isinstance(email, str) and email}
+        missing = emails - set(self._user_ids)
+        if missing:
+            found = {}
+            for user_id, email in User.objects.filter(email__in=missing).values_list("pk", "email"):
+                found.setdefault(email.lower(), user_id)
+            for email in missing:
+                self._user_ids[email] = found.get(email)
+
+    def _user_id(self, email):
+        if not isinstance(email, str) or not email:
+            return None
+        return self._user_ids.get(email.lower())
+
+    def _member_id(self, email):
+        user_id = self._user_id(email)
+        return user_id if user_id in self._member_ids else None
+
+    def _due_date(self, value):
+        if not value:
+            return None
+        try:
+            due_date = parse_date(str(value))
+        except ValueError:
+            due_date = None
+        if due_date is None:
+            raise BoardImportError(f"Invalid due_date {value!r}.")
+        return due_date
+
+    def _flush(self, record_type):
+        pending = self._pending[record_type]
+        if not pending:
+            return
+        self._pending[record_type] = []
+        getattr(self, f"_flush_{record_type}s")(pending)
+
+    def _flush_members(self, rows):
+        self._resolve_emails(row.get("email") for row in rows)
+        user_ids = set()
+        for row in rows:
+            user_id = self._user_id(row.get("email"))
+            if user_id is None:
+                self._skip("unknown member email")
+            elif user_id != self.owner.pk:
+                user_ids.add(user_id)
+        user_ids -= self._member_ids
+        Board.members.through.objects.bulk_create(
+            [Board.members.through(board_id=self.board.pk, user_id=user_id) for user_id in user_ids],
+            batch_size=self.batch_size,
+        )
+        self._member_ids |= user_ids
+        self.rows += len(user_ids)
+
+    def _flush_columns(self, rows):
+        columns = []
+        for row in rows:
+            try:
+                order = int(row.get("position", row.get("order")))
+            except (TypeError, ValueError):
+                self._skip("column without position")
+                continue
+            columns.append(Column(board=self.board, title=str(row.get("title") or "")[:50], order=order))
+        Column.objects.bulk_create(columns, batch_size=self.batch_size)
+        self.rows += len(columns)
+
+    def _flush_tasks(self, rows):
+        self._resolve_emails(
+            email for row in rows for email in (row.get("assignee_email"), row.get("reviewer_email"))
+        )
+        tasks, old_ids = [], []
+        for row in rows:
+            if not row.get("title"):
+                self._skip("task without title")
+                continue
+            status = row.get("status") or "to-do"
+            priority = row.get("priority") or "medium"
+            if not isinstance(status, str) or status not in STATUSES:
+                self._skip("invalid status")
+                continue
+            if not isinstance(priority, str) or priority not in PRIORITIES:
+                self._skip("invalid priority")
+                continue
+            if not _is_id(row.get("id")):
+                self._skip("invalid task id")
+                continue
+            assignee_id = self._member_id(row.get("assignee_email"))
+            reviewer_id = self._member_id(row.get("reviewer_email"))
+            if row.get("assignee_email") and assignee_id is None:
+                self._skip("assignee not on board")
+            if row.get("reviewer_email") and reviewer_id is None:
+                self._skip("reviewer not on board")
+            task = Task(
+                board=self.board,
+                title=str(row["title"])[:100],
+                description=_text(row.get("description")),
+                status=status,
+                priority=priority,
+                assignee_id=assignee_id,
+                reviewer_id=reviewer_id,
+                due_date=self._due_date(row.get("due_date")),
+            )
+            task.track_done()
+            tasks.append(task)
+            old_ids.append(row.get("id"))
+        Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+        for old_id, task in zip(old_ids, tasks):
+            if old_id is not None:
+                self._task_ids[old_id] = task.pk
+        self.rows += len(tasks)
+
+    def _flush_comments(self, rows):
+        self._resolve_emails(row.get("author_email") for row in rows)
+        comments = []
+        for row in rows:
+            task_id = self._task_ids.get(row.get("task")) if _is_id(row.get("task")) else None
+            if task_id is None:
+                self._skip("comment for unknown task")
+                continue
+            comments.append(Comment(
+                task_id=task_id,
+                user_id=self._user_id(row.get("author_email")) or self.owner.pk,
+                content=_text(row.get("content")),
+            ))
+        Comment.objects.bulk_create(comments, batch_size=self.batch_size)
+        self.rows += len(comments)
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from kanban_app import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves tasks that have been done for more than --older-than days, with "
+        "their comments, into the archive tables, in chunks of --chunk-size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than", type=int, default=90, help="Archive tasks done more than N days ago (default: 90).",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=archive.CHUNK_SIZE,
+            help=f"Tasks moved per transaction (default: {archive.CHUNK_SIZE}).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only count the tasks that would be archived.")
+
+    def handle(self, *args, **options):
+        if options["older_than"] < 0 or options["chunk_size"] < 1:
+            raise CommandError("--older-than must not be negative and --chunk-size must be at least 1.")
+        before = timezone.now() - timedelta(days=options["older_than"])
+        if options["dry_run"]:
+            self.stdout.write(f"{archive.archivable(before).count()} task(s) would be archived.")
+            return
+        tasks, comments = archive.archive_done_tasks(before, chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {tasks} task(s) and {comments} comment(s)."))
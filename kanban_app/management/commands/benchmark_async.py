@@ -0,0 +1,60 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares concurrent-client throughput of the sync read endpoints "
+        "(WSGI test client, one thread per client) and their /api/async/ "
+        "variants (ASGI test client, one coroutine per client)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=16, help="Concurrent clients (default: 16).")
+        parser.add_argument("--requests", type=int, default=25, help="Requests per client (default: 25).")
+        parser.add_argument(
+            "--endpoint", action="append", choices=list(benchmark.THROUGHPUT_ENDPOINTS),
+            help="Endpoint to compare (repeatable, default: all).",
+        )
+        parser.add_argument("--user", help="Username to call the endpoints as (default: first generated board owner).")
+        parser.add_argument("--output", help="Also write the results to this JSON file.")
+
+    def handle(self, *args, **options):
+        if options["clients"] < 1 or options["requests"] < 1:
+            raise CommandError("--clients and --requests must be at least 1.")
+        user = self._get_user(options["user"])
+        try:
+            report = benchmark.ThroughputRun(
+                user, clients=options["clients"], requests=options["requests"], endpoints=options["endpoint"],
+            ).run()
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for name, result in report["endpoints"].items():
+            sync, async_ = result["sync"], result["async"]
+            line = (
+                f"{name:<22} sync {sync['requests_per_second']:>8} req/s   "
+                f"async {async_['requests_per_second']:>8} req/s"
+            )
+            errors = sync["errors"] + async_["errors"]
+            self.stdout.write(self.style.ERROR(f"{line}   {errors} errors") if errors else line)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+
+    def _get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User {username!r} does not exist.")
+            return user
+        user = benchmark.benchmark_users().filter(boards__isnull=False).order_by("pk").first()
+        if user is None:
+            raise CommandError("No generated user owns a board; run seed_benchmark first.")
+        return user
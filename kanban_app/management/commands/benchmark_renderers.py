@@ -0,0 +1,44 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares DRF's JSON renderer and parser with the orjson-based ones "
+        "on a generated task list (no database needed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=10000, help="Tasks in the payload (default: 10000).")
+        parser.add_argument("--iterations", type=int, default=20, help="Timed runs per renderer (default: 20).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+        parser.add_argument("--output", help="Also write the results to this JSON file.")
+
+    def handle(self, *args, **options):
+        if options["tasks"] < 1 or options["iterations"] < 1:
+            raise CommandError("--tasks and --iterations must be at least 1.")
+        report = benchmark.RendererRun(
+            tasks=options["tasks"], iterations=options["iterations"], random_seed=options["seed"],
+        ).run()
+
+        meta = report["meta"]
+        orjson = f"orjson {meta['orjson']}" if meta["orjson"] else "orjson not installed, stdlib fallback"
+        self.stdout.write(f"{meta['tasks']} tasks ({orjson})")
+        for name, result in report["renderers"].items():
+            self.stdout.write(
+                f"{name:<5} {result['bytes']:>10} bytes   "
+                f"render p50 {result['render_p50_ms']:>9} ms  p95 {result['render_p95_ms']:>9} ms   "
+                f"parse p50 {result['parse_p50_ms']:>9} ms  p95 {result['parse_p95_ms']:>9} ms"
+            )
+        speedup = report["speedup"]
+        self.stdout.write(f"speedup: render {speedup['render']}x, parse {speedup['parse']}x")
+        if not report["identical"]:
+            self.stdout.write(self.style.ERROR("The renderers produced different output."))
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}."))
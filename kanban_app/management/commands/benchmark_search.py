@@ -0,0 +1,58 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Times /api/search/ for common, rare, prefix and two-word queries. "
+        "--add-comments first generates that many comments of searchable text "
+        "on the benchmark tasks (run seed_benchmark before)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--add-comments", type=int, default=0, help="Comments to generate first (default: 0).")
+        parser.add_argument("--iterations", type=int, default=20, help="Timed requests per query (default: 20).")
+        parser.add_argument("--user", help="Username to search as (default: first generated board owner).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+        parser.add_argument("--output", help="Also write the results to this JSON file.")
+
+    def handle(self, *args, **options):
+        if options["add_comments"] < 0 or options["iterations"] < 1:
+            raise CommandError("--add-comments must not be negative and --iterations must be at least 1.")
+        user = self._get_user(options["user"])
+        if options["add_comments"]:
+            try:
+                created = benchmark.seed_search_comments(options["add_comments"], random_seed=options["seed"])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(f"Created {created} comments.")
+
+        report = benchmark.SearchRun(user, iterations=options["iterations"], random_seed=options["seed"]).run()
+        dataset = report["meta"]["dataset"]
+        self.stdout.write(f"{dataset['tasks']} tasks, {dataset['comments']} comments ({report['meta']['database']})")
+        for name, result in report["queries"].items():
+            line = (
+                f"{name:<10} {result['query']!r:<24} p50 {result['p50_ms']:>9} ms   "
+                f"p95 {result['p95_ms']:>9} ms   {result['hits_on_first_page']} hits"
+            )
+            self.stdout.write(self.style.ERROR(f"{line}   status {result['status']}") if result["status"] != 200 else line)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(report, handle, indent=2)
+                handle.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+
+    def _get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User {username!r} does not exist.")
+            return user
+        user = benchmark.benchmark_users().filter(boards__isnull=False).order_by("pk").first()
+        if user is None:
+            raise CommandError("No generated user owns a board; run seed_benchmark first.")
+        return user
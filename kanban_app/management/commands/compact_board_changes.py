@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from kanban_app.changelog import compact
+
+
+class Command(BaseCommand):
+    help = (
+        "Prunes board change log rows older than --days. Clients that last "
+        "synced before the pruned range get 410 and resync from scratch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Keep changes of the last N days (default: 30).")
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        removed = compact(timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} change log rows."))
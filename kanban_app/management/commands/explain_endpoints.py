@@ -0,0 +1,114 @@
+import re
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from kanban_app.api.access import visible_boards
+from kanban_app.models import Task
+
+# Plan lines that mean a whole table is read or a sort has no index to use.
+# SQLite also reports "SCAN t USING INDEX i" for full walks of an index,
+# which grow with the table just the same.
+FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (?!CONSTANT)(\w+)"),
+    "postgresql": re.compile(r"\bSeq Scan on (\w+)"),
+}
+TEMP_SORT_PATTERN = re.compile(r"USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)")
+
+
+class Command(BaseCommand):
+    help = (
+        "Calls every read endpoint as the given user, runs EXPLAIN on each SQL "
+        "statement it issues and flags full table scans."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Username to call the endpoints as (default: first user with a board).")
+        parser.add_argument("--fail-on-scan", action="store_true", help="Exit with an error when a full scan is found.")
+        parser.add_argument("--ignore-table", action="append", default=[], help="Table whose scans are expected (repeatable).")
+
+    def handle(self, *args, **options):
+        user = self._get_user(options["user"])
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"EXPLAIN parsing is not supported for {connection.vendor}.")
+
+        flagged = 0
+        for url in self._endpoints(user):
+            statements = self._capture(user, url)
+            self.stdout.write(self.style.MIGRATE_HEADING(f"GET {url} ({len(statements)} queries)"))
+            for sql in statements:
+                plan = self._explain(sql)
+                scans = [table for table in pattern.findall(plan) if table not in options["ignore_table"]]
+                sorts = TEMP_SORT_PATTERN.findall(plan)
+                if scans:
+                    flagged += 1
+                    self.stdout.write(self.style.ERROR(f"  full scan of {', '.join(sorted(set(scans)))}"))
+                elif sorts:
+                    self.stdout.write(self.style.WARNING(f"  temporary sort for {', '.join(sorts)}"))
+                else:
+                    self.stdout.write(self.style.SUCCESS("  ok"))
+                if scans or sorts or options["verbosity"] > 1:
+                    self.stdout.write(f"    {sql}")
+                    for line in plan.splitlines():
+                        self.stdout.write(f"      {line}")
+
+        if flagged and options["fail_on_scan"]:
+            raise CommandError(f"{flagged} queries read a whole table.")
+        self.stdout.write(f"{flagged} queries with full table scans.")
+
+    def _get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User {username!r} does not exist.")
+            return user
+        user = User.objects.filter(boards__isnull=False).order_by("pk").first()
+        if user is None:
+            raise CommandError("No user owns a board yet; seed some data first.")
+        return user
+
+    def _endpoints(self, user):
+        urls = [
+            "/api/boards/",
+            "/api/columns/",
+            "/api/tasks/",
+            "/api/tasks/assigned-to-me/",
+            "/api/tasks/reviewing/",
+        ]
+        board = visible_boards(user).order_by("pk").first()
+        if board is not None:
+            urls.append(f"/api/boards/{board.pk}/")
+            urls.append(f"/api/columns/?board={board.pk}")
+        task = Task.objects.filter(board__in=visible_boards(user)).order_by("pk").first()
+        if task is not None:
+            urls.append(f"/api/tasks/{task.pk}/")
+            urls.append(f"/api/tasks/{task.pk}/comments/")
+        return urls
+
+    def _capture(self, user, url):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        # The response cache would hide the queries behind a warm entry.
+        with override_settings(
+            KANBAN_RESPONSE_CACHE_TIMEOUT=0,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+        ):
+            with CaptureQueriesContext(connection) as ctx:
+                response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} returned {response.status_code}.")
+        return [
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].lstrip().upper().startswith("SELECT")
+        ]
+
+    def _explain(self, sql):
+        prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql)
+            return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
@@ -0,0 +1,48 @@
+import json
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app.importer import BATCH_SIZE, BoardImporter, json_document_records, ndjson_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports a board from an NDJSON or JSON file in the export format. "
+        "Rows are inserted in batches inside one transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for stdin.")
+        parser.add_argument("--owner", required=True, help="Username that will own the imported board.")
+        parser.add_argument("--format", choices=["ndjson", "json"], help="Input format (default: from the file extension).")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=f"Rows per insert batch (default: {BATCH_SIZE}).")
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['owner']!r} does not exist.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        path = options["path"]
+        output = options["format"] or ("json" if path.endswith(".json") else "ndjson")
+        source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            with source:
+                if output == "json":
+                    records = json_document_records(json.load(source))
+                else:
+                    records = ndjson_records(source)
+                report = BoardImporter(owner, batch_size=options["batch_size"]).run(records)
+        except ValueError as exc:  # BoardImportError and malformed JSON alike
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported board {report['board']}: {report['rows']} rows in {report['seconds']}s "
+            f"({report['rows_per_second']} rows/s)."
+        ))
+        for reason, count in sorted(report["skipped"].items()):
+            self.stdout.write(self.style.WARNING(f"  skipped {count}: {reason}"))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from kanban_app.cache import bump_board_versions
+from kanban_app.stats import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recounts the materialised task counters of boards from their tasks and repairs drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("board_ids", nargs="*", type=int, help="Boards to recount (default: all).")
+
+    def handle(self, *args, **options):
+        repaired = rebuild(options["board_ids"] or None)
+        # Cached board lists may hold the wrong counts.
+        bump_board_versions(*repaired)
+        self.stdout.write(self.style.SUCCESS(f"Repaired the counters of {len(repaired)} board(s)."))
@@ -0,0 +1,82 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Calls every API endpoint through the test client and writes p50/p95 "
+        "latency, query count and peak memory per endpoint to a JSON report. "
+        "Writes made during the run are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default="benchmark.json", help="Report file (default: benchmark.json).")
+        parser.add_argument("--iterations", type=int, default=30, help="Timed calls per endpoint (default: 30).")
+        parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per endpoint first (default: 3).")
+        parser.add_argument("--user", help="Username to call the endpoints as (default: first generated board owner).")
+        parser.add_argument("--response-cache", action="store_true", help="Keep the response cache enabled.")
+        parser.add_argument("--compare", help="Earlier report to print the differences against.")
+        parser.add_argument(
+            "--threshold", type=float, default=10.0,
+            help="Smallest timing or memory change in percent that --compare prints (default: 10).",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1 or options["warmup"] < 0:
+            raise CommandError("--iterations must be at least 1 and --warmup not negative.")
+        baseline = self._load(options["compare"]) if options["compare"] else None
+        user = self._get_user(options["user"])
+
+        try:
+            report = benchmark.BenchmarkRun(
+                user, iterations=options["iterations"], warmup=options["warmup"],
+                response_cache=options["response_cache"],
+            ).run()
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        with open(options["output"], "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+
+        for name, result in report["endpoints"].items():
+            line = (
+                f"{result['method']:<6} {name:<28} p50 {result['p50_ms']:>9.2f} ms  "
+                f"p95 {result['p95_ms']:>9.2f} ms  {result['queries']:>4} queries  "
+                f"{result['peak_memory_kb']:>9.1f} KiB"
+            )
+            self.stdout.write(self.style.ERROR(line) if result["errors"] else line)
+        if baseline is not None:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"Compared to {options['compare']}:"))
+            for name, metric, before, after in benchmark.compare(baseline, report):
+                if before == after:
+                    continue
+                change = (after - before) / before if before else None
+                # Query counts are exact, timings and memory are noisy.
+                if metric != "queries" and change is not None and abs(change) * 100 < options["threshold"]:
+                    continue
+                suffix = f" ({change:+.0%})" if change is not None else ""
+                self.stdout.write(f"  {name} {metric}: {before} -> {after}{suffix}")
+        self.stdout.write(self.style.SUCCESS(f"Report written to {options['output']}."))
+
+    def _load(self, path):
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+
+    def _get_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User {username!r} does not exist.")
+            return user
+        user = benchmark.benchmark_users().filter(boards__isnull=False).order_by("pk").first()
+        if user is None:
+            raise CommandError("No generated user owns a board; run seed_benchmark first.")
+        return user
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a reproducible benchmark data set: users, boards with members, "
+        f"columns, tasks and comments. Generated users use the @{benchmark.BENCH_DOMAIN} "
+        f"domain and the password {benchmark.BENCH_PASSWORD!r}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=50)
+        parser.add_argument("--boards", type=int, default=20)
+        parser.add_argument("--members-per-board", type=int, default=5)
+        parser.add_argument("--columns-per-board", type=int, default=4)
+        parser.add_argument("--tasks-per-board", type=int, default=100)
+        parser.add_argument("--comments-per-task", type=int, default=2)
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+        parser.add_argument("--clear", action="store_true", help="Delete previously generated data first.")
+
+    def handle(self, *args, **options):
+        sizes = {
+            name: options[name] for name in (
+                "users", "boards", "members_per_board", "columns_per_board",
+                "tasks_per_board", "comments_per_task",
+            )
+        }
+        if any(value < 0 for value in sizes.values()):
+            raise CommandError("Sizes must not be negative.")
+        if sizes["boards"] and not sizes["users"]:
+            raise CommandError("Boards need at least one user.")
+
+        existing = benchmark.benchmark_users()
+        if existing.exists():
+            if not options["clear"]:
+                raise CommandError("Benchmark data already exists; pass --clear to replace it.")
+            benchmark.clear()
+
+        counts = benchmark.seed(random_seed=options["seed"], **sizes)
+        self.stdout.write(self.style.SUCCESS(
+            "Created " + ", ".join(f"{count} {name}" for name, count in counts.items()) + "."
+        ))
@@ -0,0 +1,167 @@
+"""
+Per-request timings aggregated into in-process histograms.
+
+RequestMetricsMiddleware creates a RequestMetrics for every request and
+makes it the current one; the SQL execute wrapper and TimedSerializerMixin
+add to it while the view runs. At the end the middleware folds it into
+`registry`, which renders the Prometheus text format for /api/_metrics/.
+Histograms live in the process that served the request, so every worker
+has to be scraped on its own.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, 1000)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+HISTOGRAMS = {
+    "kanban_request_duration_seconds": ("Wall time of the request.", DURATION_BUCKETS),
+    "kanban_db_duration_seconds": ("Time spent executing SQL per request.", DURATION_BUCKETS),
+    "kanban_db_queries": ("SQL statements executed per request.", QUERY_BUCKETS),
+    "kanban_serializer_duration_seconds": (
+        "Time spent in serializers per request, including the SQL they trigger.", DURATION_BUCKETS,
+    ),
+    "kanban_render_duration_seconds": ("Time spent rendering the response body.", DURATION_BUCKETS),
+    "kanban_response_size_bytes": ("Size of non-streaming response bodies.", SIZE_BUCKETS),
+}
+
+_current = ContextVar("kanban_request_metrics", default=None)
+
+
+def current_metrics():
+    return _current.get()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.view = "unresolved"
+        self.action = "-"
+        self.exempt = False
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.render_time = 0.0
+        self.serializing = False
+
+    def activate(self):
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.queries += 1
+
+    def server_timing(self, total):
+        return ", ".join([
+            f"total;dur={total * 1000:.1f}",
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+            f"serialize;dur={self.serializer_time * 1000:.1f}",
+            f"render;dur={self.render_time * 1000:.1f}",
+        ])
+
+
+class TimedSerializerMixin:
+    """
+    Adds the time spent in to_representation to the current request's
+    serializer time. Nested serializers and list items inside an outer
+    call are not counted twice.
+    """
+
+    def to_representation(self, instance):
+        metrics = _current.get()
+        if metrics is None or metrics.serializing:
+            return super().to_representation(instance)
+        metrics.serializing = True
+        started = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_time += time.perf_counter() - started
+            metrics.serializing = False
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {name: {} for name in HISTOGRAMS}
+        self._requests = {}
+
+    def _observe(self, name, key, value):
+        histograms = self._histograms[name]
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(HISTOGRAMS[name][1])
+        histogram.observe(value)
+
+    def record(self, metrics, total, status, size):
+        key = (metrics.view, metrics.action)
+        with self._lock:
+            counter = key + (status,)
+            self._requests[counter] = self._requests.get(counter, 0) + 1
+            self._observe("kanban_request_duration_seconds", key, total)
+            self._observe("kanban_db_duration_seconds", key, metrics.db_time)
+            self._observe("kanban_db_queries", key, metrics.queries)
+            self._observe("kanban_serializer_duration_seconds", key, metrics.serializer_time)
+            self._observe("kanban_render_duration_seconds", key, metrics.render_time)
+            if size is not None:
+                self._observe("kanban_response_size_bytes", key, size)
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {name: {} for name in HISTOGRAMS}
+            self._requests = {}
+
+    def render(self):
+        """Returns all metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP kanban_requests_total Requests served, by view, action and status.",
+            "# TYPE kanban_requests_total counter",
+        ]
+        with self._lock:
+            for (view, action, status), count in sorted(self._requests.items()):
+                lines.append(f"kanban_requests_total{{{_labels(view=view, action=action, status=status)}}} {count}")
+            for name, (description, buckets) in HISTOGRAMS.items():
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                for (view, action), histogram in sorted(self._histograms[name].items()):
+                    labels = _labels(view=view, action=action)
+                    cumulative = 0
+                    for bound, count in zip(buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6g}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
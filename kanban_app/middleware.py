@@ -0,0 +1,168 @@
+import logging
+import time
+from contextlib import ExitStack, asynccontextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from django.conf import settings
+from django.db import connections
+
+from kanban_app.metrics import RequestMetrics, current_metrics, registry
+from kanban_app.nplusone import NPlusOneError, QueryDetector
+
+logger = logging.getLogger("kanban_app.nplusone")
+
+
+def _execute_wrappers(wrapper):
+    stack = ExitStack()
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(wrapper))
+    return stack
+
+
+@asynccontextmanager
+async def _aexecute_wrappers(wrapper):
+    # Async views and sync views under ASGI run their queries on the
+    # thread-sensitive executor, whose connections are not this thread's.
+    stack = await sync_to_async(_execute_wrappers)(wrapper)
+    try:
+        yield
+    finally:
+        await sync_to_async(stack.close)()
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures wall time, SQL count and time, serializer and render time and
+    response size per view and action, records them in kanban_app.metrics
+    and reports the request's numbers in a Server-Timing header. Views with
+    `metrics_exempt = True` are not recorded. Works under WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, "KANBAN_METRICS_ENABLED", True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = metrics.activate()
+        started = time.perf_counter()
+        try:
+            with _execute_wrappers(metrics.execute_wrapper):
+                response = self.get_response(request)
+        finally:
+            RequestMetrics.deactivate(token)
+        return self._finish(request, response, metrics, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        if not getattr(settings, "KANBAN_METRICS_ENABLED", True):
+            return await self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = metrics.activate()
+        started = time.perf_counter()
+        try:
+            async with _aexecute_wrappers(metrics.execute_wrapper):
+                response = await self.get_response(request)
+        finally:
+            RequestMetrics.deactivate(token)
+        return self._finish(request, response, metrics, time.perf_counter() - started)
+
+    def _finish(self, request, response, metrics, total):
+        self._label(request, metrics)
+        if metrics.exempt:
+            return response
+        size = None if response.streaming else len(response.content)
+        registry.record(metrics, total, response.status_code, size)
+        if getattr(settings, "KANBAN_SERVER_TIMING", True):
+            response["Server-Timing"] = metrics.server_timing(total)
+        return response
+
+    def _label(self, request, metrics):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return
+        view_func = match.func
+        method = request.method.lower()
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None:
+            metrics.view = f"{view_func.__module__}.{view_func.__name__}"
+            metrics.action = method
+            return
+        metrics.view = view_class.__name__
+        metrics.exempt = getattr(view_class, "metrics_exempt", False)
+        actions = getattr(view_func, "actions", None) or {}
+        metrics.action = actions.get(method, method)
+
+    def process_template_response(self, request, response):
+        metrics = current_metrics()
+        if metrics is None:
+            return response
+        started = time.perf_counter()
+
+        def rendered(response):
+            metrics.render_time += time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class NPlusOneMiddleware:
+    """
+    Runs every request under a QueryDetector. KANBAN_NPLUSONE_MODE is "log"
+    (warn and add an X-NPlusOne header with the number of findings), "raise"
+    (fail the request) or "off"; unset means "log" while DEBUG is on.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _mode(self):
+        mode = getattr(settings, "KANBAN_NPLUSONE_MODE", None)
+        if mode is None:
+            return "log" if settings.DEBUG else "off"
+        return mode
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        mode = self._mode()
+        if mode == "off":
+            return self.get_response(request)
+
+        with QueryDetector() as detector:
+            response = self.get_response(request)
+        return self._report(request, response, detector, mode)
+
+    async def __acall__(self, request):
+        mode = self._mode()
+        if mode == "off":
+            return await self.get_response(request)
+
+        async with QueryDetector() as detector:
+            response = await self.get_response(request)
+        return self._report(request, response, detector, mode)
+
+    def _report(self, request, response, detector, mode):
+        findings = detector.findings()
+        if findings:
+            report = detector.report()
+            if mode == "raise":
+                raise NPlusOneError(f"{request.method} {request.path}: {report}")
+            logger.warning("%s %s: %s", request.method, request.path, report)
+            response["X-NPlusOne"] = str(len(findings))
+        return response
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0008_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardSyncState',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sync_state', serialize=False, to='kanban_app.board')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('compacted_version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField()),
+                ('kind', models.CharField(choices=[('board', 'Board'), ('member', 'Member'), ('column', 'Column'), ('task', 'Task'), ('comment', 'Comment')], max_length=10)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('changed_at', models.DateTimeField()),
+                ('board', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='kanban_app.board')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board', 'version'], name='board_change_version_idx')],
+                'constraints': [models.UniqueConstraint(fields=('board', 'kind', 'object_id'), name='board_change_object_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_existing_tasks(apps, schema_editor):
+    Board = apps.get_model('kanban_app', 'Board')
+    BoardStats = apps.get_model('kanban_app', 'BoardStats')
+    Task = apps.get_model('kanban_app', 'Task')
+    stats = {board_id: BoardStats(board_id=board_id) for board_id in Board.objects.values_list('pk', flat=True)}
+    rows = Task.objects.values('board_id', 'status', 'priority').annotate(count=Count('pk')).order_by()
+    for row in rows:
+        board = stats[row['board_id']]
+        board.task_count += row['count']
+        board.status_counts[row['status']] = board.status_counts.get(row['status'], 0) + row['count']
+        board.priority_counts[row['priority']] = board.priority_counts.get(row['priority'], 0) + row['count']
+    BoardStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0009_board_change_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStats',
+            fields=[
+                ('board', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='kanban_app.board')),
+                ('task_count', models.PositiveIntegerField(default=0)),
+                ('status_counts', models.JSONField(default=dict)),
+                ('priority_counts', models.JSONField(default=dict)),
+            ],
+        ),
+        migrations.RunPython(count_existing_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,130 @@
+from django.db import migrations
+
+# SQLite: external-content FTS5 tables over the task and comment text,
+# kept in sync by triggers so every write path (ORM, bulk_create, raw SQL)
+# updates the index. Both tables also index the board id, which lets a
+# search restrict itself to the user's boards inside the index. Comments
+# get their board through a view, and moving a task re-indexes its
+# comments. A later migration that makes Django rebuild kanban_app_task or
+# kanban_app_comment on SQLite drops these triggers and has to create them
+# again.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE kanban_task_fts USING fts5(
+        title, description, board_id,
+        content='kanban_app_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER kanban_task_fts_insert AFTER INSERT ON kanban_app_task BEGIN
+        INSERT INTO kanban_task_fts (rowid, title, description, board_id)
+        VALUES (new.id, new.title, new.description, new.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_task_fts_delete AFTER DELETE ON kanban_app_task BEGIN
+        INSERT INTO kanban_task_fts (kanban_task_fts, rowid, title, description, board_id)
+        VALUES ('delete', old.id, old.title, old.description, old.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_task_fts_update AFTER UPDATE OF title, description, board_id ON kanban_app_task BEGIN
+        INSERT INTO kanban_task_fts (kanban_task_fts, rowid, title, description, board_id)
+        VALUES ('delete', old.id, old.title, old.description, old.board_id);
+        INSERT INTO kanban_task_fts (rowid, title, description, board_id)
+        VALUES (new.id, new.title, new.description, new.board_id);
+    END
+    """,
+    "INSERT INTO kanban_task_fts (kanban_task_fts) VALUES ('rebuild')",
+    """
+    CREATE VIEW kanban_comment_search AS
+    SELECT c.id AS id, c.content AS content, t.board_id AS board_id
+    FROM kanban_app_comment c JOIN kanban_app_task t ON t.id = c.task_id
+    """,
+    """
+    CREATE VIRTUAL TABLE kanban_comment_fts USING fts5(
+        content, board_id,
+        content='kanban_comment_search', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER kanban_comment_fts_insert AFTER INSERT ON kanban_app_comment BEGIN
+        INSERT INTO kanban_comment_fts (rowid, content, board_id)
+        VALUES (new.id, new.content, (SELECT board_id FROM kanban_app_task WHERE id = new.task_id));
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_comment_fts_delete AFTER DELETE ON kanban_app_comment BEGIN
+        INSERT INTO kanban_comment_fts (kanban_comment_fts, rowid, content, board_id)
+        VALUES ('delete', old.id, old.content, (SELECT board_id FROM kanban_app_task WHERE id = old.task_id));
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_comment_fts_update AFTER UPDATE OF content, task_id ON kanban_app_comment BEGIN
+        INSERT INTO kanban_comment_fts (kanban_comment_fts, rowid, content, board_id)
+        VALUES ('delete', old.id, old.content, (SELECT board_id FROM kanban_app_task WHERE id = old.task_id));
+        INSERT INTO kanban_comment_fts (rowid, content, board_id)
+        VALUES (new.id, new.content, (SELECT board_id FROM kanban_app_task WHERE id = new.task_id));
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_comment_fts_move AFTER UPDATE OF board_id ON kanban_app_task
+    WHEN old.board_id != new.board_id BEGIN
+        INSERT INTO kanban_comment_fts (kanban_comment_fts, rowid, content, board_id)
+        SELECT 'delete', id, content, old.board_id FROM kanban_app_comment WHERE task_id = new.id;
+        INSERT INTO kanban_comment_fts (rowid, content, board_id)
+        SELECT id, content, new.board_id FROM kanban_app_comment WHERE task_id = new.id;
+    END
+    """,
+    "INSERT INTO kanban_comment_fts (kanban_comment_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS kanban_task_fts_insert",
+    "DROP TRIGGER IF EXISTS kanban_task_fts_delete",
+    "DROP TRIGGER IF EXISTS kanban_task_fts_update",
+    "DROP TABLE IF EXISTS kanban_task_fts",
+    "DROP TRIGGER IF EXISTS kanban_comment_fts_insert",
+    "DROP TRIGGER IF EXISTS kanban_comment_fts_delete",
+    "DROP TRIGGER IF EXISTS kanban_comment_fts_update",
+    "DROP TRIGGER IF EXISTS kanban_comment_fts_move",
+    "DROP TABLE IF EXISTS kanban_comment_fts",
+    "DROP VIEW IF EXISTS kanban_comment_search",
+]
+
+# PostgreSQL: GIN indexes on the same tsvector expressions that
+# kanban_app.search queries with, so nothing extra has to be kept in sync.
+POSTGRES_FORWARD = [
+    "CREATE INDEX task_search_idx ON kanban_app_task "
+    "USING GIN (to_tsvector('simple', title || ' ' || description))",
+    "CREATE INDEX comment_search_idx ON kanban_app_comment "
+    "USING GIN (to_tsvector('simple', content))",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS task_search_idx",
+    "DROP INDEX IF EXISTS comment_search_idx",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0010_board_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
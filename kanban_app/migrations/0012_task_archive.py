@@ -0,0 +1,108 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# Live and archived tasks side by side, for the AnyTask model. Archived
+# tasks keep the ids they had, so ids stay unique across both halves.
+# Adding done_at to kanban_app_task is a plain ADD COLUMN on SQLite, so
+# the search triggers of 0011 are left alone.
+CREATE_VIEW = """
+    CREATE VIEW kanban_task_with_archive AS
+    SELECT id, board_id, title, description, status, priority, assignee_id, reviewer_id, due_date,
+           FALSE AS archived
+    FROM kanban_app_task
+    UNION ALL
+    SELECT id, board_id, title, description, status, priority, assignee_id, reviewer_id, due_date,
+           TRUE AS archived
+    FROM kanban_app_archivedtask
+"""
+
+DROP_VIEW = "DROP VIEW IF EXISTS kanban_task_with_archive"
+
+
+def mark_done_tasks(apps, schema_editor):
+    # When existing tasks were finished is unknown; they count from now.
+    Task = apps.get_model('kanban_app', 'Task')
+    Task.objects.filter(status='done', done_at__isnull=True).update(done_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0011_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='done_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'done')), fields=['done_at'], name='task_done_at_idx'),
+        ),
+        migrations.RunPython(mark_done_tasks, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ArchivedTask',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('todo', 'To Do'), ('in_progress', 'In Progress'), ('review', 'Review'), ('done', 'Done')], max_length=20)),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], max_length=10)),
+                ('due_date', models.DateField(blank=True, null=True)),
+                ('done_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField()),
+                ('board', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_tasks', to='kanban_app.board')),
+                ('assignee', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('reviewer', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['due_date'],
+                'indexes': [
+                    models.Index(fields=['board', 'due_date'], name='archived_task_board_due_idx'),
+                    models.Index(fields=['assignee', 'due_date'], name='archived_task_assignee_idx'),
+                    models.Index(fields=['reviewer', 'due_date'], name='archived_task_reviewer_idx'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedComment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('task', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='kanban_app.archivedtask')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['task', 'created_at'], name='archived_comment_task_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AnyTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('todo', 'To Do'), ('in_progress', 'In Progress'), ('review', 'Review'), ('done', 'Done')], max_length=20)),
+                ('priority', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], max_length=10)),
+                ('due_date', models.DateField(null=True)),
+                ('archived', models.BooleanField()),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='kanban_app.board')),
+                ('assignee', models.ForeignKey(null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('reviewer', models.ForeignKey(null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'kanban_task_with_archive',
+                'ordering': ['due_date'],
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# PostgreSQL: fold diacritics like the SQLite tokenizer does, so "prufung"
+# finds "Prüfung". unaccent() itself is only STABLE (its dictionary could
+# change) and cannot appear in an index expression; the wrapper names the
+# dictionary explicitly and is declared IMMUTABLE. Changing the unaccent
+# rules later means rebuilding both indexes (REINDEX).
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION kanban_unaccent(text) RETURNS text AS $$
+        SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+    $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """,
+    "DROP INDEX IF EXISTS task_search_idx",
+    "DROP INDEX IF EXISTS comment_search_idx",
+    "CREATE INDEX task_search_idx ON kanban_app_task "
+    "USING GIN (to_tsvector('simple', kanban_unaccent(title || ' ' || description)))",
+    "CREATE INDEX comment_search_idx ON kanban_app_comment "
+    "USING GIN (to_tsvector('simple', kanban_unaccent(content)))",
+]
+
+# Back to the indexes of 0011. The extension stays, other code may use it.
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS task_search_idx",
+    "DROP INDEX IF EXISTS comment_search_idx",
+    "CREATE INDEX task_search_idx ON kanban_app_task "
+    "USING GIN (to_tsvector('simple', title || ' ' || description))",
+    "CREATE INDEX comment_search_idx ON kanban_app_comment "
+    "USING GIN (to_tsvector('simple', content))",
+    "DROP FUNCTION IF EXISTS kanban_unaccent(text)",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0012_task_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRES_FORWARD}),
+            _run({'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 STATUS_CHOICES = [
@@ -36,10 +37,13 @@ class Board(models.Model):
 class Column(models.Model):
     title = models.CharField(max_length=50)
     order = models.PositiveIntegerField()
-    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="columns")
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="columns", db_index=False)
 
     class Meta:
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['board', 'order'], name='column_board_order_idx'),
+        ]
         verbose_name = "Column"
         verbose_name_plural = "Columns"
     
@@ -48,26 +52,163 @@ class Column(models.Model):
     
     
 class Task(models.Model):
-    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="tasks")
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="tasks", db_index=False)
     title = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="to-do")
     priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES, default="medium")
-    assignee = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="assigned_tasks")
-    reviewer = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="review_tasks")
+    assignee = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="assigned_tasks", db_index=False)
+    reviewer = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="review_tasks", db_index=False)
     due_date = models.DateField(null=True, blank=True)
+    # When the task last moved to `done`; archive_done_tasks goes by it.
+    done_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ['due_date']
+        # The leading columns also serve plain lookups on board, assignee
+        # and reviewer, so those foreign keys carry no index of their own.
+        indexes = [
+            models.Index(fields=['board', 'due_date'], name='task_board_due_idx'),
+            models.Index(fields=['board', 'status'], name='task_board_status_idx'),
+            models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+            models.Index(fields=['assignee', 'due_date'], name='task_assignee_due_idx'),
+            models.Index(fields=['reviewer', 'due_date'], name='task_reviewer_due_idx'),
+            models.Index(fields=['done_at'], condition=models.Q(status='done'), name='task_done_at_idx'),
+        ]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
 
     def __str__(self):
         return f"{self.title} ({self.status})"
+
+    def track_done(self, previous_status=None):
+        """
+        Keeps done_at in step with the status. Saves do this through a
+        signal; bulk writes call it themselves.
+        """
+        if self.status != "done":
+            self.done_at = None
+        elif previous_status != "done" or self.done_at is None:
+            self.done_at = timezone.now()
     
     
 class Comment(models.Model):
-    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="comments")
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="comments", db_index=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+        ]
+
+
+class ArchivedTask(models.Model):
+    """
+    A done task moved out of the live task table by archive_done_tasks
+    (see kanban_app.archive). It keeps its id, which the live table never
+    hands out again.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="archived_tasks", db_index=False)
+    title = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES)
+    assignee = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="+", db_index=False)
+    reviewer = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name="+", db_index=False)
+    due_date = models.DateField(null=True, blank=True)
+    done_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['due_date']
+        indexes = [
+            models.Index(fields=['board', 'due_date'], name='archived_task_board_due_idx'),
+            models.Index(fields=['assignee', 'due_date'], name='archived_task_assignee_idx'),
+            models.Index(fields=['reviewer', 'due_date'], name='archived_task_reviewer_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (archived)"
+
+
+class ArchivedComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE, related_name="comments", db_index=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    content = models.TextField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='archived_comment_task_idx'),
+        ]
+
+
+class AnyTask(models.Model):
+    """
+    Live and archived tasks together, read through a database view
+    (migration 0012), so ?include_archived= requests can filter, order and
+    paginate both with one queryset. Read-only.
+    """
+    board = models.ForeignKey(Board, on_delete=models.DO_NOTHING, related_name="+")
+    title = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    priority = models.CharField(max_length=10, choices=PRIORITY_CHOICES)
+    assignee = models.ForeignKey(User, null=True, on_delete=models.DO_NOTHING, related_name="+")
+    reviewer = models.ForeignKey(User, null=True, on_delete=models.DO_NOTHING, related_name="+")
+    due_date = models.DateField(null=True)
+    archived = models.BooleanField()
+
+    class Meta:
+        managed = False
+        db_table = "kanban_task_with_archive"
+        ordering = ['due_date']
+
+
+class BoardSyncState(models.Model):
+    """Version counter of a board's change log (see kanban_app.changelog)."""
+    board = models.OneToOneField(Board, on_delete=models.CASCADE, primary_key=True, related_name="sync_state")
+    version = models.PositiveBigIntegerField(default=0)
+    compacted_version = models.PositiveBigIntegerField(default=0)
+
+
+CHANGE_KINDS = [
+    ("board", "Board"),
+    ("member", "Member"),
+    ("column", "Column"),
+    ("task", "Task"),
+    ("comment", "Comment"),
+]
+
+
+class BoardChange(models.Model):
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="changes", db_index=False)
+    version = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=10, choices=CHANGE_KINDS)
+    object_id = models.PositiveBigIntegerField()
+    deleted = models.BooleanField(default=False)
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        # One row per object: a newer change replaces the older one.
+        constraints = [
+            models.UniqueConstraint(fields=['board', 'kind', 'object_id'], name='board_change_object_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['board', 'version'], name='board_change_version_idx'),
+        ]
+
+
+class BoardStats(models.Model):
+    """
+    Task counters of a board, kept current by kanban_app.stats on every
+    task write, so board lists do not count tasks on read.
+    """
+    board = models.OneToOneField(Board, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    task_count = models.PositiveIntegerField(default=0)
+    status_counts = models.JSONField(default=dict)
+    priority_counts = models.JSONField(default=dict)
@@ -0,0 +1,165 @@
+"""
+N+1 query detection.
+
+QueryDetector fingerprints every SQL statement run while it is active
+(literals and IN lists normalised away) and notes the serializer field
+that was being rendered at the time, taken from the DRF
+Serializer.to_representation frames on the stack. Only statements run
+while a list is being serialized count, and each outermost list counts on
+its own: a fingerprint that runs more than `threshold` times from the
+same place within one list is reported. Repeats elsewhere (a loop of
+writes, a retry, several short lists in one request) are not N+1 queries. It is used
+by NPlusOneMiddleware, NPlusOneTestMixin and assert_no_n_plus_one().
+"""
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import ListSerializer, Serializer
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN \(\?(?:\s*,\s*\?)*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+_SERIALIZE_CODE = Serializer.to_representation.__code__
+_LIST_CODE = ListSerializer.to_representation.__code__
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """Normalises a statement so repeats with different values compare equal."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def serializer_field_path():
+    """
+    Returns the serializer fields being rendered, outermost first, e.g.
+    "BoardDetailSerializer.tasks > TaskSerializer.assignee", and the frame
+    of the outermost list serialization in progress, or None.
+    """
+    path, list_frame = [], None
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code is _SERIALIZE_CODE:
+            field = frame.f_locals.get("field")
+            if field is not None:
+                path.append(f"{type(frame.f_locals['self']).__name__}.{field.field_name}")
+        elif frame.f_code is _LIST_CODE:
+            list_frame = frame
+        frame = frame.f_back
+    return " > ".join(reversed(path)) or None, list_frame
+
+
+class Finding:
+    def __init__(self, fingerprint, field, count, sample):
+        self.fingerprint = fingerprint
+        self.field = field
+        self.count = count
+        self.sample = sample
+
+    def __str__(self):
+        where = self.field or "the list serializer"
+        return f"{self.count}x in one list serialization from {where}: {self.sample}"
+
+
+class QueryDetector:
+    def __init__(self, threshold=None):
+        if threshold is None:
+            threshold = getattr(settings, "KANBAN_NPLUSONE_THRESHOLD", 5)
+        self.threshold = threshold
+        # The highest count of each (fingerprint, field) in any one list
+        # serialization; the running list counts in _list_counts until the
+        # next statement comes from elsewhere.
+        self.counts = Counter()
+        self._list_counts = Counter()
+        self._list_frame = None
+        self._samples = {}
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+        self._end_list()
+        return False
+
+    # Connections are per thread and async code runs its queries on the
+    # thread-sensitive executor, so the wrappers are installed there.
+    async def __aenter__(self):
+        return await sync_to_async(self.__enter__)()
+
+    async def __aexit__(self, *exc_info):
+        return await sync_to_async(self.__exit__)(*exc_info)
+
+    def __call__(self, execute, sql, params, many, context):
+        field, list_frame = serializer_field_path()
+        # Holding on to the frame keeps a later list from getting its id.
+        if list_frame is not self._list_frame:
+            self._end_list()
+            self._list_frame = list_frame
+        if list_frame is not None:
+            key = (fingerprint(sql), field)
+            self._list_counts[key] += 1
+            self._samples.setdefault(key, sql)
+        return execute(sql, params, many, context)
+
+    def _end_list(self):
+        self.counts |= self._list_counts
+        self._list_counts = Counter()
+        self._list_frame = None
+
+    def findings(self):
+        counts = self.counts | self._list_counts
+        return [
+            Finding(key[0], key[1], count, self._samples[key])
+            for key, count in counts.most_common()
+            if count > self.threshold
+        ]
+
+    def report(self):
+        findings = self.findings()
+        if not findings:
+            return ""
+        lines = [f"{len(findings)} statement(s) ran more than {self.threshold} times:"]
+        lines.extend(f"  {finding}" for finding in findings)
+        return "\n".join(lines)
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold=None):
+    """Raises NPlusOneError when the block repeats a statement too often."""
+    with QueryDetector(threshold) as detector:
+        yield detector
+    if detector.findings():
+        raise NPlusOneError(detector.report())
+
+
+class NPlusOneTestMixin:
+    """TestCase mixin: `with self.assertNoNPlusOne(): self.client.get(...)`."""
+
+    nplusone_threshold = None
+
+    @contextmanager
+    def assertNoNPlusOne(self, threshold=None):
+        with QueryDetector(threshold if threshold is not None else self.nplusone_threshold) as detector:
+            yield detector
+        if detector.findings():
+            self.fail(detector.report())
@@ -0,0 +1,264 @@
+"""
+Full-text search over task titles and descriptions and comment contents
+(/api/search/?q=).
+
+The index lives in the database: on SQLite, FTS5 tables kept in sync by
+triggers (migration 0011); on PostgreSQL, GIN indexes over to_tsvector()
+of the same columns with the diacritics removed (0011, 0013). Other
+databases get an unindexed icontains search. A query is split into words, all of which have to
+match; a word ending in `*` matches as a prefix. SQLite also indexes the
+board id, so the user's boards are picked inside the index instead of by
+joining every match.
+
+The index finds the newest KANBAN_SEARCH_CANDIDATES matching tasks and
+comments, and those are ranked here with BM25's term saturation and
+length normalisation (titles count double). The database's own scoring
+(bm25(), ts_rank) needs the number of documents containing each word,
+which for a word found in most of a million comments costs more than the
+rest of the query; and as every candidate contains every word anyway,
+per-word weights would not change much. A word that occurs everywhere
+returns the best of the recent matches, and search() says so. Scores are
+the same on every database.
+"""
+import re
+import unicodedata
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+
+from kanban_app.api.access import visible_boards
+from kanban_app.models import Comment, Task
+
+MAX_TERMS = 8
+# Up to this many boards are matched inside the SQLite index; users with
+# more are filtered by joining the board ids.
+MAX_INDEXED_BOARDS = 200
+SNIPPET_WORDS = 16
+TITLE_WEIGHT = 2.0
+K1, B = 1.2, 0.75
+
+WORD_RE = re.compile(r"[^\W_]+")
+COMBINING_RE = re.compile(r"[\u0300-\u036f]")
+
+
+def parse_terms(query):
+    """
+    Returns the words of a search query (at most MAX_TERMS) as (word,
+    is_prefix) pairs, folded like the indexed text.
+    """
+    return [(fold(word), bool(star)) for word, star in re.findall(r"([^\W_]+)(\*?)", query)][:MAX_TERMS]
+
+
+def fold(text):
+    """Lower-cases the text and strips diacritics, like the SQLite tokenizer."""
+    text = text.lower()
+    if text.isascii():
+        return text
+    return COMBINING_RE.sub("", unicodedata.normalize("NFKD", text))
+
+
+def _matches(word, terms):
+    return any(word.startswith(term) if is_prefix else word == term for term, is_prefix in terms)
+
+
+def snippet(text, terms, size=SNIPPET_WORDS):
+    """
+    Returns up to `size` words of the text around the first match as
+    escaped HTML, with the matching words in <mark> tags.
+    """
+    words = list(WORD_RE.finditer(text))
+    if not words:
+        return escape(text[:200])
+    marked = [_matches(fold(word.group()), terms) for word in words]
+    first = marked.index(True) if True in marked else 0
+    start = max(0, min(first - size // 4, len(words) - size))
+
+    parts = ["…"] if start > 0 else []
+    position = words[start].start() if start > 0 else 0
+    for index in range(start, min(start + size, len(words))):
+        word = words[index]
+        parts.append(escape(text[position:word.start()]))
+        parts.append(f"<mark>{escape(word.group())}</mark>" if marked[index] else escape(word.group()))
+        position = word.end()
+    parts.append("…" if start + size < len(words) else escape(text[position:]))
+    return "".join(parts)
+
+
+def _field_scores(texts, terms):
+    """BM25 without the document frequencies, for each text."""
+    tokenized = [WORD_RE.findall(fold(text)) for text in texts]
+    average = max(sum(map(len, tokenized)) / max(len(tokenized), 1), 1)
+    scores = []
+    for words in tokenized:
+        counts = Counter(words)
+        norm = K1 * (1 - B + B * len(words) / average)
+        score = 0.0
+        for term, is_prefix in terms:
+            tf = sum(n for word, n in counts.items() if word.startswith(term)) if is_prefix else counts[term]
+            score += tf * (K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def rank(rows, terms):
+    """
+    Scores candidate rows (type, id, task_id, board_id, title, text) and
+    returns them as hits, best first, newest first among equals.
+    """
+    hits = []
+    for type in ("task", "comment"):
+        group = [row for row in rows if row[0] == type]
+        if not group:
+            continue
+        scores = _field_scores([row[5] for row in group], terms)
+        if type == "task":
+            titles = _field_scores([row[4] for row in group], terms)
+            scores = [TITLE_WEIGHT * title + text for title, text in zip(titles, scores)]
+        hits.extend(
+            {"type": type, "id": id, "task": task_id, "board": board_id, "title": title, "text": text, "rank": score}
+            for (type, id, task_id, board_id, title, text), score in zip(group, scores)
+        )
+    hits.sort(key=lambda hit: (-hit["rank"], hit["type"] != "task", -hit["id"]))
+    return hits
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+class SqlSearch:
+    def candidates(self, terms, user, candidates):
+        """
+        Returns up to `candidates` of the newest matching tasks and as many
+        comments as (type, id, task_id, board_id, title, text) rows.
+        """
+        query = self.candidates_query(terms, user, candidates)
+        if query is None:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(*query)
+            return cursor.fetchall()
+
+
+class SqliteSearch(SqlSearch):
+    def candidates_query(self, terms, user, candidates):
+        words = " ".join(f'"{word}"*' if is_prefix else f'"{word}"' for word, is_prefix in terms)
+        task_match = f"{{title description}} : ({words})"
+        comment_match = f"content : ({words})"
+
+        board_ids = list(visible_boards(user).order_by().values_list("pk", flat=True)[:MAX_INDEXED_BOARDS + 1])
+        if not board_ids:
+            return None
+        if len(board_ids) <= MAX_INDEXED_BOARDS:
+            boards = " OR ".join(f'"{board_id}"' for board_id in board_ids)
+            task_match += f" AND board_id : ({boards})"
+            comment_match += f" AND board_id : ({boards})"
+            boards_sql, boards_params = _placeholders(board_ids), board_ids
+        else:
+            boards_sql, boards_params = visible_boards(user).order_by().values("pk").query.sql_with_params()
+
+        # The index returns matches by rowid, so the newest come first
+        # without sorting.
+        sql = f"""
+            SELECT * FROM (
+                SELECT 'task', t.id, t.id, t.board_id, t.title, t.description
+                FROM kanban_task_fts JOIN kanban_app_task t ON t.id = kanban_task_fts.rowid
+                WHERE kanban_task_fts MATCH %s AND t.board_id IN ({boards_sql})
+                ORDER BY kanban_task_fts.rowid DESC LIMIT %s
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'comment', c.id, t.id, t.board_id, t.title, c.content
+                FROM kanban_comment_fts
+                JOIN kanban_app_comment c ON c.id = kanban_comment_fts.rowid
+                JOIN kanban_app_task t ON t.id = c.task_id
+                WHERE kanban_comment_fts MATCH %s AND t.board_id IN ({boards_sql})
+                ORDER BY kanban_comment_fts.rowid DESC LIMIT %s
+            )
+        """
+        return sql, [task_match, *boards_params, candidates, comment_match, *boards_params, candidates]
+
+
+class PostgresSearch(SqlSearch):
+    # Spelled exactly like the indexed expressions of migration 0013,
+    # otherwise the GIN indexes are not used.
+    TASK_VECTOR = "to_tsvector('simple', kanban_unaccent(t.title || ' ' || t.description))"
+    COMMENT_VECTOR = "to_tsvector('simple', kanban_unaccent(c.content))"
+    QUERY = "to_tsquery('simple', kanban_unaccent(%s))"
+
+    def candidates_query(self, terms, user, candidates):
+        match = " & ".join(f"{word}:*" if is_prefix else word for word, is_prefix in terms)
+        boards_sql, boards_params = visible_boards(user).order_by().values("pk").query.sql_with_params()
+        sql = f"""
+            (
+                SELECT 'task', t.id, t.id, t.board_id, t.title, t.description
+                FROM kanban_app_task t
+                WHERE {self.TASK_VECTOR} @@ {self.QUERY} AND t.board_id IN ({boards_sql})
+                ORDER BY t.id DESC LIMIT %s
+            )
+            UNION ALL
+            (
+                SELECT 'comment', c.id, t.id, t.board_id, t.title, c.content
+                FROM kanban_app_comment c JOIN kanban_app_task t ON t.id = c.task_id
+                WHERE {self.COMMENT_VECTOR} @@ {self.QUERY} AND t.board_id IN ({boards_sql})
+                ORDER BY c.id DESC LIMIT %s
+            )
+        """
+        return sql, [match, *boards_params, candidates, match, *boards_params, candidates]
+
+
+class ContainsSearch:
+    """
+    For databases without a search index: every word has to appear in the
+    text (icontains), which reads every task and comment on the user's
+    boards. A word also matches inside longer words, and as the words are
+    folded, text with diacritics is only found by its other words.
+    """
+
+    def candidates(self, terms, user, candidates):
+        boards = visible_boards(user).order_by().values("pk")
+        tasks = Task.objects.filter(board__in=boards)
+        comments = Comment.objects.filter(task__board__in=boards)
+        for word, _ in terms:
+            tasks = tasks.filter(Q(title__icontains=word) | Q(description__icontains=word))
+            comments = comments.filter(content__icontains=word)
+        task_rows = tasks.order_by("-pk").values_list("pk", "pk", "board_id", "title", "description")
+        comment_rows = comments.order_by("-pk").values_list("pk", "task_id", "task__board_id", "task__title", "content")
+        return [("task", *row) for row in task_rows[:candidates]] + [
+            ("comment", *row) for row in comment_rows[:candidates]
+        ]
+
+
+def get_backend():
+    if connection.vendor == "postgresql":
+        return PostgresSearch()
+    if connection.vendor == "sqlite":
+        return SqliteSearch()
+    return ContainsSearch()
+
+
+def search(user, terms, limit, offset=0):
+    """
+    Returns up to `limit` hits for the parsed terms on the user's boards,
+    best first, as dicts with type ("task" or "comment"), id, task, board,
+    title, rank and an HTML snippet with the matches in <mark> tags; and
+    whether more tasks or comments matched than were ranked
+    (KANBAN_SEARCH_CANDIDATES), in which case older matches are left out.
+    """
+    if not terms:
+        return [], False
+    candidates = getattr(settings, "KANBAN_SEARCH_CANDIDATES", 1000)
+    # One more than ranked tells whether the cap cut anything off.
+    rows = get_backend().candidates(terms, user, candidates + 1)
+    groups = [[row for row in rows if row[0] == type] for type in ("task", "comment")]
+    truncated = any(len(group) > candidates for group in groups)
+    rows = [row for group in groups for row in group[:candidates]]
+    hits = rank(rows, terms)[offset:offset + limit]
+    for hit in hits:
+        text = hit.pop("text")
+        hit["snippet"] = snippet(text or hit["title"], terms)
+        hit["rank"] = round(hit["rank"], 6)
+    return hits, truncated
@@ -0,0 +1,312 @@
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from django.utils import timezone
+
+from kanban_app import changelog, events, stats
+from kanban_app.cache import bump_board_versions
+from kanban_app.models import Board, BoardStats, Column, Comment, Task
+
+
+def boards_changed(*board_ids):
+    """
+    Marks boards as changed after a write to their content: bumps the cache
+    version and moves Board.updated_at forward, which the conditional GET
+    validators rely on.
+    """
+    board_ids = {board_id for board_id in board_ids if board_id is not None}
+    if not board_ids:
+        return
+    bump_board_versions(*board_ids)
+    Board.objects.filter(pk__in=board_ids).update(updated_at=timezone.now())
+
+
+def _cascaded_from(kwargs, *models):
+    # Rows deleted through a cascade are covered by the handler of the
+    # object the delete started from.
+    return isinstance(kwargs.get("origin"), models)
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=Column)
+def remember_previous_board(sender, instance, **kwargs):
+    # A task or column moved to another board changes both boards; the
+    # task's previous status and priority feed its board's counters and
+    # tell whether it just became done.
+    instance._previous_board_id = None
+    instance._previous_task_row = None
+    if instance.pk is None:
+        if sender is Task:
+            instance.track_done()
+        return
+    if sender is Task:
+        row = Task.objects.filter(pk=instance.pk).values_list("board_id", "status", "priority").first()
+        instance._previous_task_row = row
+        instance._previous_board_id = row[0] if row else None
+        instance.track_done(row[1] if row else None)
+    else:
+        instance._previous_board_id = (
+            sender.objects.filter(pk=instance.pk).values_list("board_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def board_changed(sender, instance, **kwargs):
+    bump_board_versions(instance.pk)
+
+
+@receiver(post_save, sender=Board)
+def create_board_stats(sender, instance, created, **kwargs):
+    if created:
+        BoardStats.objects.get_or_create(board=instance)
+
+
+@receiver(post_save, sender=Task)
+def count_task_saved(sender, instance, **kwargs):
+    previous = getattr(instance, "_previous_task_row", None)
+    current = stats.task_row(instance)
+    if previous != current:
+        stats.apply(removed=[previous] if previous else [], added=[current])
+
+
+@receiver(post_delete, sender=Task)
+def count_task_deleted(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board):
+        return
+    stats.apply(removed=[stats.task_row(instance)])
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=Column)
+@receiver(post_delete, sender=Column)
+def board_content_changed(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board):
+        return
+    boards_changed(instance.board_id, getattr(instance, "_previous_board_id", None))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def comment_changed(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board, Task):
+        return
+    boards_changed(_comment_board_id(instance))
+
+
+def _comment_board_id(comment):
+    if Comment.task.is_cached(comment):
+        return comment.task.board_id
+    return Task.objects.filter(pk=comment.task_id).values_list("board_id", flat=True).first()
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear", "pre_clear"):
+        return
+    if not reverse:
+        boards_changed(instance.pk)
+    elif action == "pre_clear":
+        boards_changed(*instance.shared_boards.values_list("pk", flat=True))
+    else:
+        boards_changed(*(pk_set or ()))
+
+
+def _user_board_ids(user):
+    """Boards that show the user: as owner, member, assignee or reviewer."""
+    board_ids = set(Board.objects.filter(Q(owner=user) | Q(members=user)).values_list("pk", flat=True))
+    board_ids.update(Task.objects.filter(Q(assignee=user) | Q(reviewer=user)).values_list("board_id", flat=True))
+    return board_ids
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, update_fields, **kwargs):
+    # Names and emails are embedded in member, assignee and reviewer data.
+    if created:
+        return
+    if update_fields and not {"email", "first_name", "last_name"} & set(update_fields):
+        return
+    boards_changed(*_user_board_ids(instance))
+    for board_id in instance.shared_boards.values_list("pk", flat=True):
+        changelog.record_changes(board_id, "member", [instance.pk])
+    # The board payload carries owner_email.
+    for board_id in instance.boards.values_list("pk", flat=True):
+        changelog.record_changes(board_id, "board", [board_id])
+
+
+@receiver(pre_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    # The delete removes the user's memberships and clears their tasks
+    # through the database cascade, which sends neither m2m_changed nor
+    # post_save, so the boards are marked as changed up front.
+    boards_changed(*_user_board_ids(instance))
+
+
+@receiver(post_save, sender=Task)
+def publish_task_saved(sender, instance, created, **kwargs):
+    previous_board_id = getattr(instance, "_previous_board_id", None)
+    if previous_board_id is not None and previous_board_id != instance.board_id:
+        events.publish(previous_board_id, "task.deleted", {"id": instance.pk})
+        created = True
+    events.publish_tasks("task.created" if created else "task.updated", [instance])
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_deleted(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board):
+        return
+    events.publish(instance.board_id, "task.deleted", {"id": instance.pk})
+
+
+@receiver(post_save, sender=Comment)
+def publish_comment_added(sender, instance, created, **kwargs):
+    if not created:
+        return
+    task = instance.task
+    events.publish(task.board_id, "comment.added", {
+        "id": instance.pk,
+        "task": task.pk,
+        "author_id": instance.user_id,
+        "author": instance.user.get_full_name(),
+        "content": instance.content,
+        "created_at": instance.created_at,
+    })
+
+
+@receiver(post_delete, sender=Comment)
+def publish_comment_deleted(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board, Task):
+        return
+    events.publish(_comment_board_id(instance), "comment.deleted", {"id": instance.pk, "task": instance.task_id})
+
+
+@receiver(post_save, sender=Board)
+def publish_board_updated(sender, instance, created, **kwargs):
+    if not created:
+        events.publish(instance.pk, "board.updated", {
+            "id": instance.pk, "title": instance.title, "description": instance.description,
+        })
+
+
+@receiver(post_delete, sender=Board)
+def publish_board_deleted(sender, instance, **kwargs):
+    events.publish(instance.pk, "board.deleted", {"id": instance.pk})
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def publish_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        # The cleared rows are gone by post_clear.
+        if reverse:
+            for board_id in instance.shared_boards.values_list("pk", flat=True):
+                events.publish(board_id, "member.removed", {"ids": [instance.pk]})
+        else:
+            events.publish(instance.pk, "member.removed", {
+                "ids": sorted(instance.members.values_list("pk", flat=True)),
+            })
+    elif action == "post_remove" and pk_set:
+        if reverse:
+            for board_id in pk_set:
+                events.publish(board_id, "member.removed", {"ids": [instance.pk]})
+        else:
+            events.publish(instance.pk, "member.removed", {"ids": sorted(pk_set)})
+    elif action == "post_add" and pk_set:
+        if reverse:
+            for board_id in pk_set:
+                events.publish(board_id, "member.added", {"members": [_member_data(instance)]})
+        else:
+            events.publish(instance.pk, "member.added", {
+                "members": [_member_data(user) for user in User.objects.filter(pk__in=pk_set).order_by("pk")],
+            })
+
+
+@receiver(pre_delete, sender=User)
+def publish_user_deleted(sender, instance, **kwargs):
+    # The memberships go with the user in the database cascade, without
+    # m2m_changed. Boards the user owns are deleted and announce that.
+    for board_id in instance.shared_boards.exclude(owner=instance).values_list("pk", flat=True):
+        events.publish(board_id, "member.removed", {"ids": [instance.pk]})
+
+
+@receiver(pre_delete, sender=User)
+def record_user_deleted(sender, instance, **kwargs):
+    # As in publish_user_deleted(); the log of owned boards goes with them.
+    # Tasks the user was assigned to or reviewing lose that in the cascade.
+    for board_id in instance.shared_boards.exclude(owner=instance).values_list("pk", flat=True):
+        changelog.record_changes(board_id, "member", [instance.pk], deleted=True)
+    tasks = {}
+    for board_id, task_id in Task.objects.filter(
+        Q(assignee=instance) | Q(reviewer=instance)
+    ).exclude(board__owner=instance).values_list("board_id", "pk"):
+        tasks.setdefault(board_id, []).append(task_id)
+    for board_id, task_ids in tasks.items():
+        changelog.record_changes(board_id, "task", task_ids)
+
+
+def _member_data(user):
+    return {"id": user.pk, "email": user.email, "fullname": user.get_full_name()}
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Column)
+def record_content_saved(sender, instance, **kwargs):
+    kind = "task" if sender is Task else "column"
+    previous_board_id = getattr(instance, "_previous_board_id", None)
+    if previous_board_id is not None and previous_board_id != instance.board_id:
+        changelog.record_changes(previous_board_id, kind, [instance.pk], deleted=True)
+        if sender is Task:
+            # The comments move along with the task.
+            changelog.record_changes(instance.board_id, "comment", instance.comments.values_list("pk", flat=True))
+    changelog.record_changes(instance.board_id, kind, [instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Column)
+def record_content_deleted(sender, instance, **kwargs):
+    if _cascaded_from(kwargs, Board):
+        return
+    changelog.record_changes(instance.board_id, "task" if sender is Task else "column", [instance.pk], deleted=True)
+
+
+@receiver(post_save, sender=Comment)
+def record_comment_saved(sender, instance, **kwargs):
+    changelog.record_changes(_comment_board_id(instance), "comment", [instance.pk])
+
+
+@receiver(post_delete, sender=Comment)
+def record_comment_deleted(sender, instance, **kwargs):
+    # Comments deleted along with their task are implied by its tombstone.
+    if _cascaded_from(kwargs, Board, Task):
+        return
+    changelog.record_changes(_comment_board_id(instance), "comment", [instance.pk], deleted=True)
+
+
+@receiver(post_save, sender=Board)
+def record_board_saved(sender, instance, created, **kwargs):
+    if not created:
+        changelog.record_changes(instance.pk, "board", [instance.pk])
+
+
+@receiver(post_delete, sender=Board)
+def forget_board_changes(sender, instance, **kwargs):
+    changelog.forget_board(instance.pk)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def record_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    deleted = action != "post_add"
+    if action == "pre_clear":
+        pk_set = set(
+            instance.shared_boards.values_list("pk", flat=True) if reverse
+            else instance.members.values_list("pk", flat=True)
+        )
+    if reverse:
+        for board_id in pk_set or ():
+            changelog.record_changes(board_id, "member", [instance.pk], deleted)
+    else:
+        changelog.record_changes(instance.pk, "member", pk_set or (), deleted)
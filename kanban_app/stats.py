@@ -0,0 +1,114 @@
+"""
+Materialised task counters per board (BoardStats).
+
+Task writes report the (board, status, priority) rows that leave and enter
+a board, and apply() folds them into the boards' counters inside the
+writing transaction, with the stats rows locked. Board lists then read the
+numbers instead of counting tasks. rebuild() recounts from the tasks and
+repairs drift, e.g. after raw SQL or a bulk write that bypassed apply().
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+
+from kanban_app.models import Board, BoardStats, Task
+
+REBUILD_CHUNK_SIZE = 500
+
+
+def task_row(task):
+    return task.board_id, task.status, task.priority
+
+
+def _merge(counts, delta):
+    merged = Counter(counts)
+    merged.update(delta)
+    return {key: value for key, value in sorted(merged.items()) if value > 0}
+
+
+def apply(removed=(), added=()):
+    """
+    Updates the counters for task rows removed from and added to boards,
+    each given as (board_id, status, priority).
+    """
+    deltas = defaultdict(lambda: [0, Counter(), Counter()])
+    for sign, rows in ((-1, removed), (1, added)):
+        for board_id, status, priority in rows:
+            if board_id is None:
+                continue
+            delta = deltas[board_id]
+            delta[0] += sign
+            delta[1][status] += sign
+            delta[2][priority] += sign
+    deltas = {
+        board_id: delta for board_id, delta in deltas.items()
+        if delta[0] or any(delta[1].values()) or any(delta[2].values())
+    }
+    if not deltas:
+        return
+
+    with transaction.atomic(savepoint=False):
+        board_ids = sorted(deltas)
+        rows = BoardStats.objects.select_for_update().in_bulk(board_ids)
+        for board_id in board_ids:
+            total, by_status, by_priority = deltas[board_id]
+            row = rows.get(board_id)
+            if row is None:
+                if total < 0:
+                    # The board's stats went with the board.
+                    continue
+                row, _ = BoardStats.objects.select_for_update().get_or_create(board_id=board_id)
+            row.task_count = max(row.task_count + total, 0)
+            row.status_counts = _merge(row.status_counts, by_status)
+            row.priority_counts = _merge(row.priority_counts, by_priority)
+            row.save(update_fields=["task_count", "status_counts", "priority_counts"])
+
+
+def _counted(board_ids):
+    expected = {board_id: BoardStats(board_id=board_id) for board_id in board_ids}
+    rows = (
+        Task.objects.filter(board_id__in=board_ids)
+        .values("board_id", "status", "priority")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    for row in rows:
+        stats = expected[row["board_id"]]
+        stats.task_count += row["count"]
+        stats.status_counts[row["status"]] = stats.status_counts.get(row["status"], 0) + row["count"]
+        stats.priority_counts[row["priority"]] = stats.priority_counts.get(row["priority"], 0) + row["count"]
+    return expected
+
+
+def _same(a, b):
+    return (a.task_count, a.status_counts, a.priority_counts) == (b.task_count, b.status_counts, b.priority_counts)
+
+
+def rebuild(board_ids=None):
+    """
+    Recounts the given boards (all by default) from their tasks. Returns
+    the ids of the boards whose counters were wrong or missing.
+    """
+    if board_ids is None:
+        board_ids = Board.objects.order_by("pk").values_list("pk", flat=True)
+    board_ids = list(board_ids)
+    repaired = []
+    for start in range(0, len(board_ids), REBUILD_CHUNK_SIZE):
+        chunk = board_ids[start:start + REBUILD_CHUNK_SIZE]
+        with transaction.atomic():
+            chunk = list(Board.objects.filter(pk__in=chunk).values_list("pk", flat=True))
+            current = BoardStats.objects.select_for_update().in_bulk(chunk)
+            expected = _counted(chunk)
+            for board_id, stats in expected.items():
+                stats.status_counts = dict(sorted(stats.status_counts.items()))
+                stats.priority_counts = dict(sorted(stats.priority_counts.items()))
+                row = current.get(board_id)
+                if row is not None and _same(row, stats):
+                    continue
+                repaired.append(board_id)
+                if row is None:
+                    stats.save(force_insert=True)
+                else:
+                    stats.save(force_update=True)
+    return repaired
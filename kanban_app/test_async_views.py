@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
+from auth_app.authentication import token_cache
+from kanban_app import benchmark
+from kanban_app.models import Board, Comment, Task
+
+
+class TestAsyncReadEndpoints(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com", password="pass1234", first_name="Olga")
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.board.members.add(self.member)
+        for i in range(3):
+            task = Task.objects.create(
+                board=self.board, title=f"Task {i}", status="review", priority="high",
+                assignee=self.member if i else self.owner, reviewer=self.owner,
+            )
+            Comment.objects.create(task=task, user=self.member, content=f"Kommentar {i}")
+        self.task = task
+        self.auth = f"Token {Token.objects.create(user=self.owner).key}"
+
+    def _aget(self, url, auth=None, **headers):
+        if auth is not False:
+            headers["Authorization"] = auth or self.auth
+        return async_to_sync(self.async_client.get)(url, headers=headers)
+
+    def test_same_payload_as_the_sync_views(self):
+        for sync_path, async_path in benchmark.THROUGHPUT_ENDPOINTS.values():
+            sync_url = sync_path.format(board=self.board.id, task=self.task.id)
+            async_url = async_path.format(board=self.board.id, task=self.task.id)
+            with self.subTest(url=async_url):
+                expected = self.client.get(sync_url, HTTP_AUTHORIZATION=self.auth)
+                response = self._aget(async_url)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), json.loads(expected.content))
+
+    def test_board_detail_payload(self):
+        data = json.loads(self._aget(f"/api/async/boards/{self.board.id}/").content)
+
+        self.assertEqual(data["members"], [{"id": self.member.id, "email": "member@example.com", "fullname": ""}])
+        self.assertEqual(len(data["tasks"]), 3)
+        self.assertEqual(data["tasks"][0]["comments_count"], 1)
+
+    def test_errors_match_the_sync_views(self):
+        missing = self._aget("/api/async/boards/", auth=False)
+        self.assertEqual(missing.status_code, 401)
+        self.assertEqual(missing["WWW-Authenticate"], "Token")
+        self.assertEqual(self._aget("/api/async/boards/", auth="Token nope").status_code, 401)
+
+        stranger = f"Token {Token.objects.create(user=self.stranger).key}"
+        self.assertEqual(self._aget(f"/api/async/boards/{self.board.id}/", auth=stranger).status_code, 404)
+        self.assertEqual(self._aget(f"/api/async/tasks/{self.task.id}/comments/", auth=stranger).status_code, 403)
+        self.assertEqual(self._aget("/api/async/tasks/999999/comments/").status_code, 404)
+
+        post = async_to_sync(self.async_client.post)("/api/async/boards/", headers={"Authorization": self.auth})
+        self.assertEqual(post.status_code, 405)
+
+    def test_conditional_get(self):
+        first = self._aget(f"/api/async/boards/{self.board.id}/")
+
+        second = self._aget(f"/api/async/boards/{self.board.id}/", If_None_Match=first["ETag"])
+
+        self.assertEqual(second.status_code, 304)
+
+    def test_metrics_are_recorded_on_the_async_path(self):
+        response = self._aget(f"/api/async/boards/{self.board.id}/")
+
+        self.assertRegex(response["Server-Timing"], r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class TestThroughputBenchmark(TransactionTestCase):
+    def test_reports_sync_and_async_throughput(self):
+        benchmark.seed(users=4, boards=2, members_per_board=2, tasks_per_board=5, comments_per_task=1)
+        out = StringIO()
+
+        call_command(
+            "benchmark_async", "--clients", "3", "--requests", "2",
+            "--endpoint", "board-detail", "--endpoint", "comment-list", stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("board-detail", output)
+        self.assertIn("comment-list", output)
+        self.assertNotIn("errors", output)
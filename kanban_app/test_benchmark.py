@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from kanban_app import benchmark
+from kanban_app.models import Board, Comment, Task
+
+FAST_HASHER = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER)
+class TestSeedBenchmark(TestCase):
+    def _seed(self, *args):
+        call_command(
+            "seed_benchmark", "--users", "6", "--boards", "3", "--members-per-board", "2",
+            "--tasks-per-board", "4", "--comments-per-task", "2", *args, stdout=StringIO(),
+        )
+
+    def _snapshot(self):
+        return list(Task.objects.order_by("board__title", "title").values_list(
+            "board__title", "title", "status", "priority", "assignee__email", "due_date",
+        ))
+
+    def test_generates_the_requested_sizes(self):
+        self._seed()
+
+        self.assertEqual(benchmark.benchmark_users().count(), 6)
+        self.assertEqual(Board.objects.count(), 3)
+        self.assertEqual(Board.members.through.objects.count(), 6)
+        self.assertEqual(Task.objects.count(), 12)
+        self.assertEqual(Comment.objects.count(), 24)
+
+    def test_same_seed_gives_the_same_data(self):
+        self._seed()
+        first = self._snapshot()
+
+        self._seed("--clear")
+
+        self.assertEqual(self._snapshot(), first)
+
+    def test_refuses_to_mix_with_existing_data(self):
+        self._seed()
+        with self.assertRaises(CommandError):
+            self._seed()
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER)
+class TestRunBenchmark(TestCase):
+    def setUp(self):
+        benchmark.seed(users=4, boards=2, members_per_board=2, tasks_per_board=5, comments_per_task=1)
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("run_benchmark", "--iterations", "2", "--warmup", "0", "--output", self.path, *args, stdout=out)
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle), out.getvalue()
+
+    def test_report_covers_every_endpoint(self):
+        counts = (User.objects.count(), Board.objects.count(), Task.objects.count(), Comment.objects.count())
+
+        report, _ = self._run()
+
+        self.assertEqual(len(report["endpoints"]), 29 + len(benchmark.THROUGHPUT_ENDPOINTS))
+        for name, result in report["endpoints"].items():
+            self.assertEqual(result["errors"], 0, name)
+            self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+            self.assertGreater(result["peak_memory_kb"], 0)
+        self.assertEqual(report["endpoints"]["board-list"]["queries"], 2)
+        self.assertEqual(report["meta"]["dataset"]["tasks"], 10)
+        # Writes made by the run are rolled back.
+        self.assertEqual(
+            (User.objects.count(), Board.objects.count(), Task.objects.count(), Comment.objects.count()), counts,
+        )
+
+    def test_compare_prints_the_differences(self):
+        baseline, _ = self._run()
+        baseline["endpoints"]["board-list"]["queries"] = 30
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(baseline, handle)
+
+        _, output = self._run("--compare", self.path, "--threshold", "100000")
+
+        differences = output.split("Compared to")[1]
+        self.assertIn("board-list queries: 30 -> 2", differences)
+        self.assertNotIn("_ms", differences)
+
+    def test_percentile(self):
+        self.assertEqual(benchmark.percentile([5, 1, 4, 2, 3], 50), 3)
+        self.assertEqual(benchmark.percentile(list(range(1, 101)), 95), 95)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER)
+class TestSearchBenchmark(TestCase):
+    def test_adds_comments_and_times_every_query(self):
+        benchmark.seed(users=3, boards=2, members_per_board=1, tasks_per_board=5, comments_per_task=0)
+        out = StringIO()
+
+        call_command("benchmark_search", "--add-comments", "300", "--iterations", "2", stdout=out)
+
+        self.assertEqual(Comment.objects.count(), 300)
+        output = out.getvalue()
+        for name, query in benchmark.search_queries().items():
+            self.assertIn(repr(query), output, name)
+        self.assertNotIn("status", output)
+
+    def test_needs_generated_data(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_search", stdout=StringIO())
+
+
+class TestRendererBenchmark(TestCase):
+    def test_compares_the_renderers(self):
+        out = StringIO()
+
+        call_command("benchmark_renderers", "--tasks", "50", "--iterations", "2", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("50 tasks", output)
+        self.assertIn("speedup", output)
+        self.assertNotIn("different output", output)
+
+    def test_payload_matches_the_task_representation(self):
+        tasks = benchmark.task_payload(20)
+
+        self.assertEqual(len(tasks), 20)
+        self.assertEqual(set(tasks[0]), {
+            "id", "board", "title", "description", "status", "priority",
+            "assignee", "reviewer", "due_date", "comments_count",
+        })
@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.api.access import BoardAccess
+from kanban_app.models import Board, Task
+
+
+class TestBoardAccess(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.member = User.objects.create_user(username="member", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.board.members.add(self.member)
+
+    def test_owner_needs_no_query(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(BoardAccess().is_member(self.board, self.owner))
+
+    def test_answers_are_memoised_per_request(self):
+        access = BoardAccess()
+        with self.assertNumQueries(2):
+            self.assertTrue(access.is_member(self.board, self.member))
+            self.assertTrue(access.is_member(self.board, self.member))
+            self.assertFalse(access.is_member(self.board, self.stranger))
+            self.assertFalse(access.is_member(self.board, self.stranger))
+
+    def test_prefetched_members_are_used(self):
+        board = Board.objects.prefetch_related("members").get(pk=self.board.pk)
+        access = BoardAccess()
+        with self.assertNumQueries(0):
+            self.assertTrue(access.is_member(board, self.member))
+            self.assertFalse(access.is_member(board, self.stranger))
+
+    @override_settings(KANBAN_ACCESS_CACHE_TIMEOUT=60)
+    def test_cross_request_cache_follows_membership_changes(self):
+        self.assertTrue(BoardAccess().is_member(self.board, self.member))
+        with self.assertNumQueries(0):
+            self.assertTrue(BoardAccess().is_member(self.board, self.member))
+
+        self.board.members.remove(self.member)
+
+        self.assertFalse(BoardAccess().is_member(self.board, self.member))
+
+
+class TestBoardAccessEndpoints(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.member = User.objects.create_user(username="member", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(board=self.board, title="Task")
+
+    def _create_task(self, board):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post("/api/tasks/", {
+                "board": board.id, "title": "Neu", "status": "review", "priority": "low",
+                "assignee_id": self.member.id, "reviewer_id": self.member.id,
+            })
+        self.assertEqual(response.status_code, 201)
+        return len(ctx.captured_queries)
+
+    def test_cost_does_not_depend_on_member_count(self):
+        self.client.force_authenticate(user=self.member)
+        small = self._create_task(self.board)
+
+        crowded = Board.objects.create(title="Voll", owner=self.owner)
+        users = User.objects.bulk_create([User(username=f"user{i}") for i in range(500)])
+        crowded.members.add(self.member, *users)
+
+        self.assertEqual(self._create_task(crowded), small)
+
+    def test_non_members_are_rejected(self):
+        self.client.force_authenticate(user=self.stranger)
+
+        comment = self.client.post(f"/api/tasks/{self.task.id}/comments/", {"content": "Hallo"})
+        column = self.client.post("/api/columns/", {"title": "Spalte", "position": 1, "board": self.board.id})
+
+        self.assertEqual(comment.status_code, 403)
+        self.assertEqual(column.status_code, 403)
+
+    def test_members_can_comment(self):
+        self.client.force_authenticate(user=self.member)
+
+        response = self.client.post(f"/api/tasks/{self.task.id}/comments/", {"content": "Hallo"})
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_only_the_owner_may_delete_a_board(self):
+        self.client.force_authenticate(user=self.member)
+        self.assertEqual(self.client.delete(f"/api/boards/{self.board.id}/").status_code, 403)
+
+        self.client.force_authenticate(user=self.owner)
+        self.assertEqual(self.client.delete(f"/api/boards/{self.board.id}/").status_code, 204)
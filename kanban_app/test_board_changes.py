@@ -0,0 +1,145 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from kanban_app.models import Board, BoardChange, Column, Comment, Task
+
+
+class TestBoardChanges(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.board.members.add(self.member)
+        self.column = Column.objects.create(board=self.board, title="Offen", order=0)
+        self.task = Task.objects.create(board=self.board, title="Task", status="review")
+        Comment.objects.create(task=self.task, user=self.member, content="Hallo")
+        self.client.force_authenticate(user=self.owner)
+
+    def _changes(self, since=None):
+        url = f"/api/boards/{self.board.pk}/changes/"
+        return self.client.get(url if since is None else f"{url}?since={since}")
+
+    def _version(self):
+        return self._changes().data["version"]
+
+    def test_full_snapshot_without_since(self):
+        response = self._changes()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["full"])
+        self.assertEqual(response.data["board"]["title"], "Board")
+        self.assertEqual([member["email"] for member in response.data["members"]], ["member@example.com"])
+        self.assertEqual(len(response.data["columns"]), 1)
+        self.assertEqual(len(response.data["comments"]), 1)
+        self.assertEqual(response.data["version"], 4)
+
+    def test_only_changes_after_since(self):
+        version = self._version()
+        other = Task.objects.create(board=self.board, title="Neu", status="review")
+        for status in ("in_progress", "done"):
+            other.status = status
+            other.save()
+        column_id = self.column.pk
+        self.column.delete()
+
+        data = self._changes(version).data
+
+        self.assertFalse(data["full"])
+        self.assertNotIn("board", data)
+        self.assertEqual([(task["id"], task["status"]) for task in data["tasks"]], [(other.pk, "done")])
+        self.assertEqual(data["columns"], [])
+        self.assertEqual(data["deleted"]["columns"], [column_id])
+        self.assertEqual(data["version"], version + 4)
+        self.assertEqual(self._changes(data["version"]).data["tasks"], [])
+
+    def test_payload_does_not_grow_with_the_board(self):
+        Task.objects.bulk_create([Task(board=self.board, title=f"T{i}", status="review") for i in range(200)])
+        version = self._version()
+        self.task.title = "Umbenannt"
+        self.task.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = self._changes(version).data
+
+        self.assertEqual([task["title"] for task in data["tasks"]], ["Umbenannt"])
+        self.assertLess(len(ctx.captured_queries), 12)
+
+    def test_deletes_and_moves_become_tombstones(self):
+        version = self._version()
+        other = Board.objects.create(title="Other", owner=self.owner)
+        comment = Comment.objects.create(task=self.task, user=self.owner, content="Zweiter")
+        self.task.board = other
+        self.task.save()
+        self.board.members.remove(self.member)
+
+        data = self._changes(version).data
+
+        self.assertEqual(data["deleted"]["tasks"], [self.task.pk])
+        self.assertIn(comment.pk, data["deleted"]["comments"])
+        self.assertEqual(data["deleted"]["members"], [self.member.pk])
+        moved = self.client.get(f"/api/boards/{other.pk}/changes/?since=0").data
+        self.assertEqual([task["id"] for task in moved["tasks"]], [self.task.pk])
+        self.assertEqual(len(moved["comments"]), 2)
+
+    def test_deleting_a_member_is_a_tombstone(self):
+        self.task.assignee = self.member
+        self.task.save()
+        member_id = self.member.pk
+        version = self._version()
+
+        self.member.delete()
+
+        data = self._changes(version).data
+        self.assertEqual(data["deleted"]["members"], [member_id])
+        self.assertEqual([(task["id"], task["assignee_id"]) for task in data["tasks"]], [(self.task.pk, None)])
+
+    def test_owner_profile_changes_update_the_board(self):
+        version = self._version()
+        self.owner.email = "neu@example.com"
+        self.owner.save()
+
+        self.assertEqual(self._changes(version).data["board"]["owner_email"], "neu@example.com")
+
+    def test_bulk_endpoint_is_logged(self):
+        version = self._version()
+
+        response = self.client.patch(
+            "/api/tasks/bulk/", [{"id": self.task.pk, "priority": "high"}], format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task["priority"] for task in self._changes(version).data["tasks"]], ["high"])
+
+    def test_compacted_versions_are_gone(self):
+        version = self._version()
+        self.task.delete()
+        BoardChange.objects.update(changed_at=timezone.now() - timedelta(days=40))
+        out = StringIO()
+
+        call_command("compact_board_changes", "--days", "30", stdout=out)
+
+        # One row per object: the task's tombstone replaced its upsert.
+        self.assertIn("Removed 4 change log rows.", out.getvalue())
+        gone = self._changes(version)
+        self.assertEqual(gone.status_code, 410)
+        self.assertEqual(gone.data["version"], version + 1)
+        self.assertEqual(self._changes(version + 1).data["deleted"]["tasks"], [])
+
+    def test_errors(self):
+        self.assertEqual(self._changes("abc").status_code, 400)
+        self.assertEqual(self._changes(999).status_code, 410)
+        self.client.force_authenticate(user=self.stranger)
+        self.assertEqual(self._changes().status_code, 404)
+
+    def test_deleting_the_owner_drops_the_log(self):
+        self.owner.delete()
+
+        self.assertFalse(BoardChange.objects.exists())
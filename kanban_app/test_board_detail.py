@@ -0,0 +1,62 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.api.serializers import BoardDetailSerializer
+from kanban_app.models import Board, Comment, Task
+
+
+class TestBoardDetail(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="owner", email="owner@example.com", password="pass1234",
+            first_name="Olga", last_name="Owner",
+        )
+        self.member = User.objects.create_user(
+            username="member", email="member@example.com", password="pass1234", first_name="Max",
+        )
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.set([self.member])
+        self.client.force_authenticate(user=self.user)
+
+    def _add_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(
+                board=self.board,
+                title=f"Task {i}",
+                description="Beschreibung" if i % 2 else "",
+                status="to-do" if i % 3 else "done",
+                priority="high" if i % 2 else "low",
+                assignee=self.member if i % 2 else None,
+                reviewer=self.user if i % 3 else None,
+                due_date=datetime.date(2025, 1, 1) + datetime.timedelta(days=i) if i % 4 else None,
+            )
+            for _ in range(i % 3):
+                Comment.objects.create(task=task, user=self.member, content="Kommentar")
+
+    def _get_detail(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/boards/{self.board.id}/")
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_response_matches_task_serializer_output(self):
+        self._add_tasks(12)
+        board = Board.objects.get(pk=self.board.pk)
+        expected = JSONRenderer().render(BoardDetailSerializer(board).data)
+
+        response, _ = self._get_detail()
+
+        self.assertEqual(response.content, expected)
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        self._add_tasks(1)
+        _, baseline = self._get_detail()
+
+        self._add_tasks(20)
+        _, queries = self._get_detail()
+
+        self.assertEqual(queries, baseline)
@@ -0,0 +1,221 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from auth_app.authentication import token_cache
+from kanban_app import events
+from kanban_app.models import Board, Comment, Task
+
+
+def _parse(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines() if not line.startswith(":"))
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class TestEventPublishing(APITestCase):
+    def setUp(self):
+        events.get_backend.cache_clear()
+        self.owner = User.objects.create_user(username="owner", password="pass1234", first_name="Olga")
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.client.force_authenticate(user=self.owner)
+
+    def _events(self, board=None):
+        return [(event.type, event.data) for event in events.get_backend().replay((board or self.board).pk, 0)]
+
+    def test_write_paths_publish_deltas_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.board.members.add(self.member)
+            task = Task.objects.create(board=self.board, title="Task", status="review")
+            task.status = "done"
+            task.save()
+            Comment.objects.create(task=task, user=self.owner, content="Fertig")
+            task.delete()
+
+        self.assertEqual([type for type, _ in self._events()], [
+            "member.added", "task.created", "task.updated", "comment.added", "task.deleted",
+        ])
+        added, _, updated, comment, _ = [data for _, data in self._events()]
+        self.assertEqual(added, {"members": [{"id": self.member.pk, "email": "member@example.com", "fullname": ""}]})
+        self.assertEqual(updated["status"], "done")
+        self.assertEqual((comment["author"], comment["content"]), ("Olga", "Fertig"))
+
+    def test_events_wait_for_the_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Task.objects.create(board=self.board, title="Task", status="review")
+
+        self.assertEqual(self._events(), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual([type for type, _ in self._events()], ["task.created"])
+
+    def test_moving_a_task_is_a_delete_and_a_create(self):
+        other = Board.objects.create(title="Other", owner=self.owner)
+        task = Task.objects.create(board=self.board, title="Task", status="review")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.board = other
+            task.save()
+
+        self.assertEqual(self._events(), [("task.deleted", {"id": task.pk})])
+        self.assertEqual([type for type, _ in self._events(other)], ["task.created"])
+
+    def test_deleting_a_member_removes_them(self):
+        self.board.members.add(self.member)
+        own = Board.objects.create(title="Own", owner=self.member)
+        member_id = self.member.pk
+
+        backend = events.get_backend()
+
+        with mock.patch.object(backend, "publish", wraps=backend.publish) as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.member.delete()
+
+        self.assertEqual(self._events()[-1], ("member.removed", {"ids": [member_id]}))
+        self.assertEqual(
+            [call.args for call in publish.call_args_list if call.args[0] == own.pk],
+            [(own.pk, "board.deleted", {"id": own.pk})],
+        )
+
+    def test_bulk_endpoint_publishes_every_task(self):
+        item = {
+            "board": self.board.pk, "title": "Bulk", "description": "", "status": "review", "priority": "low",
+            "assignee_id": self.owner.pk, "reviewer_id": self.owner.pk, "due_date": "2025-06-01",
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/tasks/bulk/", [item, item], format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([type for type, _ in self._events()], ["task.created", "task.created"])
+
+
+class TestReplayBuffer(TestCase):
+    def _check_backend(self, backend):
+        for i in range(5):
+            backend.publish(1, "task.updated", {"id": i})
+
+        self.assertEqual([event.id for event in backend.replay(1, 2)], [3, 4, 5])
+        self.assertEqual(backend.replay(1, 5), [])
+        self.assertEqual(backend.replay(2, 0), [])
+        self.assertIsNone(backend.replay(1, 1), "events 2 and 3 are no longer buffered")
+        self.assertIsNone(backend.replay(1, 9), "ids from before a restart are unknown")
+
+    def test_in_memory_backend(self):
+        self._check_backend(events.InMemoryEventBackend(buffer_size=3))
+
+    def test_in_memory_backend_forgets_deleted_boards(self):
+        backend = events.InMemoryEventBackend()
+        backend.publish(1, "task.updated", {"id": 1})
+        backend.publish(2, "task.updated", {"id": 2})
+
+        event = backend.publish(1, "board.deleted", {"id": 1})
+
+        self.assertEqual(event.id, 2)
+        self.assertEqual((set(backend._buffers), set(backend._last_ids)), ({2}, {2}))
+
+    def test_cache_backend(self):
+        events.get_cache().clear()
+        self._check_backend(events.CacheEventBackend(buffer_size=3))
+
+    async def test_cache_backend_subscribers_poll(self):
+        await sync_to_async(events.get_cache().clear)()
+        backend = events.CacheEventBackend(poll_interval=0.01)
+        subscription = backend.subscribe(1)
+
+        self.assertIsNone(await subscription.next(0.02))
+        await sync_to_async(backend.publish)(1, "task.deleted", {"id": 3})
+        event = await subscription.next(1)
+
+        self.assertEqual((event.id, event.type, event.data), (1, "task.deleted", {"id": 3}))
+
+
+class TestEventStream(TestCase):
+    def setUp(self):
+        events.get_backend.cache_clear()
+        token_cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+        self.auth = f"Token {Token.objects.create(user=self.owner).key}"
+
+    async def _open(self, auth=None, **headers):
+        headers["Authorization"] = auth or self.auth
+        return await self.async_client.get(f"/api/boards/{self.board.pk}/events/", headers=headers)
+
+    async def _read(self, stream, count):
+        return [_parse(await asyncio.wait_for(anext(stream), 5)) for _ in range(count)]
+
+    @sync_to_async
+    def _write(self, write):
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+
+    def _publish(self, count):
+        for i in range(count):
+            events.get_backend().publish(self.board.pk, "task.updated", {"id": i})
+
+    async def test_streams_live_changes(self):
+        response = await self._open()
+        stream = response.streaming_content
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(await self._read(stream, 1), [{"retry": "3000"}])
+
+        await self._write(lambda: Task.objects.create(board=self.board, title="Live", status="review"))
+        [event] = await self._read(stream, 1)
+        await stream.aclose()
+
+        self.assertEqual((event["id"], event["event"], event["data"]["title"]), ("1", "task.created", "Live"))
+
+    async def test_resumes_after_last_event_id(self):
+        self._publish(3)
+
+        response = await self._open(Last_Event_ID="1")
+        stream = response.streaming_content
+        chunks = await self._read(stream, 3)
+        await stream.aclose()
+
+        self.assertEqual([chunk.get("id") for chunk in chunks], [None, "2", "3"])
+
+    @override_settings(KANBAN_EVENTS_BUFFER_SIZE=2)
+    async def test_resets_when_missed_events_are_gone(self):
+        self._publish(5)
+
+        response = await self._open(Last_Event_ID="1")
+        stream = response.streaming_content
+        _, reset = await self._read(stream, 2)
+        await stream.aclose()
+
+        self.assertEqual((reset["id"], reset["event"]), ("5", "reset"))
+
+    async def test_stream_ends_when_the_board_is_deleted(self):
+        response = await self._open()
+        stream = response.streaming_content
+        await self._read(stream, 1)
+
+        await self._write(self.board.delete)
+        [event] = await self._read(stream, 1)
+
+        self.assertEqual(event["event"], "board.deleted")
+        with self.assertRaises(StopAsyncIteration):
+            await asyncio.wait_for(anext(stream), 5)
+
+    def test_refused_under_wsgi(self):
+        response = self.client.get(f"/api/boards/{self.board.pk}/events/", headers={"Authorization": self.auth})
+
+        self.assertEqual(response.status_code, 501)
+        self.assertFalse(response.streaming)
+
+    async def test_requires_access(self):
+        stranger = f"Token {(await Token.objects.acreate(user=self.stranger)).key}"
+
+        self.assertEqual((await self._open(auth=stranger)).status_code, 404)
+        self.assertEqual((await self._open(auth="Token nope")).status_code, 401)
@@ -0,0 +1,75 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Column, Comment, Task
+
+
+class TestBoardExport(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="owner", email="owner@example.com", password="pass1234", first_name="Olga",
+        )
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        Column.objects.create(board=self.board, title="To Do", order=1)
+        self._add_tasks(3)
+        self.client.force_authenticate(user=self.user)
+        self.url = f"/api/boards/{self.board.id}/export/"
+
+    def _add_tasks(self, count):
+        for i in range(count):
+            task = Task.objects.create(board=self.board, title=f"Task {i}", assignee=self.member, status="review")
+            Comment.objects.create(task=task, user=self.user, content=f"Kommentar {i}")
+
+    def _export(self, query=""):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url + query)
+            body = b"".join(response.streaming_content).decode()
+        return response, body, len(ctx.captured_queries)
+
+    def test_ndjson_export(self):
+        response, body, _ = self._export()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(
+            [record["type"] for record in records],
+            ["board", "member", "column", "task", "task", "task", "comment", "comment", "comment"],
+        )
+        self.assertEqual(records[0]["data"]["owner_email"], "owner@example.com")
+        self.assertEqual(records[3]["data"]["assignee_email"], "member@example.com")
+        self.assertEqual(records[-1]["data"]["author"], "Olga")
+
+    def test_json_export(self):
+        response, body, _ = self._export("?output=json")
+
+        document = json.loads(body)
+        self.assertEqual(document["board"]["id"], self.board.id)
+        self.assertEqual(len(document["members"]), 1)
+        self.assertEqual(len(document["columns"]), 1)
+        self.assertEqual(len(document["tasks"]), 3)
+        self.assertEqual(len(document["comments"]), 3)
+
+    def test_query_count_does_not_grow_with_the_board(self):
+        _, _, small = self._export()
+        self._add_tasks(50)
+
+        _, body, large = self._export()
+
+        self.assertEqual(len(body.splitlines()), 1 + 1 + 1 + 53 + 53)
+        self.assertEqual(large, small)
+
+    def test_rejects_unknown_output(self):
+        self.assertEqual(self.client.get(self.url + "?output=xml").status_code, 400)
+
+    def test_strangers_cannot_export(self):
+        stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.client.force_authenticate(user=stranger)
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
@@ -0,0 +1,167 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.importer import BoardImporter, ndjson_records
+from kanban_app.models import Board, Column, Comment, Task
+
+
+class TestBoardImport(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass1234")
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.outsider = User.objects.create_user(username="outsider", email="outsider@example.com", password="pass1234")
+        self.client.force_authenticate(user=self.user)
+
+    def _records(self, tasks=3):
+        records = [
+            {"type": "board", "data": {"id": 99, "title": "Alt", "description": "Aus Trello"}},
+            {"type": "member", "data": {"email": "MEMBER@example.com"}},
+            {"type": "member", "data": {"email": "ghost@example.com"}},
+            {"type": "column", "data": {"title": "To Do", "position": 1}},
+        ]
+        for i in range(tasks):
+            records.append({"type": "task", "data": {
+                "id": 1000 + i, "title": f"Task {i}", "status": "review", "priority": "high",
+                "assignee_email": "member@example.com", "reviewer_email": "outsider@example.com",
+                "due_date": "2026-01-31",
+            }})
+        for i in range(tasks):
+            records.append({"type": "comment", "data": {
+                "task": 1000 + i, "author_email": "member@example.com", "content": f"Kommentar {i}",
+            }})
+        return records
+
+    def _ndjson(self, records):
+        return "".join(json.dumps(record) + "\n" for record in records)
+
+    def test_ndjson_import(self):
+        response = self.client.post(
+            "/api/boards/import/", self._ndjson(self._records()), content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        board = Board.objects.get(pk=response.data["board"])
+        self.assertEqual((board.title, board.owner), ("Alt", self.user))
+        self.assertEqual(list(board.members.all()), [self.member])
+        self.assertEqual(board.columns.count(), 1)
+        tasks = list(board.tasks.all())
+        self.assertEqual(len(tasks), 3)
+        self.assertEqual({(t.assignee_id, t.reviewer_id) for t in tasks}, {(self.member.id, None)})
+        self.assertEqual(Comment.objects.filter(task__board=board, user=self.member).count(), 3)
+        self.assertEqual(response.data["rows"], 1 + 1 + 1 + 3 + 3)
+        self.assertEqual(response.data["skipped"], {"unknown member email": 1, "reviewer not on board": 3})
+        self.assertIn("rows_per_second", response.data)
+
+    def test_invalid_status_and_priority_are_skipped(self):
+        records = self._records()
+        records[4]["data"]["status"] = "erledigt"
+        records[5]["data"]["priority"] = "urgent"
+        del records[6]["data"]["status"]
+
+        response = self.client.post(
+            "/api/boards/import/", self._ndjson(records), content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        board = Board.objects.get(pk=response.data["board"])
+        self.assertEqual(list(board.tasks.values_list("title", "status", "priority")), [("Task 2", "to-do", "high")])
+        self.assertEqual(response.data["skipped"], {
+            "unknown member email": 1, "invalid status": 1, "invalid priority": 1,
+            "reviewer not on board": 1, "comment for unknown task": 2,
+        })
+
+    def test_values_of_the_wrong_type_are_skipped(self):
+        records = self._records(tasks=4)
+        records[0]["data"]["description"] = {"text": "Aus Trello"}
+        records[4]["data"]["status"] = ["done"]
+        records[5]["data"]["priority"] = {"level": "high"}
+        records[6]["data"]["id"] = [1002]
+        records[7]["data"]["description"] = 42
+        records.append({"type": "comment", "data": {"task": {"id": 1000}, "content": "Verwaist"}})
+
+        response = self.client.post(
+            "/api/boards/import/", self._ndjson(records), content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        board = Board.objects.get(pk=response.data["board"])
+        self.assertEqual(board.description, "{'text': 'Aus Trello'}")
+        self.assertEqual(list(board.tasks.values_list("title", "description")), [("Task 3", "42")])
+        self.assertEqual(response.data["skipped"], {
+            "unknown member email": 1, "invalid status": 1, "invalid priority": 1, "invalid task id": 1,
+            "reviewer not on board": 1, "comment for unknown task": 4,
+        })
+
+    def test_export_round_trip(self):
+        source = Board.objects.create(title="Quelle", owner=self.user)
+        source.members.add(self.member)
+        Column.objects.create(board=source, title="Done", order=2)
+        task = Task.objects.create(board=source, title="Task", assignee=self.member, status="review")
+        Comment.objects.create(task=task, user=self.member, content="Hallo")
+        exported = self.client.get(f"/api/boards/{source.id}/export/?output=json")
+        body = b"".join(exported.streaming_content)
+
+        response = self.client.post("/api/boards/import/", body, content_type="application/json")
+
+        self.assertEqual(response.status_code, 201)
+        board = Board.objects.get(pk=response.data["board"])
+        self.assertNotEqual(board.pk, source.pk)
+        self.assertEqual(board.tasks.get().assignee, self.member)
+        self.assertEqual(Comment.objects.get(task__board=board).content, "Hallo")
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def import_queries(tasks):
+            with CaptureQueriesContext(connection) as ctx:
+                BoardImporter(self.user, batch_size=50).run(iter(self._records(tasks)))
+            return len(ctx.captured_queries)
+
+        self.assertEqual(import_queries(10), import_queries(40))
+
+    def test_batches_bound_the_inserts(self):
+        with CaptureQueriesContext(connection) as ctx:
+            BoardImporter(self.user, batch_size=10).run(iter(self._records(25)))
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "kanban_app_task"')]
+        self.assertEqual(len(inserts), 3)
+        user_lookups = [q for q in ctx.captured_queries if 'FROM "auth_user"' in q["sql"]]
+        # Members resolve both known emails, tasks only the unseen outsider.
+        self.assertEqual(len(user_lookups), 2)
+
+    def test_invalid_input_rolls_back(self):
+        records = self._records()
+        records.append({"type": "task", "data": {"title": "Kaputt", "due_date": "morgen"}})
+
+        response = self.client.post(
+            "/api/boards/import/", self._ndjson(records), content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Board.objects.filter(title="Alt").exists())
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_malformed_line_is_reported(self):
+        response = self.client.post(
+            "/api/boards/import/", '{"type": "board", "data": {}}\nnope\n', content_type="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Line 2", response.data["detail"])
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as handle:
+            handle.write(self._ndjson(self._records()))
+            handle.flush()
+            out = StringIO()
+            call_command("import_board", handle.name, owner="owner", batch_size=2, stdout=out)
+
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(Task.objects.filter(board__title="Alt").count(), 3)
+
+    def test_ndjson_records_accepts_bytes(self):
+        records = list(ndjson_records([b'{"type": "board", "data": {"title": "X"}}\n', b"\n"]))
+        self.assertEqual(records, [{"type": "board", "data": {"title": "X"}}])
@@ -0,0 +1,56 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Task
+
+
+class TestBoardListQueries(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.client.force_authenticate(user=self.user)
+
+    def _create_board(self, owner, members=(), tasks=()):
+        board = Board.objects.create(title="Board", owner=owner)
+        board.members.set(members)
+        for status, priority in tasks:
+            Task.objects.create(board=board, title="Task", status=status, priority=priority)
+        return board
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/boards/")
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_boards(self):
+        self._create_board(self.user, members=[self.other], tasks=[("to-do", "high")])
+        baseline = self._count_list_queries()
+
+        for _ in range(10):
+            self._create_board(self.user, members=[self.other], tasks=[("to-do", "low"), ("done", "high")])
+            self._create_board(self.other, members=[self.user, self.other], tasks=[("review", "medium")])
+
+        self.assertEqual(self._count_list_queries(), baseline)
+
+    def test_annotated_counts_match_per_object_counts(self):
+        owned = self._create_board(
+            self.user,
+            members=[self.other],
+            tasks=[("to-do", "high"), ("to-do", "low"), ("done", "high")],
+        )
+        shared = self._create_board(self.other, members=[self.user, self.other])
+        self._create_board(self.other)
+
+        response = self.client.get("/api/boards/")
+
+        data = {board["id"]: board for board in response.data}
+        self.assertEqual(set(data), {owned.id, shared.id})
+        self.assertEqual(data[owned.id]["owner_id"], self.user.id)
+        self.assertEqual(data[owned.id]["member_count"], 1)
+        self.assertEqual(data[owned.id]["ticket_count"], 3)
+        self.assertEqual(data[owned.id]["tasks_to_do_count"], 2)
+        self.assertEqual(data[owned.id]["tasks_high_prio_count"], 2)
+        self.assertEqual(data[shared.id]["member_count"], 2)
+        self.assertEqual(data[shared.id]["ticket_count"], 0)
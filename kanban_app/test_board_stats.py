@@ -0,0 +1,109 @@
+import random
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from kanban_app import stats
+from kanban_app.models import Board, BoardStats, Task
+
+# The statuses both the task and the bulk serializers accept; the ORM
+# operation adds others.
+STATUSES = ["review", "done"]
+PRIORITIES = ["low", "medium", "high"]
+
+
+class TestBoardStats(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.boards = [Board.objects.create(title=f"Board {i}", owner=self.user) for i in range(3)]
+        self.client.force_authenticate(user=self.user)
+
+    def _task_payload(self, rng, **overrides):
+        payload = {
+            "board": rng.choice(self.boards).pk, "title": "Task", "description": "",
+            "status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES),
+            "assignee_id": self.user.pk, "reviewer_id": self.user.pk, "due_date": "2025-06-01",
+        }
+        payload.update(overrides)
+        return payload
+
+    def _random_operation(self, rng):
+        tasks = list(Task.objects.values_list("pk", flat=True))
+        operation = rng.choice(["create", "create", "update", "move", "delete", "bulk_create", "bulk_update", "orm"])
+        if operation == "create" or not tasks:
+            response = self.client.post("/api/tasks/", self._task_payload(rng), format="json")
+        elif operation == "update":
+            response = self.client.patch(
+                f"/api/tasks/{rng.choice(tasks)}/",
+                {"status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES)}, format="json",
+            )
+        elif operation == "move":
+            response = self.client.patch(
+                f"/api/tasks/{rng.choice(tasks)}/", {"board": rng.choice(self.boards).pk}, format="json",
+            )
+        elif operation == "delete":
+            response = self.client.delete(f"/api/tasks/{rng.choice(tasks)}/")
+        elif operation == "bulk_create":
+            response = self.client.post(
+                "/api/tasks/bulk/", [self._task_payload(rng) for _ in range(rng.randint(1, 5))], format="json",
+            )
+        elif operation == "bulk_update":
+            response = self.client.patch("/api/tasks/bulk/", [
+                {"id": pk, "status": rng.choice(STATUSES), "priority": rng.choice(PRIORITIES)}
+                for pk in rng.sample(tasks, min(len(tasks), 3))
+            ], format="json")
+        else:
+            task = Task.objects.get(pk=rng.choice(tasks))
+            task.status = rng.choice(["to-do", "in_progress", *STATUSES])
+            task.priority = rng.choice(PRIORITIES)
+            task.save()
+            return
+        self.assertLess(response.status_code, 300, (operation, response.content))
+
+    def test_counters_match_the_tasks_after_random_operations(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            for _ in range(40):
+                self._random_operation(rng)
+            with self.subTest(seed=seed):
+                self.assertEqual(stats.rebuild(), [])
+
+    def test_board_list_reads_the_counters(self):
+        board = self.boards[0]
+        Task.objects.create(board=board, title="A", status="to-do", priority="high")
+        Task.objects.create(board=board, title="B", status="done", priority="high")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/boards/")
+
+        row = next(item for item in response.data if item["id"] == board.pk)
+        self.assertEqual((row["ticket_count"], row["tasks_to_do_count"], row["tasks_high_prio_count"]), (2, 1, 2))
+        self.assertFalse(any("kanban_app_task" in query["sql"] for query in ctx.captured_queries))
+
+    def test_counts_per_status_and_priority(self):
+        board = self.boards[0]
+        task = Task.objects.create(board=board, title="A", status="to-do", priority="low")
+        task.status = "done"
+        task.save()
+        Task.objects.create(board=board, title="B", status="done", priority="high")
+
+        board_stats = BoardStats.objects.get(board=board)
+        self.assertEqual(board_stats.task_count, 2)
+        self.assertEqual(board_stats.status_counts, {"done": 2})
+        self.assertEqual(board_stats.priority_counts, {"high": 1, "low": 1})
+
+    def test_rebuild_command_repairs_drift(self):
+        Task.objects.create(board=self.boards[1], title="A", status="review", priority="low")
+        BoardStats.objects.filter(board=self.boards[1]).update(task_count=7, status_counts={})
+        BoardStats.objects.filter(board=self.boards[2]).delete()
+        out = StringIO()
+
+        call_command("rebuild_board_stats", stdout=out)
+
+        self.assertIn("Repaired the counters of 2 board(s).", out.getvalue())
+        self.assertEqual(BoardStats.objects.get(board=self.boards[1]).status_counts, {"review": 1})
+        self.assertEqual(stats.rebuild(), [])
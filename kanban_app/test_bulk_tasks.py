@@ -0,0 +1,114 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Task
+
+
+class TestBulkTasks(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.member = User.objects.create_user(username="member", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        self.foreign_board = Board.objects.create(title="Fremd", owner=self.stranger)
+        self.client.force_authenticate(user=self.user)
+
+    def _item(self, i, **overrides):
+        item = {
+            "board": self.board.id, "title": f"Task {i}", "description": "",
+            "status": "review", "priority": "medium",
+            "assignee_id": self.member.id, "reviewer_id": self.user.id,
+            "due_date": "2025-06-01",
+        }
+        item.update(overrides)
+        return item
+
+    def _non_inserts(self, ctx):
+        return len([query for query in ctx.captured_queries if not query["sql"].startswith("INSERT")])
+
+    def _create(self, items):
+        return self.client.post("/api/tasks/bulk/", items, format="json")
+
+    def test_bulk_create_with_constant_queries(self):
+        with CaptureQueriesContext(connection) as small:
+            response = self._create([self._item(i) for i in range(5)])
+        self.assertEqual(response.status_code, 201)
+
+        with CaptureQueriesContext(connection) as large:
+            response = self._create([self._item(i) for i in range(1000)])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Task.objects.count(), 1005)
+        self.assertEqual(len(response.data["results"]), 1000)
+        ids = {result["id"] for result in response.data["results"]}
+        self.assertEqual(len(ids), 1000)
+        self.assertEqual(Task.objects.filter(pk__in=ids).count(), 1000)
+        # Only the number of INSERT batches grows with the payload.
+        self.assertEqual(self._non_inserts(large), self._non_inserts(small))
+
+    def test_invalid_items_abort_the_whole_batch(self):
+        response = self._create([
+            self._item(0),
+            self._item(1, assignee_id=self.stranger.id),
+            self._item(2, board=self.foreign_board.id),
+            self._item(3, status="unknown"),
+            "not a task",
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.count(), 0)
+        results = response.data["results"]
+        self.assertNotIn("errors", results[0])
+        self.assertIn("assignee", results[1]["errors"])
+        self.assertIn("board", results[2]["errors"])
+        self.assertIn("status", results[3]["errors"])
+        self.assertIn("errors", results[4])
+
+    def test_bulk_update(self):
+        tasks = [
+            Task.objects.create(board=self.board, title=f"Task {i}", status="review", assignee=self.member)
+            for i in range(20)
+        ]
+        payload = [{"id": task.id, "status": "done", "priority": "high", "assignee_id": self.user.id} for task in tasks]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch("/api/tasks/bulk/", payload, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(len(ctx.captured_queries), 15)
+        self.assertEqual(Task.objects.filter(status="done", priority="high", assignee=self.user).count(), 20)
+        self.assertEqual([result["id"] for result in response.data["results"]], [task.id for task in tasks])
+
+    def test_bulk_update_rejects_foreign_tasks_and_board_moves(self):
+        own = Task.objects.create(board=self.board, title="Eigene", status="review")
+        foreign = Task.objects.create(board=self.foreign_board, title="Fremde", status="review")
+
+        response = self.client.patch("/api/tasks/bulk/", [
+            {"id": own.id, "status": "done"},
+            {"id": foreign.id, "status": "done"},
+            {"id": own.id, "board": self.foreign_board.id},
+        ], format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("id", response.data["results"][1]["errors"])
+        self.assertIn("board", response.data["results"][2]["errors"])
+        own.refresh_from_db()
+        foreign.refresh_from_db()
+        self.assertEqual(own.status, "review")
+        self.assertEqual(foreign.status, "review")
+
+    def test_bulk_writes_invalidate_board_reads(self):
+        url = f"/api/boards/{self.board.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        self._create([self._item(0)])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["tasks"]), 1)
+
+    def test_rejects_empty_or_non_list_payloads(self):
+        self.assertEqual(self._create([]).status_code, 400)
+        self.assertEqual(self._create({"title": "x"}).status_code, 400)
@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Comment, Task
+
+
+class TestConditionalGet(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.member = User.objects.create_user(username="member", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(board=self.board, title="Task", assignee=self.user)
+        self.comment = Comment.objects.create(task=self.task, user=self.user, content="Hallo")
+        self.client.force_authenticate(user=self.user)
+
+    def _revalidate(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+        return first["ETag"]
+
+    def _status(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code
+
+    def test_unchanged_board_detail_returns_304_without_serializing(self):
+        url = f"/api/boards/{self.board.id}/"
+        etag = self._revalidate(url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_if_modified_since(self):
+        url = f"/api/boards/{self.board.id}/"
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_lists_send_no_last_modified(self):
+        # Removing a board from the list moves no remaining timestamp.
+        Board.objects.create(title="Zweites", owner=self.user)
+        for url in ["/api/boards/", "/api/tasks/", "/api/dashboard/"]:
+            response = self.client.get(url)
+            self.assertIn("ETag", response, url)
+            self.assertNotIn("Last-Modified", response, url)
+
+        etag = self._revalidate("/api/boards/")
+        Board.objects.get(title="Zweites").delete()
+        self.assertEqual(self._status("/api/boards/", etag), 200)
+
+    def test_deleting_a_member_changes_the_etag(self):
+        url = f"/api/boards/{self.board.id}/"
+        etag = self._revalidate(url)
+
+        self.member.delete()
+
+        self.assertEqual(self._status(url, etag), 200)
+
+    def test_board_content_writes_change_the_etag(self):
+        urls = ["/api/boards/", f"/api/boards/{self.board.id}/"]
+        writes = [
+            lambda: Task.objects.create(board=self.board, title="Neu"),
+            lambda: Task.objects.filter(pk=self.task.pk).first().save(),
+            lambda: Comment.objects.create(task=self.task, user=self.user, content="Noch einer"),
+            lambda: Comment.objects.get(pk=self.comment.pk).delete(),
+            lambda: self.board.members.remove(self.member),
+            lambda: Task.objects.get(pk=self.task.pk).delete(),
+        ]
+        for write in writes:
+            etags = {url: self._revalidate(url) for url in urls}
+            write()
+            for url, etag in etags.items():
+                self.assertEqual(self._status(url, etag), 200, url)
+
+    def test_task_reads(self):
+        urls = ["/api/tasks/", "/api/tasks/assigned-to-me/", f"/api/tasks/{self.task.id}/"]
+        etags = {url: self._revalidate(url) for url in urls}
+        for url, etag in etags.items():
+            self.assertEqual(self._status(url, etag), 304, url)
+
+        self.task.title = "Umbenannt"
+        self.task.save()
+
+        for url, etag in etags.items():
+            self.assertEqual(self._status(url, etag), 200, url)
+
+    def test_comment_list(self):
+        url = f"/api/tasks/{self.task.id}/comments/"
+        etag = self._revalidate(url)
+        self.assertEqual(self._status(url, etag), 304)
+
+        Comment.objects.create(task=self.task, user=self.member, content="Antwort")
+
+        self.assertEqual(self._status(url, etag), 200)
+
+    def test_etag_is_per_user(self):
+        url = f"/api/boards/{self.board.id}/"
+        etag = self._revalidate(url)
+
+        self.client.force_authenticate(user=self.member)
+
+        self.assertEqual(self._status(url, etag), 200)
+
+    def test_access_is_checked_before_revalidation(self):
+        stranger = User.objects.create_user(username="stranger", password="pass1234")
+        url = f"/api/boards/{self.board.id}/"
+        etag = self._revalidate(url)
+
+        self.client.force_authenticate(user=stranger)
+
+        self.assertEqual(self._status(url, etag), 404)
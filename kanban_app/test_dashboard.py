@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from kanban_app.cache import get_cache
+from kanban_app.models import Board, Task
+
+
+class TestDashboard(APITestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.today = timezone.localdate()
+        self.own = Board.objects.create(title="Eigenes", owner=self.user)
+        self.shared = Board.objects.create(title="Geteilt", owner=self.other)
+        self.shared.members.add(self.user)
+        self.foreign = Board.objects.create(title="Fremd", owner=self.other)
+        self.overdue = self._task(self.own, "Overdue", assignee=self.user, priority="high", due=-2)
+        self.soon = self._task(self.shared, "Soon", assignee=self.user, reviewer=self.user, due=0)
+        self.review = self._task(self.shared, "Review", assignee=self.other, reviewer=self.user, due=30)
+        self._task(self.own, "Done", assignee=self.user, priority="high", status="done", due=-5)
+        self._task(self.shared, "Not mine", assignee=self.other, priority="high", due=-1)
+        self._task(self.foreign, "No access", assignee=self.user, priority="high", due=-1)
+        self.client.force_authenticate(user=self.user)
+
+    def _task(self, board, title, assignee=None, reviewer=None, priority="medium", status="review", due=None):
+        return Task.objects.create(
+            board=board, title=title, assignee=assignee, reviewer=reviewer, priority=priority, status=status,
+            due_date=None if due is None else self.today + timedelta(days=due),
+        )
+
+    def test_aggregates_the_users_work(self):
+        response = self.client.get("/api/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        self.assertEqual(sorted(board["title"] for board in data["boards"]), ["Eigenes", "Geteilt"])
+        own = next(board for board in data["boards"] if board["id"] == self.own.pk)
+        self.assertEqual((own["ticket_count"], own["tasks_high_prio_count"]), (2, 2))
+        self.assertEqual(
+            sorted(task["title"] for task in data["assigned_to_me"]), ["Done", "Overdue", "Soon"],
+        )
+        self.assertEqual(sorted(task["title"] for task in data["reviewing"]), ["Review", "Soon"])
+        self.assertEqual([task["title"] for task in data["urgent"]], ["Overdue"])
+        self.assertEqual(data["counts"], {
+            "boards": 2, "assigned_to_me": 3, "reviewing": 2, "urgent": 1, "overdue": 1, "due_this_week": 1,
+        })
+
+    def test_fixed_number_of_queries(self):
+        for i in range(10):
+            board = Board.objects.create(title=f"Mehr {i}", owner=self.other)
+            board.members.add(self.user)
+            self._task(board, "Extra", assignee=self.user, reviewer=self.user, due=i)
+
+        # Two queries however many boards and tasks the user has.
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/dashboard/")
+        self.assertEqual(response.data["counts"]["boards"], 12)
+
+    def test_conditional_get(self):
+        etag = self.client.get("/api/dashboard/")["ETag"]
+
+        self.assertEqual(self.client.get("/api/dashboard/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.soon.priority = "high"
+        self.soon.save()
+        self.assertEqual(self.client.get("/api/dashboard/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    @override_settings(KANBAN_DASHBOARD_CACHE_TIMEOUT=30)
+    def test_optional_per_user_cache(self):
+        self.assertEqual(self.client.get("/api/dashboard/")["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/dashboard/")
+
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.client.force_authenticate(user=self.other)
+        self.assertEqual(self.client.get("/api/dashboard/")["X-Cache"], "MISS")
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+
+        self.assertEqual(self.client.get("/api/dashboard/").status_code, 401)
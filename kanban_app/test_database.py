@@ -0,0 +1,112 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from core.database import database_config, sqlite_init_command, sqlite_pragmas
+from kanban_app.models import Board, Task
+
+
+class TestDatabaseConfig(SimpleTestCase):
+    base_dir = Path("/srv/kanban")
+
+    def test_sqlite_is_the_default(self):
+        config = database_config({}, self.base_dir)
+
+        self.assertEqual(config["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual(config["NAME"], self.base_dir / "db.sqlite3")
+        self.assertEqual(config["OPTIONS"], {
+            "transaction_mode": "IMMEDIATE",
+            "init_command": "PRAGMA journal_mode = WAL; PRAGMA synchronous = NORMAL; PRAGMA busy_timeout = 5000",
+        })
+        self.assertEqual(config["CONN_MAX_AGE"], 60)
+
+    def test_postgresql_with_persistent_connections(self):
+        config = database_config({
+            "DB_ENGINE": "postgresql", "DB_NAME": "kanban", "DB_HOST": "db", "DB_CONN_MAX_AGE": "300",
+        }, self.base_dir)
+
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual((config["HOST"], config["CONN_MAX_AGE"]), ("db", 300))
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+        self.assertNotIn("pool", config["OPTIONS"])
+
+    def test_postgresql_with_pool(self):
+        config = database_config({"DB_ENGINE": "postgres", "DB_POOL_MAX_SIZE": "20"}, self.base_dir)
+
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+        self.assertEqual(config["OPTIONS"]["pool"], {"min_size": 2, "max_size": 20, "timeout": 10})
+
+    def test_invalid_values(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_config({"DB_ENGINE": "oracle"}, self.base_dir)
+        with self.assertRaises(ImproperlyConfigured):
+            database_config({"DB_CONN_MAX_AGE": "forever"}, self.base_dir)
+
+    def test_sqlite_pragmas(self):
+        self.assertEqual(
+            sqlite_pragmas({"SQLITE_BUSY_TIMEOUT": "250"}),
+            {"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 250},
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            sqlite_init_command({"journal_mode": "WAL; DROP TABLE auth_user"})
+        with self.assertRaises(ImproperlyConfigured):
+            database_config({"SQLITE_SYNCHRONOUS": "OFF --"}, self.base_dir)
+
+
+class TestSqlitePragmas(TestCase):
+    def test_new_connections_are_tuned(self):
+        if connection.vendor != "sqlite" or connection.is_in_memory_db():
+            self.skipTest("needs a file-based SQLite database")
+        with connection.cursor() as cursor:
+            values = [cursor.execute(f"PRAGMA {name}").fetchone()[0]
+                      for name in ("journal_mode", "synchronous", "busy_timeout")]
+
+        self.assertEqual(values, ["wal", 1, 5000])
+
+
+class TestConcurrentTaskCreation(TransactionTestCase):
+    threads = 8
+    tasks_per_thread = 20
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("in-memory SQLite shares one connection cache")
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+
+    def _create_tasks(self, worker, failures):
+        client = APIClient()
+        client.force_authenticate(user=self.owner)
+        try:
+            for i in range(self.tasks_per_thread):
+                response = client.post("/api/tasks/", {
+                    "board": self.board.id, "title": f"Task {worker}-{i}", "status": "review",
+                    "priority": "low", "assignee_id": self.owner.id, "reviewer_id": self.owner.id,
+                })
+                if response.status_code != 201:
+                    failures.append((worker, i, response.status_code))
+        except Exception as exc:
+            failures.append((worker, repr(exc)))
+        finally:
+            connections.close_all()
+
+    def test_parallel_writers_neither_deadlock_nor_lose_tasks(self):
+        failures = []
+        start = threading.Barrier(self.threads)
+
+        def run(worker):
+            start.wait()
+            self._create_tasks(worker, failures)
+
+        with ThreadPoolExecutor(self.threads) as pool:
+            futures = [pool.submit(run, worker) for worker in range(self.threads)]
+            _, pending = wait(futures, timeout=120)
+
+        self.assertFalse(pending, "writers did not finish (deadlock?)")
+        self.assertEqual(failures, [])
+        self.assertEqual(Task.objects.filter(board=self.board).count(), self.threads * self.tasks_per_thread)
@@ -0,0 +1,40 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Column, Comment, Task
+
+
+class TestExplainEndpoints(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        task = Task.objects.create(board=self.board, title="Task", assignee=self.user, reviewer=self.user)
+        Comment.objects.create(task=task, user=self.user, content="Hallo")
+        Column.objects.create(board=self.board, title="To Do", order=1)
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("explain_endpoints", *args, stdout=out)
+        return out.getvalue()
+
+    def test_reports_every_endpoint(self):
+        output = self._run("--verbosity", "2")
+
+        for url in ["/api/boards/", f"/api/boards/{self.board.id}/", "/api/tasks/assigned-to-me/",
+                    "/api/tasks/reviewing/", "/api/columns/"]:
+            self.assertIn(f"GET {url} ", output)
+        self.assertIn("queries with full table scans", output)
+
+    def test_hot_filters_use_the_composite_indexes(self):
+        output = self._run("--verbosity", "2")
+
+        for index in ["task_board_due_idx", "task_assignee_due_idx", "task_reviewer_due_idx",
+                      "comment_task_created_idx", "column_board_order_idx"]:
+            self.assertIn(index, output)
+
+    def test_unknown_user(self):
+        with self.assertRaises(CommandError):
+            self._run("--user", "nobody")
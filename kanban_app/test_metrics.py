@@ -0,0 +1,76 @@
+import re
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.metrics import registry
+from kanban_app.models import Board, Task
+
+
+class TestRequestMetrics(APITestCase):
+    def setUp(self):
+        registry.reset()
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        for i in range(3):
+            Task.objects.create(board=self.board, title=f"Task {i}", status="review")
+        self.client.force_authenticate(user=self.user)
+
+    def _metrics(self):
+        staff = User.objects.create_user(username="staff", password="pass1234", is_staff=True)
+        self.client.force_authenticate(user=staff)
+        response = self.client.get("/api/_metrics/")
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def test_server_timing_header(self):
+        response = self.client.get("/api/tasks/")
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'^total;dur=[\d.]+, db;dur=[\d.]+;desc="2 queries", serialize;dur=[\d.]+, render;dur=[\d.]+$')
+
+    def test_requests_are_aggregated_per_view_and_action(self):
+        self.client.get("/api/boards/")
+        self.client.get("/api/boards/")
+        self.client.get(f"/api/boards/{self.board.id}/")
+
+        text = self._metrics()
+
+        self.assertIn('kanban_requests_total{view="BoardViewSet",action="list",status="200"} 2', text)
+        self.assertIn('kanban_requests_total{view="BoardViewSet",action="retrieve",status="200"} 1', text)
+        self.assertIn('kanban_request_duration_seconds_count{view="BoardViewSet",action="list"} 2', text)
+        self.assertIn('kanban_db_queries_bucket{view="BoardViewSet",action="list",le="+Inf"} 2', text)
+        self.assertRegex(text, r'kanban_response_size_bytes_sum\{view="BoardViewSet",action="retrieve"\} [1-9]')
+        # The scrape itself is not recorded.
+        self.assertNotIn("MetricsView", text)
+
+    def test_serializer_time_is_recorded_once_per_request(self):
+        self.client.get("/api/tasks/")
+
+        text = self._metrics()
+
+        self.assertIn('kanban_serializer_duration_seconds_count{view="TaskViewSet",action="list"} 1', text)
+        sums = re.findall(r'kanban_serializer_duration_seconds_sum\{view="TaskViewSet",action="list"\} (\S+)', text)
+        self.assertGreater(float(sums[0]), 0)
+
+    def test_closed_to_non_staff_without_token(self):
+        self.assertEqual(self.client.get("/api/_metrics/").status_code, 403)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get("/api/_metrics/").status_code, 403)
+
+    @override_settings(KANBAN_METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get("/api/_metrics/").status_code, 403)
+
+        response = self.client.get("/api/_metrics/", HTTP_AUTHORIZATION="Bearer secret")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+
+    @override_settings(KANBAN_METRICS_ENABLED=False)
+    def test_can_be_disabled(self):
+        response = self.client.get("/api/boards/")
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertNotIn("BoardViewSet", self._metrics())
@@ -0,0 +1,117 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.api.serializers import BoardSummarySerializer, TaskSerializer
+from kanban_app.models import Board, Column, Comment, Task
+from kanban_app.nplusone import NPlusOneError, NPlusOneTestMixin, QueryDetector, assert_no_n_plus_one, fingerprint
+
+
+def make_board(owner, size):
+    board = Board.objects.create(title="Board", owner=owner)
+    for i in range(size):
+        member = User.objects.create(username=f"member{i}", email=f"member{i}@example.com")
+        board.members.add(member)
+        Column.objects.create(board=board, title=f"Spalte {i}", order=i)
+        task = Task.objects.create(board=board, title=f"Task {i}", assignee=member, reviewer=owner, status="review")
+        Comment.objects.create(task=task, user=member, content="Hallo")
+    return board
+
+
+class TestListEndpointsHaveNoNPlusOne(NPlusOneTestMixin, APITestCase):
+    nplusone_threshold = 2
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.board = make_board(self.user, 8)
+        self.task = self.board.tasks.first()
+        self.client.force_authenticate(user=self.user)
+
+    def test_read_endpoints(self):
+        urls = [
+            "/api/boards/", f"/api/boards/{self.board.id}/", "/api/columns/", "/api/tasks/",
+            "/api/tasks/assigned-to-me/", "/api/tasks/reviewing/", "/api/tasks/assigned-or-reviewing/",
+            f"/api/tasks/{self.task.id}/comments/", f"/api/boards/{self.board.id}/export/",
+        ]
+        for url in urls:
+            with self.subTest(url=url), self.assertNoNPlusOne():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+
+
+class TestQueryDetector(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        make_board(self.user, 4)
+
+    def test_reports_the_serializer_field(self):
+        with QueryDetector(threshold=2) as detector:
+            TaskSerializer(Task.objects.all(), many=True).data
+
+        fields = {finding.field for finding in detector.findings()}
+        self.assertEqual(fields, {
+            "TaskSerializer.assignee", "TaskSerializer.reviewer", "TaskSerializer.comments_count",
+        })
+        self.assertTrue(all(finding.count == 4 for finding in detector.findings()))
+        self.assertIn("4x in one list serialization from TaskSerializer.comments_count", detector.report())
+
+    def test_board_summary_without_annotations(self):
+        with self.assertRaisesMessage(NPlusOneError, "BoardSummarySerializer.member_count"):
+            with assert_no_n_plus_one(threshold=0):
+                BoardSummarySerializer(Board.objects.all(), many=True).data
+
+    def test_statements_below_the_threshold_pass(self):
+        with assert_no_n_plus_one(threshold=4) as detector:
+            TaskSerializer(Task.objects.all(), many=True).data
+        self.assertEqual(detector.findings(), [])
+
+    def test_repeats_outside_list_serializers_pass(self):
+        with QueryDetector(threshold=2) as detector:
+            for task in Task.objects.all():
+                Task.objects.filter(pk=task.pk).update(title="Neu")
+                TaskSerializer(task).data
+
+        self.assertEqual(detector.findings(), [])
+
+    def test_counts_each_list_on_its_own(self):
+        tasks = list(Task.objects.all())
+
+        with QueryDetector(threshold=2) as detector:
+            for pair in (tasks[:2], tasks[2:]):
+                TaskSerializer(pair, many=True).data
+
+        self.assertEqual(detector.findings(), [])
+        self.assertEqual(max(detector.counts.values()), 2)
+
+    def test_fingerprint_ignores_values(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id = 5 AND name = 'a''b' AND x IN (%s, %s, %s)"),
+            fingerprint("SELECT *  FROM t WHERE id = 17 AND name = 'c' AND x IN (%s)"),
+        )
+
+
+class TestNPlusOneMiddleware(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        make_board(self.user, 2)
+        self.client.force_authenticate(user=self.user)
+
+    @override_settings(KANBAN_NPLUSONE_MODE="log", KANBAN_NPLUSONE_THRESHOLD=0)
+    def test_log_mode(self):
+        with self.assertLogs("kanban_app.nplusone", level="WARNING") as logs:
+            response = self.client.get("/api/tasks/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("X-NPlusOne", response)
+        self.assertIn("GET /api/tasks/", logs.output[0])
+
+    @override_settings(KANBAN_NPLUSONE_MODE="raise", KANBAN_NPLUSONE_THRESHOLD=0)
+    def test_raise_mode(self):
+        with self.assertRaises(NPlusOneError):
+            self.client.get("/api/tasks/")
+
+    def test_off_outside_debug(self):
+        response = self.client.get("/api/tasks/")
+
+        self.assertNotIn("X-NPlusOne", response)
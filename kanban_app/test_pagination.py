@@ -0,0 +1,72 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.models import Board, Column, Comment, Task
+
+
+class TestPaginationAndFields(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", password="pass1234")
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.tasks = [
+            Task.objects.create(board=self.board, title=f"Task {i}", assignee=self.user)
+            for i in range(7)
+        ]
+        for i in range(3):
+            Column.objects.create(board=self.board, title=f"Column {i}", order=i)
+            Comment.objects.create(task=self.tasks[0], user=self.user, content=f"Kommentar {i}")
+
+    def _walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_lists_stay_unpaginated_without_parameters(self):
+        for url in ["/api/tasks/", "/api/tasks/assigned-to-me/", "/api/columns/",
+                    "/api/boards/", f"/api/tasks/{self.tasks[0].id}/comments/"]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIsInstance(response.data, list)
+
+    def test_cursor_walks_every_row_once(self):
+        task_ids = self._walk("/api/tasks/?page_size=3")
+        self.assertEqual(task_ids, sorted(task.id for task in self.tasks))
+
+        assigned_ids = self._walk("/api/tasks/assigned-to-me/?page_size=2")
+        self.assertEqual(assigned_ids, task_ids)
+
+        column_ids = self._walk("/api/columns/?page_size=2")
+        self.assertEqual(len(column_ids), 3)
+
+        comment_ids = self._walk(f"/api/tasks/{self.tasks[0].id}/comments/?page_size=2")
+        self.assertEqual(len(comment_ids), 3)
+
+    def test_fields_limits_representation(self):
+        response = self.client.get("/api/tasks/?fields=id,title")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data[0]), {"id", "title"})
+
+    def test_dropped_fields_skip_their_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/tasks/?fields=id,title")
+        sql = " ".join(query["sql"] for query in ctx.captured_queries)
+
+        # The conditional GET validator plus the task list itself.
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertNotIn("kanban_app_comment", sql)
+        self.assertNotIn("auth_user", sql)
+
+    def test_full_task_list_has_constant_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/tasks/")
+
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(response.data[0]["comments_count"], 3)
+        self.assertEqual(len(ctx.captured_queries), 2)
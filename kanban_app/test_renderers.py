@@ -0,0 +1,91 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from kanban_app.api import renderers
+from kanban_app.api.parsers import FastJSONParser
+from kanban_app.api.renderers import FastJSONRenderer
+from kanban_app.models import Board
+
+PAYLOAD = {
+    "utc": datetime(2025, 3, 1, 12, 30, 5, 123456, tzinfo=dt_timezone.utc),
+    "berlin": datetime(2025, 3, 1, 12, 30, tzinfo=ZoneInfo("Europe/Berlin")),
+    "naive": datetime(2025, 3, 1, 12, 30),
+    "date": date(2025, 3, 1),
+    "time": time(8, 15, 30),
+    "duration": timedelta(hours=1, seconds=3),
+    "amount": Decimal("12.50"),
+    "lazy": gettext_lazy("Hello"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "text": "Grüße und Tschüss",
+    "nested": [{1: None, "flag": True}, (1.5, -2)],
+}
+
+
+class TestFastJSONRenderer(SimpleTestCase):
+    def test_renders_the_same_bytes_as_drf(self):
+        self.assertEqual(FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD))
+
+    def test_falls_back_to_the_stdlib(self):
+        expected = JSONRenderer().render(PAYLOAD)
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(FastJSONRenderer().render(PAYLOAD), expected)
+            self.assertEqual(renderers.dumps(PAYLOAD), expected)
+
+    def test_non_finite_floats_become_null(self):
+        # Unlike DRF's strict renderer, see the module docstring.
+        if renderers.orjson is None:
+            self.skipTest("needs orjson")
+        data = {"nan": float("nan"), "inf": float("inf")}
+
+        self.assertEqual(FastJSONRenderer().render(data), b'{"nan":null,"inf":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+
+    def test_indented_output_uses_the_stdlib(self):
+        content = FastJSONRenderer().render({"a": [1]}, "application/json; indent=2")
+
+        self.assertEqual(content, b'{\n  "a": [\n    1\n  ]\n}')
+
+
+class TestFastJSONParser(SimpleTestCase):
+    def _parse(self, content, encoding="utf-8"):
+        return FastJSONParser().parse(BytesIO(content), "application/json", {"encoding": encoding})
+
+    def test_parses_like_drf(self):
+        content = '{"title": "Grüße", "ids": [1, 2.5, null], "done": false}'.encode()
+
+        self.assertEqual(self._parse(content), JSONParser().parse(BytesIO(content)))
+        self.assertEqual(self._parse('{"title": "Grüße"}'.encode("latin-1"), "latin-1"), {"title": "Grüße"})
+        with mock.patch("kanban_app.api.parsers.orjson", None):
+            self.assertEqual(self._parse(content), JSONParser().parse(BytesIO(content)))
+
+    def test_rejects_invalid_json(self):
+        for content in [b'{"title": ', b'{"value": NaN}', b"\xff"]:
+            with self.assertRaises(ParseError):
+                self._parse(content)
+
+
+class TestJSONStack(APITestCase):
+    def test_api_reads_and_writes_json(self):
+        user = User.objects.create_user(username="user", password="pass1234")
+        self.client.force_authenticate(user=user)
+
+        response = self.client.post("/api/boards/", {"title": "Grüße", "members": []}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        board = Board.objects.get()
+        response = self.client.get(f"/api/boards/{board.pk}/", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.json()["title"], "Grüße")
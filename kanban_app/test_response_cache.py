@@ -0,0 +1,140 @@
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from kanban_app.cache import response_cache_stats
+from kanban_app.models import Board, Column, Comment, Task
+
+
+class TestResponseCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        response_cache_stats.reset()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass1234")
+        self.member = User.objects.create_user(username="member", email="member@example.com", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.other_board = Board.objects.create(title="Other", owner=self.user)
+        self.task = Task.objects.create(board=self.board, title="Task", status="to-do")
+        self.client.force_authenticate(user=self.user)
+        self.detail_url = f"/api/boards/{self.board.id}/"
+
+    def _get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def _assert_fresh(self, *urls):
+        """Warms the cache, then checks it agrees with an uncached response."""
+        for url in urls:
+            cached = self._get(url)
+            with override_settings(KANBAN_RESPONSE_CACHE_TIMEOUT=0):
+                fresh = self._get(url)
+            self.assertEqual(cached.content, fresh.content, url)
+
+    def _warm(self):
+        self._get("/api/boards/")
+        self._get(self.detail_url)
+        self._get(f"/api/boards/{self.other_board.id}/")
+
+    def test_repeated_reads_hit_the_cache(self):
+        first = self._get(self.detail_url)
+        second = self._get(self.detail_url)
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(response_cache_stats.snapshot()["hits"], 1)
+        self.assertEqual(response_cache_stats.snapshot()["misses"], 1)
+
+    def test_task_writes_invalidate(self):
+        self._warm()
+        response = self.client.post("/api/tasks/", {
+            "board": self.board.id, "title": "Neu", "status": "review", "priority": "high",
+            "assignee_id": self.user.id, "reviewer_id": self.user.id,
+        })
+        self.assertEqual(response.status_code, 201)
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+        self._warm()
+        self.task.priority = "high"
+        self.task.save()
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+        self._warm()
+        self.task.delete()
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+    def test_task_moved_to_another_board_invalidates_both(self):
+        self._warm()
+        self.task.board = self.other_board
+        self.task.save()
+        self._assert_fresh("/api/boards/", self.detail_url, f"/api/boards/{self.other_board.id}/")
+
+    def test_comment_writes_invalidate(self):
+        self._warm()
+        comment = Comment.objects.create(task=self.task, user=self.user, content="Hallo")
+        self._assert_fresh(self.detail_url)
+
+        self._warm()
+        Comment.objects.get(pk=comment.pk).delete()
+        self._assert_fresh(self.detail_url)
+
+    def test_membership_changes_invalidate(self):
+        self._warm()
+        self.board.members.add(self.member)
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+        self.client.force_authenticate(user=self.member)
+        self._get("/api/boards/")
+        self.member.shared_boards.clear()
+        self._assert_fresh("/api/boards/")
+        self.assertEqual(self._get("/api/boards/").data, [])
+
+    def test_board_and_column_writes_invalidate(self):
+        self._warm()
+        response = self.client.patch(self.detail_url, {"title": "Umbenannt"})
+        self.assertEqual(response.status_code, 200)
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+        self._warm()
+        Column.objects.create(board=self.board, title="Spalte", order=1)
+        self.assertEqual(self._get(self.detail_url)["X-Cache"], "MISS")
+
+        self._warm()
+        self.other_board.delete()
+        self._assert_fresh("/api/boards/")
+
+    def test_user_profile_changes_invalidate(self):
+        self.board.members.add(self.member)
+        self._warm()
+        self.member.first_name = "Maria"
+        self.member.save()
+        self._assert_fresh("/api/boards/", self.detail_url)
+
+    def test_profile_changes_of_assignees_who_are_not_members_invalidate(self):
+        self.task.assignee = self.member
+        self.task.reviewer = self.member
+        self.task.save()
+        self._warm()
+        task_url = f"/api/tasks/{self.task.id}/"
+        etag = self._get(task_url)["ETag"]
+
+        self.member.first_name = "Maria"
+        self.member.save()
+
+        self._assert_fresh(self.detail_url)
+        self.assertEqual(self._get(self.detail_url).data["tasks"][0]["assignee"]["fullname"], "Maria")
+        self.assertEqual(self.client.get(task_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_deleting_a_user_invalidates_their_boards(self):
+        self.board.members.add(self.member)
+        self.task.assignee = self.member
+        self.task.save()
+        self._warm()
+
+        self.member.delete()
+
+        self._assert_fresh("/api/boards/", self.detail_url)
+        board = self._get(self.detail_url).data
+        self.assertEqual(board["members"], [])
+        self.assertIsNone(board["tasks"][0]["assignee"])
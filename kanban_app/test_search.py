@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from kanban_app import search
+from kanban_app.models import Board, Comment, Task
+
+
+class TestSearch(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.shared = Board.objects.create(title="Shared", owner=self.other)
+        self.shared.members.add(self.user)
+        self.foreign = Board.objects.create(title="Foreign", owner=self.other)
+        self.client.force_authenticate(user=self.user)
+
+    def _search(self, query, **params):
+        response = self.client.get("/api/search/", {"q": query, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.data
+
+    def _hits(self, query):
+        return [(hit["type"], hit["id"]) for hit in self._search(query)["results"]]
+
+    def test_finds_titles_descriptions_and_comments_on_accessible_boards(self):
+        title = Task.objects.create(board=self.board, title="Rechnung prüfen")
+        description = Task.objects.create(board=self.shared, title="Buchhaltung", description="Die Rechnung fehlt")
+        comment = Comment.objects.create(task=title, user=self.user, content="Rechnung ist angekommen")
+        hidden = Task.objects.create(board=self.foreign, title="Rechnung")
+        Comment.objects.create(task=hidden, user=self.other, content="Rechnung")
+
+        hits = self._hits("rechnung")
+
+        self.assertEqual(
+            sorted(hits), sorted([("task", title.pk), ("task", description.pk), ("comment", comment.pk)]),
+        )
+
+    def test_title_matches_rank_first(self):
+        in_description = Task.objects.create(board=self.board, title="Umzug", description="Server Server Umzug")
+        in_title = Task.objects.create(board=self.board, title="Server", description="")
+
+        results = self._search("server")["results"]
+
+        self.assertEqual([hit["id"] for hit in results], [in_title.pk, in_description.pk])
+        self.assertGreater(results[0]["rank"], results[1]["rank"])
+
+    def test_all_words_must_match_and_a_star_marks_a_prefix(self):
+        both = Task.objects.create(board=self.board, title="Server Migration")
+        Task.objects.create(board=self.board, title="Server Backup")
+
+        self.assertEqual(self._hits("server migr*"), [("task", both.pk)])
+        self.assertEqual(self._hits("server migr"), [])
+        self.assertEqual(self._hits(str(self.board.pk)), [], "board ids are not searchable text")
+
+    def test_ignores_case_and_diacritics(self):
+        task = Task.objects.create(board=self.board, title="Überprüfung der Straße")
+
+        self.assertEqual(self._hits("UBERPRUFUNG stra*"), [("task", task.pk)])
+        self.assertEqual(self._hits("überprüfung"), [("task", task.pk)])
+
+    def test_snippets_are_escaped_and_highlighted(self):
+        task = Task.objects.create(board=self.board, title="Formular", description="<script>alert(1)</script> Formulare")
+        Comment.objects.create(task=task, user=self.user, content="Das <b>Formular</b> ist fertig")
+        long = " ".join(f"Wort{i}" for i in range(30))
+        Comment.objects.create(task=task, user=self.user, content=f"{long} Formular {long}")
+
+        results = self._search("Formular*")["results"]
+        snippets = [(hit["type"], hit["snippet"]) for hit in results]
+
+        self.assertIn(("task", "&lt;script&gt;alert(1)&lt;/script&gt; <mark>Formulare</mark>"), snippets)
+        self.assertIn(("comment", "Das &lt;b&gt;<mark>Formular</mark>&lt;/b&gt; ist fertig"), snippets)
+        self.assertIn(("comment", "…Wort26 Wort27 Wort28 Wort29 <mark>Formular</mark> Wort0 Wort1 Wort2 Wort3 "
+                                  "Wort4 Wort5 Wort6 Wort7 Wort8 Wort9 Wort10…"), snippets)
+        self.assertEqual({hit["title"] for hit in results}, {"Formular"})
+
+    def test_index_follows_updates_and_deletes(self):
+        task = Task.objects.create(board=self.board, title="Alt")
+        comment = Comment.objects.create(task=task, user=self.user, content="Alt")
+
+        task.title = "Neu"
+        task.save()
+        Comment.objects.filter(pk=comment.pk).update(content="Neu")
+        self.assertEqual(sorted(self._hits("neu")), [("comment", comment.pk), ("task", task.pk)])
+        self.assertEqual(self._hits("alt"), [])
+
+        task.board = self.foreign
+        task.save()
+        self.assertEqual(self._hits("neu"), [], "moving the task re-indexes its comments")
+
+        task.board = self.board
+        task.save()
+        self.assertEqual(len(self._hits("neu")), 2)
+        task.delete()
+        self.assertEqual(self._hits("neu"), [])
+
+    @override_settings(KANBAN_SEARCH_CANDIDATES=3)
+    def test_ranks_only_the_newest_candidates(self):
+        tasks = [Task.objects.create(board=self.board, title=f"Meeting {i}") for i in range(5)]
+
+        data = self._search("meeting")
+
+        self.assertEqual(sorted(hit["id"] for hit in data["results"]), [task.pk for task in tasks[2:]])
+        self.assertTrue(data["truncated"])
+        self.assertFalse(self._search("meeting 4")["truncated"])
+
+    def test_pages(self):
+        for i in range(5):
+            Task.objects.create(board=self.board, title=f"Ticket {i}")
+
+        first = self._search("ticket", page_size=2)
+        second = self.client.get(first["next"]).data
+        last = self.client.get(second["next"]).data
+
+        self.assertIsNone(first["previous"])
+        self.assertEqual([len(page["results"]) for page in (first, second, last)], [2, 2, 1])
+        self.assertIsNone(last["next"])
+        self.assertEqual(len({hit["id"] for page in (first, second, last) for hit in page["results"]}), 5)
+        self.assertEqual(self.client.get(second["previous"]).data["results"], first["results"])
+
+    def test_fixed_number_of_queries(self):
+        for i in range(10):
+            task = Task.objects.create(board=self.board, title=f"Deploy {i}")
+            Comment.objects.create(task=task, user=self.user, content="Deploy läuft")
+
+        # The user's boards, then the ranked page.
+        with self.assertNumQueries(2):
+            self._search("deploy")
+
+    def test_other_databases_fall_back_to_contains(self):
+        title = Task.objects.create(board=self.board, title="Rechnung prüfen")
+        comment = Comment.objects.create(task=title, user=self.user, content="Die Rechnung ist da")
+        Task.objects.create(board=self.foreign, title="Rechnung")
+        Task.objects.create(board=self.board, title="Rechnung", description="bezahlt")
+
+        with mock.patch.object(search, "get_backend", search.ContainsSearch):
+            hits, truncated = search.search(self.user, search.parse_terms("RECHNUNG pr"), limit=10)
+
+        self.assertEqual([(hit["type"], hit["id"]) for hit in hits], [("task", title.pk)])
+        self.assertFalse(truncated)
+        with mock.patch.object(search, "get_backend", search.ContainsSearch):
+            hits, _ = search.search(self.user, search.parse_terms("rechnung"), limit=10)
+        self.assertIn(("comment", comment.pk), [(hit["type"], hit["id"]) for hit in hits])
+
+    def test_rejects_bad_parameters(self):
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(self.client.get("/api/search/", {"q": "  *-\" "}).status_code, 400)
+        self.assertEqual(self.client.get("/api/search/", {"q": "x", "page": "0"}).status_code, 400)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get("/api/search/", {"q": "x"}).status_code, 401)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from kanban_app import search, stats
+from kanban_app.models import ArchivedComment, ArchivedTask, Board, BoardChange, BoardStats, Comment, Task
+
+
+class TestTaskArchive(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.old = [self._task(f"Alt {i}", "done", days_done=100) for i in range(3)]
+        self.recent = self._task("Frisch", "done", days_done=10)
+        self.open = self._task("Offen", "review")
+        for task in self.old[:2]:
+            Comment.objects.create(task=task, user=self.user, content=f"Notiz zu {task.title}")
+        self.client.force_authenticate(user=self.user)
+
+    def _task(self, title, status, days_done=None, priority="medium"):
+        task = Task.objects.create(board=self.board, title=title, status=status, priority=priority)
+        if days_done is not None:
+            Task.objects.filter(pk=task.pk).update(done_at=timezone.now() - timedelta(days=days_done))
+        return task
+
+    def _archive(self, *args):
+        out = StringIO()
+        call_command("archive_done_tasks", "--older-than", "30", *args, stdout=out)
+        return out.getvalue()
+
+    def test_done_at_follows_the_status(self):
+        task = Task.objects.create(board=self.board, title="Task", status="review")
+        self.assertIsNone(task.done_at)
+
+        response = self.client.patch(f"/api/tasks/{task.pk}/", {"status": "done"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        task.refresh_from_db()
+        done_at = task.done_at
+        self.assertIsNotNone(done_at)
+
+        task.title = "Renamed"
+        task.save()
+        task.refresh_from_db()
+        self.assertEqual(task.done_at, done_at)
+
+        response = self.client.patch("/api/tasks/bulk/", [{"id": task.pk, "status": "review"}], format="json")
+        self.assertEqual(response.status_code, 200)
+        task.refresh_from_db()
+        self.assertIsNone(task.done_at)
+
+    def test_moves_old_done_tasks_and_their_comments(self):
+        output = self._archive("--chunk-size", "2")
+
+        self.assertIn("Archived 3 task(s) and 2 comment(s).", output)
+        self.assertEqual(
+            set(Task.objects.values_list("pk", flat=True)), {self.recent.pk, self.open.pk},
+        )
+        self.assertEqual(set(ArchivedTask.objects.values_list("pk", flat=True)), {task.pk for task in self.old})
+        self.assertEqual(Comment.objects.count(), 0)
+        self.assertEqual(
+            set(ArchivedComment.objects.values_list("task_id", flat=True)), {task.pk for task in self.old[:2]},
+        )
+        self.assertEqual(self._archive(), "Archived 0 task(s) and 0 comment(s).\n")
+
+    def test_dry_run_only_counts(self):
+        self.assertIn("3 task(s) would be archived.", self._archive("--dry-run"))
+        self.assertEqual(ArchivedTask.objects.count(), 0)
+
+    def test_keeps_counters_change_log_and_search_consistent(self):
+        self._archive()
+
+        self.assertEqual(stats.rebuild(), [])
+        self.assertEqual(BoardStats.objects.get(board=self.board).task_count, 2)
+        deleted = BoardChange.objects.filter(board=self.board, kind="task", deleted=True)
+        self.assertEqual(set(deleted.values_list("object_id", flat=True)), {task.pk for task in self.old})
+        self.assertEqual(search.search(self.user, search.parse_terms("notiz"), limit=10), ([], False))
+
+    def test_lists_show_live_tasks_unless_asked(self):
+        self._archive()
+
+        response = self.client.get("/api/tasks/")
+        self.assertEqual({task["id"] for task in response.data}, {self.recent.pk, self.open.pk})
+        self.assertNotIn("archived", response.data[0])
+
+        response = self.client.get("/api/tasks/", {"include_archived": "true", "status": "done", "ordering": "id"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(task["id"], task["archived"]) for task in response.data],
+            [(task.pk, True) for task in self.old] + [(self.recent.pk, False)],
+        )
+        self.assertEqual([task["comments_count"] for task in response.data], [1, 1, 0, 0])
+
+        response = self.client.get(f"/api/tasks/{self.old[0].pk}/", {"include_archived": "true"})
+        self.assertEqual(response.data["title"], "Alt 0")
+        self.assertEqual(self.client.get(f"/api/tasks/{self.old[0].pk}/").status_code, 404)
+
+    def test_cursor_pages_span_live_and_archived_tasks(self):
+        self._archive()
+
+        ids, response = [], self.client.get("/api/tasks/", {"include_archived": "1", "page_size": 2})
+        while True:
+            ids.extend(task["id"] for task in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(ids, sorted(task.pk for task in [*self.old, self.recent, self.open]))
+
+    def test_boards_include_archived_tasks_when_asked(self):
+        self._task("Dringend", "done", days_done=100, priority="high")
+        self._archive()
+
+        board = self.client.get(f"/api/boards/{self.board.pk}/").data
+        self.assertEqual(len(board["tasks"]), 2)
+        board = self.client.get(f"/api/boards/{self.board.pk}/", {"include_archived": "true"}).data
+        self.assertEqual(len(board["tasks"]), 6)
+        self.assertEqual(sum(task["archived"] for task in board["tasks"]), 4)
+
+        summary = self.client.get("/api/boards/").data[0]
+        self.assertEqual((summary["ticket_count"], summary["tasks_high_prio_count"]), (2, 0))
+        summary = self.client.get("/api/boards/", {"include_archived": "true"}).data[0]
+        self.assertEqual((summary["ticket_count"], summary["tasks_high_prio_count"]), (6, 1))
+
+    def test_rejects_invalid_flag(self):
+        for url in ["/api/tasks/", "/api/boards/", f"/api/boards/{self.board.pk}/"]:
+            response = self.client.get(url, {"include_archived": "maybe"})
+            self.assertEqual(response.status_code, 400, url)
+            self.assertIn("include_archived", response.data)
@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from kanban_app.models import Board, Comment, Task
+
+
+class TestTaskComments(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.member = User.objects.create_user(username="member", password="pass1234")
+        self.stranger = User.objects.create_user(username="stranger", password="pass1234")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(board=self.board, title="Task")
+        self.comments = [
+            Comment.objects.create(task=self.task, user=self.user if i % 2 else self.member, content=f"Kommentar {i}")
+            for i in range(5)
+        ]
+        self.url = f"/api/tasks/{self.task.id}/comments/"
+        self.client.force_authenticate(user=self.member)
+
+    def _ids(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200, response.content)
+        return [comment["id"] for comment in response.data]
+
+    def test_orders(self):
+        ids = [comment.id for comment in self.comments]
+
+        self.assertEqual(self._ids(), ids)
+        self.assertEqual(self._ids({"order": "oldest"}), ids)
+        self.assertEqual(self._ids({"order": "newest"}), ids[::-1])
+
+    def test_after_returns_only_newer_comments(self):
+        ids = [comment.id for comment in self.comments]
+
+        self.assertEqual(self._ids({"after": ids[2]}), ids[3:])
+        self.assertEqual(self._ids({"after": ids[-1]}), [])
+        self.assertEqual(self._ids({"after": ids[1], "order": "newest"}), ids[:1:-1])
+
+    def test_newest_first_cursor_pages(self):
+        ids = []
+        response = self.client.get(self.url, {"order": "newest", "page_size": 2})
+        while True:
+            ids.extend(comment["id"] for comment in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(ids, [comment.id for comment in reversed(self.comments)])
+
+    def test_lookup_and_access_check_share_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+        # Task with access, then the comments with their authors.
+        self.assertEqual(len(queries), 2)
+        self.assertIn("EXISTS", queries[0]["sql"])
+        self.assertIn("auth_user", queries[1]["sql"])
+
+    def test_rejects_strangers_and_missing_tasks(self):
+        self.client.force_authenticate(user=self.stranger)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        self.assertEqual(self.client.post(self.url, {"content": "Hallo"}).status_code, 403)
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get("/api/tasks/999999/comments/").status_code, 404)
+
+    def test_rejects_invalid_parameters(self):
+        for params, field in [({"order": "random"}, "order"), ({"after": "x"}, "after"), ({"after": "-1"}, "after")]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn(field, response.data)
@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from kanban_app.models import Board, Task
+
+
+class TestTaskFilters(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.today = timezone.localdate()
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.other)
+        self.second = Board.objects.create(title="Second", owner=self.user)
+        foreign = Board.objects.create(title="Foreign", owner=self.other)
+        self.tasks = {
+            "a": self._task(self.board, "Alpha", "review", "high", self.user, -3),
+            "b": self._task(self.board, "Bravo", "done", "high", self.other, -1),
+            "c": self._task(self.board, "Charlie", "to-do", "low", None, None),
+            "d": self._task(self.second, "Delta", "in-progress", "medium", self.user, 5),
+            "e": self._task(self.second, "Echo", "review", "low", self.other, 10),
+        }
+        self._task(foreign, "Hidden", "review", "high", self.other, -3)
+        self.client.force_authenticate(user=self.user)
+
+    def _task(self, board, title, status, priority, assignee, due):
+        return Task.objects.create(
+            board=board, title=title, status=status, priority=priority, assignee=assignee,
+            due_date=None if due is None else self.today + timedelta(days=due),
+        )
+
+    def _titles(self, **params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.data["results"] if isinstance(response.data, dict) else response.data
+        return [task["title"] for task in data]
+
+    def test_filters(self):
+        def titles(**params):
+            return sorted(self._titles(**params))
+
+        self.assertEqual(titles(board=self.second.pk), ["Delta", "Echo"])
+        self.assertEqual(titles(status="review,done"), ["Alpha", "Bravo", "Echo"])
+        self.assertEqual(titles(priority="high", board=self.board.pk), ["Alpha", "Bravo"])
+        self.assertEqual(titles(assignee="me"), ["Alpha", "Delta"])
+        self.assertEqual(titles(assignee=self.other.pk), ["Bravo", "Echo"])
+        self.assertEqual(titles(assignee="none"), ["Charlie"])
+        self.assertEqual(titles(due_before=str(self.today)), ["Alpha", "Bravo"])
+        self.assertEqual(titles(due_after=str(self.today), due_before=str(self.today + timedelta(days=6))), ["Delta"])
+        self.assertEqual(titles(overdue="true"), ["Alpha"])
+
+    def test_filters_apply_to_the_personal_lists(self):
+        response = self.client.get("/api/tasks/assigned-to-me/", {"status": "review"})
+
+        self.assertEqual([task["title"] for task in response.data], ["Alpha"])
+
+    def test_ordering(self):
+        self.assertEqual(self._titles(ordering="-priority,title"), ["Alpha", "Bravo", "Delta", "Charlie", "Echo"])
+        self.assertEqual(self._titles(ordering="status"), ["Charlie", "Delta", "Alpha", "Echo", "Bravo"])
+        self.assertEqual(self._titles(ordering="due_date"), ["Alpha", "Bravo", "Delta", "Echo", "Charlie"])
+        self.assertEqual(self._titles(ordering="-due_date"), ["Echo", "Delta", "Bravo", "Alpha", "Charlie"])
+        self.assertEqual(self._titles(ordering="-id"), ["Echo", "Delta", "Charlie", "Bravo", "Alpha"])
+
+    def test_cursor_pages_follow_the_ordering(self):
+        titles = []
+        response = self.client.get("/api/tasks/", {"ordering": "-due_date", "page_size": 2})
+        while True:
+            titles.extend(task["title"] for task in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(titles, ["Echo", "Delta", "Bravo", "Alpha", "Charlie"])
+
+    def test_facets_count_the_filtered_tasks_in_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tasks/", {"board": self.board.pk, "facets": "status,priority,assignee"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(response.data["facets"], {
+            "status": [{"value": "done", "count": 1}, {"value": "review", "count": 1}, {"value": "to-do", "count": 1}],
+            "priority": [{"value": "high", "count": 2}, {"value": "low", "count": 1}],
+            "assignee": [
+                {"value": self.user.pk, "count": 1}, {"value": self.other.pk, "count": 1}, {"value": None, "count": 1},
+            ],
+        })
+        # ETag validator, the tasks, then all facets in one UNION ALL.
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(queries[2]["sql"].count("UNION ALL"), 2)
+
+    def test_facets_next_to_a_page(self):
+        response = self.client.get("/api/tasks/", {"facets": "priority", "page_size": 2})
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(response.data["facets"], {"priority": [
+            {"value": "high", "count": 2}, {"value": "low", "count": 2}, {"value": "medium", "count": 1},
+        ]})
+
+    def test_rejects_invalid_parameters(self):
+        for params, field in [
+            ({"status": "review,later"}, "status"),
+            ({"priority": "urgent"}, "priority"),
+            ({"assignee": "someone"}, "assignee"),
+            ({"due_before": "tomorrow"}, "due_before"),
+            ({"due_after": "2025-02-01", "due_before": "2025-01-01"}, "due_after"),
+            ({"ordering": "comments_count"}, "ordering"),
+            ({"facets": "board"}, "facets"),
+            ({"board": "x"}, "board"),
+        ]:
+            response = self.client.get("/api/tasks/", params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn(field, response.data)